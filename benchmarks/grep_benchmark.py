@@ -0,0 +1,101 @@
+import argparse
+import random
+import re
+import time
+
+from src.utils.matchers import AbstractMatcher, LiteralMatcher, MultiLiteralMatcher, RegexMatcher
+from src.utils.search_utils import SearchUtils
+
+WORDS = ["request", "served", "cache", "miss", "user", "session", "opened", "closed", "timeout", "retry"]
+NEEDLES = ["segfault", "out of memory", "deadlock", "panic"]
+
+
+def generate_text(size: int, match_ratio: float) -> str:
+    """
+    Generate log-like text with a given share of lines containing a needle.
+    :param size: Approximate text size in characters.
+    :type size: int
+    :param match_ratio: Share of lines containing a needle.
+    :type match_ratio: float
+    :return: Generated text.
+    :rtype: str
+    """
+    generator = random.Random(0)
+    lines = []
+    length = 0
+    while length < size:
+        line = " ".join(generator.choices(WORDS, k=12))
+        if generator.random() < match_ratio:
+            line += " " + generator.choice(NEEDLES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def measure(matcher: AbstractMatcher, text: str, repeat: int) -> tuple[float, int]:
+    """
+    Measure the best wall time of searching the text.
+    :param matcher: Matcher to measure.
+    :type matcher: AbstractMatcher
+    :param text: Text to search.
+    :type text: str
+    :param repeat: Number of runs.
+    :type repeat: int
+    :return: Best run time in seconds and number of matching lines.
+    :rtype: tuple[float, int]
+    """
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in SearchUtils.find_lines(matcher, text))
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def compare(title: str, regex_matcher: AbstractMatcher, literal_matcher: AbstractMatcher, text: str, repeat: int):
+    """
+    Print the timings of the regex and the literal path for the same patterns.
+    :param title: Name of the case.
+    :type title: str
+    :param regex_matcher: Matcher going through the regular expression engine.
+    :type regex_matcher: AbstractMatcher
+    :param literal_matcher: Matcher using the literal fast path.
+    :type literal_matcher: AbstractMatcher
+    :param text: Text to search.
+    :type text: str
+    :param repeat: Number of runs.
+    :type repeat: int
+    :return: None
+    :rtype: None
+    """
+    regex_time, regex_count = measure(regex_matcher, text, repeat)
+    literal_time, literal_count = measure(literal_matcher, text, repeat)
+    assert regex_count == literal_count
+    print(f"{title}: regex {regex_time:.3f} s, literal {literal_time:.3f} s, "
+          f"speedup {regex_time / literal_time:.2f}x, lines {literal_count}")
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Compare grep regex and literal matchers")
+    argument_parser.add_argument("--size", type=int, default=100 * 1024 * 1024)
+    argument_parser.add_argument("--match-ratio", type=float, default=0.001)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    arguments = argument_parser.parse_args()
+
+    text = generate_text(arguments.size, arguments.match_ratio)
+    print(f"text: {len(text)} characters")
+
+    single = NEEDLES[0]
+    compare("single literal",
+            RegexMatcher(re.compile(re.escape(single), re.MULTILINE)),
+            LiteralMatcher(single),
+            text, arguments.repeat)
+    compare("several literals",
+            RegexMatcher(re.compile("|".join(re.escape(needle) for needle in NEEDLES), re.MULTILINE)),
+            MultiLiteralMatcher(NEEDLES),
+            text, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
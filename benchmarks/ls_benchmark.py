@@ -0,0 +1,92 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.commands.abstract_commands import AbstractCommand
+from src.commands.command_ls import CommandLS
+from src.common.ownership_cache import OwnershipCache
+from src.utils.path_utils import PathUtils
+
+
+def legacy_long_listing(directory: Path) -> str:
+    """
+    Build the long listing the way ls did before the scandir engine.
+    :param directory: Directory to list.
+    :type directory: Path
+    :return: Long listing output.
+    :rtype: str
+    """
+    paths = PathUtils.get_directory_content(directory)
+    align_link = AbstractCommand._get_max_length(paths, PathUtils.get_count_links)
+    align_owner = AbstractCommand._get_max_length(paths, PathUtils.get_owner)
+    align_group = AbstractCommand._get_max_length(paths, PathUtils.get_group)
+    align_bytes = AbstractCommand._get_max_length(paths, PathUtils.get_bytes_size)
+    result = []
+    for path in paths:
+        result.append(
+            f"{PathUtils.get_filemode(path)} "
+            f"{PathUtils.get_count_links(path):>{align_link}} "
+            f"{PathUtils.get_owner(path):>{align_owner}} "
+            f"{PathUtils.get_group(path):<{align_group}} "
+            f"{PathUtils.get_bytes_size(path):>{align_bytes}} "
+            f"{PathUtils.get_last_change_time(path).strftime('%Y-%m-%d %H:%M:%S')} "
+            f"{PathUtils.get_path_name(path)} \n"
+        )
+    return "".join(result)
+
+
+def scandir_long_listing(directory: Path) -> str:
+    """
+    Build the long listing with the stat-once scandir engine.
+    :param directory: Directory to list.
+    :type directory: Path
+    :return: Long listing output.
+    :rtype: str
+    """
+    records = PathUtils.scan_directory(directory, True)
+    return CommandLS._get_ls_output_with_l_option(records, OwnershipCache())
+
+
+def measure(function, directory: Path, repeat: int) -> float:
+    """
+    Measure the best wall time of several runs.
+    :param function: Listing function to measure.
+    :type function: Callable[[Path], str]
+    :param directory: Directory to list.
+    :type directory: Path
+    :param repeat: Number of runs.
+    :type repeat: int
+    :return: Best run time in seconds.
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(directory)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Compare ls -l engines")
+    argument_parser.add_argument("--entries", type=int, default=50000)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory_as_str:
+        directory = Path(directory_as_str)
+        for number in range(arguments.entries):
+            (directory / f"file_{number}").write_bytes(b"x" * (number % 1024))
+
+        legacy = measure(legacy_long_listing, directory, arguments.repeat)
+        scandir = measure(scandir_long_listing, directory, arguments.repeat)
+
+    print(f"entries: {arguments.entries}")
+    print(f"legacy:  {legacy:.3f} s")
+    print(f"scandir: {scandir:.3f} s")
+    print(f"speedup: {legacy / scandir:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
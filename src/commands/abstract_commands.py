@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from src.common.context import Context
 from src.common.input_arguments import InputArguments
@@ -9,10 +9,12 @@ from src.common.option import Option
 from src.common.parsed_arguments import ParsedArguments
 from src.common.parser import Parser
 from src.exception.command_exception import (
+    InvalidArgumentsException,
     NotEnoughOptionException,
 )
 from src.exception.shell_exception import ShellException
 from src.utils.path_utils import PathUtils
+from src.utils.rate_limiter import RateLimiter
 
 
 class AbstractCommand(ABC):
@@ -21,6 +23,8 @@ class AbstractCommand(ABC):
     parsed_arguments: ParsedArguments
     logger: Logger
 
+    SIZE_SUFFIXES = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
     def __init__(self, options: set[Option], parser: Parser, logger: Logger):
         """
         Initialize the command with available options, parser, and logger.
@@ -131,6 +135,81 @@ class AbstractCommand(ABC):
             return self.parsed_arguments.options_with_argument[long_name]
         raise NotEnoughOptionException(short_name)
 
+    def _get_all_options_arguments(self, short_name: str, long_name: str) -> list[str]:
+        """
+        Retrieve every argument of a repeatable option in input order.
+        :param short_name: Short option name.
+        :type short_name: str
+        :param long_name: Long option name.
+        :type long_name: str
+        :return: Arguments associated with the option, empty when it is absent.
+        :rtype: list[str]
+        """
+        return [argument for option, argument in self.parsed_arguments.options_arguments_sequence
+                if option in (short_name, long_name)]
+
+    def _get_int_options_arguments(self, short_name: str, long_name: str) -> int:
+        """
+        Retrieve the argument associated with an option as a non-negative integer.
+        :param short_name: Short option name.
+        :type short_name: str
+        :param long_name: Long option name.
+        :type long_name: str
+        :return: Integer argument associated with the option.
+        :rtype: int
+        """
+        argument = self._get_options_arguments(short_name, long_name)
+        if not argument.isdigit():
+            raise InvalidArgumentsException([short_name, argument])
+        return int(argument)
+
+    def _get_size_options_arguments(self, short_name: str, long_name: str) -> int:
+        """
+        Retrieve the argument associated with an option as a positive number of bytes.
+        The number may end with one of the K, M and G binary suffixes.
+        :param short_name: Short option name.
+        :type short_name: str
+        :param long_name: Long option name.
+        :type long_name: str
+        :return: Number of bytes associated with the option.
+        :rtype: int
+        """
+        argument = self._get_options_arguments(short_name, long_name)
+        number, multiplier = argument, 1
+        if argument[-1:].upper() in AbstractCommand.SIZE_SUFFIXES:
+            number, multiplier = argument[:-1], AbstractCommand.SIZE_SUFFIXES[argument[-1].upper()]
+        if not number.isdigit() or int(number) == 0:
+            raise InvalidArgumentsException([short_name, argument])
+        return int(number) * multiplier
+
+    def _get_chunk_size(self, short_name: str, long_name: str) -> Optional[int]:
+        """
+        Determine the number of bytes moved by one copy call from an option.
+        :param short_name: Short option name.
+        :type short_name: str
+        :param long_name: Long option name.
+        :type long_name: str
+        :return: Requested chunk size or None for the default.
+        :rtype: Optional[int]
+        """
+        if not AbstractCommand.is_in_parsed_arguments(short_name, long_name, self.parsed_arguments):
+            return None
+        return self._get_size_options_arguments(short_name, long_name)
+
+    def _get_rate_limiter(self, short_name: str, long_name: str) -> Optional[RateLimiter]:
+        """
+        Build the limiter of the transfer rate requested in bytes per second by an option.
+        :param short_name: Short option name.
+        :type short_name: str
+        :param long_name: Long option name.
+        :type long_name: str
+        :return: Rate limiter or None when the option is absent.
+        :rtype: Optional[RateLimiter]
+        """
+        if not AbstractCommand.is_in_parsed_arguments(short_name, long_name, self.parsed_arguments):
+            return None
+        return RateLimiter(self._get_size_options_arguments(short_name, long_name))
+
     def _remove_if(self, paths: list[str], path_utils_func: Callable[[Path], Any]) -> int:
         """
         Remove paths that trigger an exception during validation.
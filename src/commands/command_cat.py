@@ -6,16 +6,16 @@ from src.common.input_arguments import InputArguments
 from src.common.logger import Logger
 from src.common.option import Option
 from src.common.parser import Parser
-from src.exception.command_exception import NotEnoughArgumentsException
+from src.exception.command_exception import NotAccessToReadException, NotEnoughArgumentsException
+from src.utils.archive_utils import ArchiveUtils
 from src.utils.path_utils import PathUtils
 
 
 class CommandCat(AbstractCommand):
     OPTIONS: set[Option] = {
-        Option("Показать список всех опций", "-h", "--help", False, True)
+        Option("Показать список всех опций", "-h", "--help", False, True),
+        Option("Выводить содержимое сжатых файлов и архивов tar/zip", "-z", "--decompress", False, True)
     }
-    ENCODING_MODE: str = "utf-8"
-    ERRORS_MODE: str = "ignore"
 
     def __init__(self, parser: Parser, logger: Logger):
         """
@@ -53,5 +53,28 @@ class CommandCat(AbstractCommand):
             case _:
                 for path_as_str in self.parsed_arguments.position_arguments:
                     path = Path(path_as_str)
-                    file_text = path.read_text(encoding=CommandCat.ENCODING_MODE, errors=CommandCat.ERRORS_MODE)
-                    self.logger.print(file_text)
+                    if AbstractCommand.is_in_parsed_arguments("-z", "--decompress", self.parsed_arguments) \
+                            and ArchiveUtils.is_archive(path):
+                        self._output_archive(path)
+                        continue
+                    with path.open("rb") as stream:
+                        self.logger.write_stream(stream)
+                    self.logger.print("")
+
+    def _output_archive(self, path: Path):
+        """
+        Output the decompressed content of a file or of every archive member in place.
+        Members of tar and zip archives are preceded by their 'archive!member' name.
+        :param path: Archive path.
+        :type path: Path
+        :return: None
+        :rtype: None
+        """
+        try:
+            for name, stream in ArchiveUtils.iterate_members(path):
+                if ArchiveUtils.is_bundle(path):
+                    self.logger.print(f"{name}:")
+                self.logger.write_stream(stream)
+                self.logger.print("")
+        except ArchiveUtils.READ_ERRORS:
+            raise NotAccessToReadException(str(path))
@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+from typing import Optional
 
 from src.commands.abstract_commands import AbstractCommand
 from src.common.context import Context
@@ -13,13 +15,29 @@ from src.exception.command_exception import (
     NotTypeFileException,
 )
 from src.utils.path_utils import PathUtils
+from src.utils.rate_limiter import RateLimiter
+from src.utils.tree_copier import CopyStatistics
 
 
 class CommandCP(AbstractCommand):
     OPTIONS = {
         Option("Показать список всех опций", "-h", "--help", False, True),
-        Option("Рекурсивное копирование каталога вместе с содержимым", "-r", "--recursive", False, True)
+        Option("Рекурсивное копирование каталога вместе с содержимым", "-r", "--recursive", False, True),
+        Option("Количество потоков для рекурсивного копирования", "-j", "--jobs", True, False),
+        Option("Размер блока копирования в байтах (допустимы суффиксы K, M, G)", "-k", "--chunk-size", True, False),
+        Option("Пропускать файлы, совпадающие с копией по размеру и времени изменения", "-u", "--update", False, True),
+        Option("Сравнивать файлы при --update по хешу содержимого вместо времени (только вместе с -u)",
+               "-c", "--checksum", False, True),
+        Option("Создавать жесткие ссылки вместо копирования файлов", "-l", "--link", False, True),
+        Option("Возобновляемое копирование с контрольной точкой рядом с копией", "-P", "--resume", False, True),
+        Option("Хешировать блоки контрольной точки --resume и проверять их перед продолжением",
+               "-V", "--verify", False, True),
+        Option("Ограничение скорости записи в байтах в секунду (допустимы суффиксы K, M, G)",
+               "-b", "--bwlimit", True, False)
     }
+    statistics: CopyStatistics
+    chunk_size: Optional[int]
+    limiter: Optional[RateLimiter]
 
     def __init__(self, parser: Parser, logger: Logger):
         """
@@ -32,6 +50,9 @@ class CommandCP(AbstractCommand):
         :rtype: None
         """
         super().__init__(CommandCP.OPTIONS, parser, logger)
+        self.statistics = CopyStatistics()
+        self.chunk_size = None
+        self.limiter = None
 
     def execute(self, arguments: InputArguments, context: Context):
         """
@@ -46,6 +67,9 @@ class CommandCP(AbstractCommand):
         self.parsed_arguments = self.parser.parse(CommandCP.OPTIONS, arguments)
         if self.output_help_if_need():
             return
+        self.statistics = CopyStatistics()
+        self.chunk_size = self._get_chunk_size("-k", "--chunk-size")
+        self.limiter = self._get_rate_limiter("-b", "--bwlimit")
 
         correct_paths = self.parsed_arguments.position_arguments[:-1]
         self._remove_if(correct_paths, PathUtils.check_presence)
@@ -70,6 +94,8 @@ class CommandCP(AbstractCommand):
                     path_src = PathUtils.get_resolved_path(Path(path))
                     self._copy_src_to_dest(path_src, dest, context)
 
+        if self._is_update():
+            self._output_statistics()
 
     def _is_recursive_enable(self, parsed_arguments: ParsedArguments) -> bool:
         """
@@ -93,18 +119,105 @@ class CommandCP(AbstractCommand):
         :return: None
         :rtype: None
         """
+        is_update, is_checksum, is_link = self._is_update(), self._is_checksum(), self._is_link()
+        is_resume, is_verify = self._is_resume(), self._is_verify()
         if PathUtils.is_file(src):
-            if PathUtils.is_directory(dest):
-                PathUtils.copy_file(src, dest)
+            if PathUtils.is_directory(dest) or (PathUtils.is_file(dest) and (is_update or is_resume)):
+                statistics = PathUtils.copy_file(src, dest, self.chunk_size, is_update, is_checksum, is_link,
+                                                 is_resume, is_verify, self.limiter)
+                self.statistics.merge(statistics)
             elif not PathUtils.is_path_exists(dest):
                 if str(dest).find("/") != -1:
                     raise NotTypeFileException(str(dest))
-                PathUtils.copy_file(src, context.current_directory / dest)
+                statistics = PathUtils.copy_file(src, context.current_directory / dest, self.chunk_size,
+                                                 is_update, is_checksum, is_link, is_resume, is_verify,
+                                                 self.limiter)
+                self.statistics.merge(statistics)
         elif self._is_recursive_enable(self.parsed_arguments):
-            PathUtils.copytree(src, dest)
+            statistics = PathUtils.copytree(src, dest, self._get_jobs(), self._log_copy_error, self.chunk_size,
+                                            is_update, is_checksum, is_link, is_resume, is_verify,
+                                            self.limiter)
+            self.statistics.merge(statistics)
         else:
             raise NotEnoughOptionException("-r")
 
+    def _get_jobs(self) -> int:
+        """
+        Determine the number of threads copying files of a tree.
+        :return: Requested number of jobs or the number of cores.
+        :rtype: int
+        """
+        if AbstractCommand.is_in_parsed_arguments("-j", "--jobs", self.parsed_arguments):
+            return max(1, self._get_int_options_arguments("-j", "--jobs"))
+        return os.cpu_count() or 1
+
+    def _is_checksum(self) -> bool:
+        """
+        Determine whether up to date files are recognized by their content.
+        :return: Flag indicating if the checksum option is present.
+        :rtype: bool
+        """
+        return self.is_in_parsed_arguments("-c", "--checksum", self.parsed_arguments)
+
+    def _is_update(self) -> bool:
+        """
+        Determine whether up to date destination files are skipped.
+        :return: Flag indicating if the update option is present.
+        :rtype: bool
+        """
+        return self.is_in_parsed_arguments("-u", "--update", self.parsed_arguments)
+
+    def _is_link(self) -> bool:
+        """
+        Determine whether files are hardlinked instead of copied.
+        :return: Flag indicating if the link option is present.
+        :rtype: bool
+        """
+        return self.is_in_parsed_arguments("-l", "--link", self.parsed_arguments)
+
+    def _is_resume(self) -> bool:
+        """
+        Determine whether files are copied resumably.
+        :return: Flag indicating if the resume option is present.
+        :rtype: bool
+        """
+        return self.is_in_parsed_arguments("-P", "--resume", self.parsed_arguments)
+
+    def _is_verify(self) -> bool:
+        """
+        Determine whether the chunks of a resumable copy are hashed and verified before a resume.
+        :return: Flag indicating if the verify option is present.
+        :rtype: bool
+        """
+        return self.is_in_parsed_arguments("-V", "--verify", self.parsed_arguments)
+
+    def _output_statistics(self) -> None:
+        """
+        Print how many files and bytes were copied and how many were already up to date.
+        :return: None
+        :rtype: None
+        """
+        self.logger.print(f"Copied {self.statistics.copied_files} files ({self.statistics.copied_bytes} bytes), "
+                          f"skipped {self.statistics.skipped_files} files ({self.statistics.skipped_bytes} bytes)")
+        if self.statistics.linked_files:
+            self.logger.print(f"Linked {self.statistics.linked_files} hardlinked files")
+        if self.statistics.failed:
+            self.logger.print(f"Failed {self.statistics.failed} entries")
+
+    def _log_copy_error(self, path: Path, error: OSError) -> None:
+        """
+        Report an entry of a tree that could not be copied and let the copy go on.
+        :param path: Entry that failed.
+        :type path: Path
+        :param error: Raised error.
+        :type error: OSError
+        :return: None
+        :rtype: None
+        """
+        message = f"Cannot copy {path}: {error.strerror or error}"
+        self.logger.print(message)
+        self.logger.error(message)
+
     def _check_dest(self, dest: str) -> None:
         """
         Validate the destination path for copy operations.
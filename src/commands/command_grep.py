@@ -1,5 +1,11 @@
-import re
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from io import BufferedReader
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from src.commands.abstract_commands import AbstractCommand
 from src.common.context import Context
@@ -8,9 +14,17 @@ from src.common.logger import Logger
 from src.common.option import Option
 from src.common.parser import Parser
 from src.exception.command_exception import (
-    NotEnoughArgumentsException, InvalidArgumentsException,
+    InvalidArgumentsException,
+    NotAccessToReadException,
+    NotEnoughArgumentsException,
+    NotEnoughOptionException,
 )
+from src.utils.archive_utils import ArchiveUtils
+from src.utils.file_walker import FileWalker
+from src.utils.matchers import AbstractMatcher
 from src.utils.path_utils import PathUtils
+from src.utils.search_utils import SearchUtils
+from src.utils.trigram_index import TrigramIndex
 
 
 class CommandGrep(AbstractCommand):
@@ -18,10 +32,26 @@ class CommandGrep(AbstractCommand):
         Option("Показать список всех опций", "-h", "--help", False, True),
         Option("Рекурсивный поиск вхождения в каталогах", "-r", "--recursive", False, True),
         Option("Поиск без учёта регистра", "-i", "--ignore-case", False, True),
-        Option("Указывается паттерн поиска", "-p", "--pattern", True, False)
+        Option("Указывается паттерн поиска", "-p", "--pattern", True, True),
+        Option("Указывается дополнительный паттерн поиска", "-e", "--regexp", True, True),
+        Option("Количество процессов для рекурсивного поиска", "-j", "--jobs", True, False),
+        Option("Вывести только имена файлов с совпадениями", "-l", "--files-with-matches", False, True),
+        Option("Вывести только количество совпавших строк в каждом файле", "-c", "--count", False, True),
+        Option("Остановить чтение файла после N совпавших строк", "-m", "--max-count", True, False),
+        Option("Ничего не выводить, остановиться на первом совпадении", "-q", "--quiet", False, True),
+        Option("Искать только в файлах, имя которых подходит под шаблон", "-g", "--include", True, True),
+        Option("Не искать в файлах, имя которых подходит под шаблон", "-X", "--exclude", True, True),
+        Option("Не заходить в каталоги, имя которых подходит под шаблон", "-d", "--exclude-dir", True, True),
+        Option("Пропускать файлы и каталоги из .gitignore", "-G", "--gitignore", False, True),
+        Option("Построить (build) или обновить (update) триграммный индекс каталогов", "-I", "--index", True, False),
+        Option("Вывести N строк после каждого совпадения", "-A", "--after-context", True, False),
+        Option("Вывести N строк перед каждым совпадением", "-B", "--before-context", True, False),
+        Option("Вывести N строк до и после каждого совпадения", "-C", "--context", True, False),
+        Option("Искать внутри сжатых файлов и архивов tar/zip", "-z", "--decompress", False, True)
     }
-    ENCODING_MODE: str = "utf-8"
-    ERRORS_MODE: str = "ignore"
+    INDEX_ACTIONS = ("build", "update")
+    MAX_PENDING_PER_JOB: int = 4
+    GROUP_SEPARATOR = "--"
 
     def __init__(self, parser: Parser, logger: Logger):
         """
@@ -49,7 +79,13 @@ class CommandGrep(AbstractCommand):
         if self.output_help_if_need():
             return
 
-        self._check_pattern_exists()
+        if AbstractCommand.is_in_parsed_arguments("-I", "--index", self.parsed_arguments):
+            self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_presence)
+            self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_readable)
+            self._update_indexes()
+            return
+
+        matcher = self._compile_matcher()
         self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_presence)
         self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_readable)
         self._remove_if_not_exists_recursive_option()
@@ -60,25 +96,192 @@ class CommandGrep(AbstractCommand):
             case 0:
                 raise NotEnoughArgumentsException()
             case _:
-                for path_as_str in self.parsed_arguments.position_arguments:
-                    path = PathUtils.get_resolved_path(Path(path_as_str))
-                    if PathUtils.is_file(path):
-                        self._find(path)
-                    elif PathUtils.is_directory(path):
-                        for file in PathUtils.get_all_files_in_path(path):
-                            self._find(file)
+                jobs = self._get_jobs()
+                if jobs > 1 and self._has_directory_arguments():
+                    self._find_in_pool(self._iterate_files(), matcher, jobs)
+                else:
+                    for file in self._iterate_files():
+                        if self._find(file, matcher) and self._is_quiet():
+                            return
+
+    def _is_quiet(self) -> bool:
+        """
+        Determine whether the search only has to find out if anything matches.
+        :return: Flag indicating if the quiet option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-q", "--quiet", self.parsed_arguments)
+
+    def _is_files_with_matches(self) -> bool:
+        """
+        Determine whether only names of matching files are printed.
+        :return: Flag indicating if the files-with-matches option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-l", "--files-with-matches", self.parsed_arguments)
+
+    def _is_count(self) -> bool:
+        """
+        Determine whether only numbers of matching lines are printed.
+        :return: Flag indicating if the count option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-c", "--count", self.parsed_arguments)
 
-    def _check_pattern_exists(self):
+    def _is_lines_output(self) -> bool:
+        """
+        Determine whether matching lines themselves are printed.
+        :return: Flag indicating if no summarizing mode is selected.
+        :rtype: bool
+        """
+        return not (self._is_quiet() or self._is_files_with_matches() or self._is_count())
+
+    def _get_max_count(self) -> Optional[int]:
+        """
+        Determine after how many matching lines a file does not need to be read further.
+        :return: Limit of matching lines per file, None when the whole file is needed.
+        :rtype: Optional[int]
+        """
+        limits = []
+        if AbstractCommand.is_in_parsed_arguments("-m", "--max-count", self.parsed_arguments):
+            limits.append(self._get_int_options_arguments("-m", "--max-count"))
+        if self._is_quiet() or self._is_files_with_matches():
+            limits.append(1)
+        return min(limits) if limits else None
+
+    def _is_decompress(self) -> bool:
+        """
+        Determine whether compressed files and archives are searched inside.
+        :return: Flag indicating if the decompress option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-z", "--decompress", self.parsed_arguments)
+
+    def _get_context(self) -> tuple[int, int]:
+        """
+        Determine the number of lines printed around every match.
+        The before and after options take precedence over the common context option.
+        :return: Numbers of lines before and after a match.
+        :rtype: tuple[int, int]
         """
-        Validate that the supplied pattern is a valid regular expression.
+        context = 0
+        if AbstractCommand.is_in_parsed_arguments("-C", "--context", self.parsed_arguments):
+            context = self._get_int_options_arguments("-C", "--context")
+        before = after = context
+        if AbstractCommand.is_in_parsed_arguments("-B", "--before-context", self.parsed_arguments):
+            before = self._get_int_options_arguments("-B", "--before-context")
+        if AbstractCommand.is_in_parsed_arguments("-A", "--after-context", self.parsed_arguments):
+            after = self._get_int_options_arguments("-A", "--after-context")
+        return before, after
+
+    def _get_jobs(self) -> int:
+        """
+        Determine the number of worker processes for the search.
+        :return: Requested number of jobs or the number of cores.
+        :rtype: int
+        """
+        if AbstractCommand.is_in_parsed_arguments("-j", "--jobs", self.parsed_arguments):
+            return max(1, self._get_int_options_arguments("-j", "--jobs"))
+        return os.cpu_count() or 1
+
+    def _has_directory_arguments(self) -> bool:
+        """
+        Determine whether any positional argument is a directory to walk.
+        :return: Flag indicating if a directory is searched.
+        :rtype: bool
+        """
+        return any(PathUtils.is_directory(PathUtils.get_resolved_path(Path(path_as_str)))
+                   for path_as_str in self.parsed_arguments.position_arguments)
+
+    def _iterate_files(self) -> Iterator[Path]:
+        """
+        Lazily yield every file to search in argument order.
+        Directories are walked with the include and exclude rules applied on the way,
+        files ruled out by the trigram index of a directory are skipped. The index
+        holds the trigrams of the stored bytes, so with decompression it does not
+        rule out compressed files and archives.
+        :return: Iterator over files.
+        :rtype: Iterator[Path]
+        """
+        walker = self._create_file_walker()
+        queries = TrigramIndex.compile_queries(self._get_patterns(), self._is_ignore_case())
+        is_decompress = self._is_decompress()
+        for path_as_str in self.parsed_arguments.position_arguments:
+            path = PathUtils.get_resolved_path(Path(path_as_str))
+            if PathUtils.is_file(path):
+                yield path
+            elif PathUtils.is_directory(path):
+                index = TrigramIndex.load(path) if queries is not None else None
+                if index is None:
+                    yield from walker.walk(path)
+                else:
+                    yield from (file for file in walker.walk(path)
+                                if (is_decompress and ArchiveUtils.is_archive(file))
+                                or index.is_candidate(file, queries))
+
+    def _update_indexes(self):
+        """
+        Build or incrementally update the trigram index of every directory argument.
         :return: None
         :rtype: None
         """
-        pattern = self._get_options_arguments("-p", "--pattern")
-        try:
-            re.compile(pattern)
-        except re.error:
-            raise InvalidArgumentsException(list(pattern))
+        action = self._get_options_arguments("-I", "--index")
+        if action not in CommandGrep.INDEX_ACTIONS:
+            raise InvalidArgumentsException(["--index", action])
+
+        walker = self._create_file_walker()
+        for path_as_str in self.parsed_arguments.position_arguments:
+            path = PathUtils.get_resolved_path(Path(path_as_str))
+            if not PathUtils.is_directory(path):
+                message = f"Not a directory: {path_as_str}"
+                self.logger.print(message)
+                self.logger.error(message)
+                continue
+            index = TrigramIndex.load(path) if action == "update" else None
+            if index is None:
+                index = TrigramIndex(path)
+            updated, removed = index.update(walker.walk(path))
+            index.save()
+            self.logger.print(f"index: {path} ({len(index.entries)} files, {updated} read, {removed} removed)")
+
+    def _create_file_walker(self) -> FileWalker:
+        """
+        Create the walker of searched directories from the filtering options.
+        :return: File walker applying the include, exclude and .gitignore rules.
+        :rtype: FileWalker
+        """
+        return FileWalker(self._get_all_options_arguments("-g", "--include"),
+                          self._get_all_options_arguments("-X", "--exclude") + [TrigramIndex.FILE_NAME],
+                          self._get_all_options_arguments("-d", "--exclude-dir"),
+                          AbstractCommand.is_in_parsed_arguments("-G", "--gitignore", self.parsed_arguments))
+
+    def _compile_matcher(self) -> AbstractMatcher:
+        """
+        Compile the supplied patterns once for the whole invocation.
+        :return: Matcher of all the patterns.
+        :rtype: AbstractMatcher
+        """
+        patterns = self._get_patterns()
+        if len(patterns) == 0:
+            raise NotEnoughOptionException("-p")
+        return SearchUtils.compile_matcher(patterns, self._is_ignore_case())
+
+    def _get_patterns(self) -> list[str]:
+        """
+        Collect the patterns supplied with both pattern options.
+        :return: Patterns in command line order.
+        :rtype: list[str]
+        """
+        return (self._get_all_options_arguments("-p", "--pattern") +
+                self._get_all_options_arguments("-e", "--regexp"))
+
+    def _is_ignore_case(self) -> bool:
+        """
+        Determine whether the case is ignored.
+        :return: Flag indicating if the ignore-case option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-i", "--ignore-case", self.parsed_arguments)
 
     def _remove_if_not_exists_recursive_option(self):
         """
@@ -96,26 +299,209 @@ class CommandGrep(AbstractCommand):
                 self.logger.print(f"Not enough option: -r for {removed_path_as_str}")
                 self.parsed_arguments.position_arguments.remove(removed_path_as_str)
 
-    def _find(self, file: Path):
+    def _find(self, file: Path, matcher: AbstractMatcher) -> bool:
         """
-        Search for the configured pattern within the provided file.
+        Search for the compiled patterns within the provided file.
         :param file: File path to inspect.
         :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Flag indicating if the file matches.
+        :rtype: bool
+        """
+        try:
+            if self._is_decompress() and ArchiveUtils.is_archive(file):
+                return self._find_in_archive(file, matcher)
+            with file.open("rb") as stream:
+                return self._find_in_stream(file, stream, matcher)
+        except ArchiveUtils.READ_ERRORS:
+            self._log_unreadable(file)
+            return False
+
+    def _find_in_archive(self, file: Path, matcher: AbstractMatcher) -> bool:
+        """
+        Search every member of a compressed file or archive without extracting it.
+        :param file: Archive path.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Flag indicating if any member matches.
+        :rtype: bool
+        """
+        is_found = False
+        for name, stream in ArchiveUtils.iterate_members(file):
+            if self._find_in_stream(name, stream, matcher):
+                is_found = True
+                if self._is_quiet():
+                    break
+        return is_found
+
+    def _find_in_stream(self, file: Path | str, stream: BufferedReader, matcher: AbstractMatcher) -> bool:
+        """
+        Search an opened file or archive member and print the result.
+        :param file: File or archive member being searched.
+        :type file: Path | str
+        :param stream: Buffered stream of its content.
+        :type stream: BufferedReader
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Flag indicating if the content matches.
+        :rtype: bool
+        """
+        if self._is_lines_output() and not SearchUtils.is_binary_stream(stream):
+            return self._stream_found(file, stream, matcher)
+        result = SearchUtils.search_stream(stream, matcher, self._get_max_count(), self._is_lines_output())
+        return self._output_result(file, result)
+
+    def _stream_found(self, file: Path | str, stream: BufferedReader, matcher: AbstractMatcher) -> bool:
+        """
+        Print matching lines of text while it is being read.
+        :param file: File or archive member being searched.
+        :type file: Path | str
+        :param stream: Buffered stream of its content.
+        :type stream: BufferedReader
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Flag indicating if the content matches.
+        :rtype: bool
+        """
+        before, after = self._get_context()
+        blocks = SearchUtils.iterate_text_blocks(stream)
+        if before == 0 and after == 0:
+            with closing(SearchUtils.iterate_matches(blocks, matcher)) as matches:
+                return self._output_lines(file, ((num, line, True)
+                                                 for num, line in islice(matches, self._get_max_count())))
+        with closing(SearchUtils.iterate_context_lines(blocks, matcher, before, after,
+                                                       self._get_max_count())) as lines:
+            return self._output_lines(file, lines)
+
+    def _find_in_pool(self, files: Iterator[Path], matcher: AbstractMatcher, jobs: int):
+        """
+        Search files on a process pool while the tree is still being walked.
+        Results are printed in submission order, so the output stays stable.
+        :param files: Files to search.
+        :type files: Iterator[Path]
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param jobs: Number of worker processes.
+        :type jobs: int
+        :return: None
+        :rtype: None
+        """
+        max_pending = jobs * CommandGrep.MAX_PENDING_PER_JOB
+        pending: deque[tuple[Path, Future]] = deque()
+        max_count = self._get_max_count()
+        is_lines_output = self._is_lines_output()
+        before, after = self._get_context()
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for file in files:
+                if self._is_decompress() and ArchiveUtils.is_archive(file):
+                    future = executor.submit(SearchUtils.search_archive,
+                                             file, matcher, max_count, is_lines_output, before, after)
+                elif is_lines_output and (before > 0 or after > 0):
+                    future = executor.submit(SearchUtils.search_file_with_context,
+                                             file, matcher, before, after, max_count)
+                else:
+                    future = executor.submit(SearchUtils.search_file, file, matcher, max_count, is_lines_output)
+                pending.append((file, future))
+                while len(pending) >= max_pending or (pending and pending[0][1].done()):
+                    if self._output_future(*pending.popleft()) and self._is_quiet():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        return
+            while pending:
+                if self._output_future(*pending.popleft()) and self._is_quiet():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
+
+    def _output_future(self, file: Path, future: Future) -> bool:
+        """
+        Wait for a pooled search of a file and print its result.
+        :param file: File that was searched.
+        :type file: Path
+        :param future: Pending search result.
+        :type future: Future
+        :return: Flag indicating if the file matches.
+        :rtype: bool
+        """
+        try:
+            result = future.result()
+        except ArchiveUtils.READ_ERRORS:
+            self._log_unreadable(file)
+            return False
+        if self._is_decompress() and ArchiveUtils.is_archive(file):
+            is_found = False
+            for name, member_result in result:
+                is_found = self._output_result(name, member_result) or is_found
+            return is_found
+        return self._output_result(file, result)
+
+    def _output_result(self, file: Path | str, result: tuple[bool, int, list[tuple]]) -> bool:
+        """
+        Print the search result of a file according to the selected output mode.
+        :param file: File or archive member that was searched.
+        :type file: Path | str
+        :param result: Binary match flag, number of matching lines and the lines themselves,
+            with a flag of a matching line when context is requested.
+        :type result: tuple[bool, int, list[tuple]]
+        :return: Flag indicating if the file matches.
+        :rtype: bool
+        """
+        is_binary_match, count, found = result
+        if self._is_quiet():
+            pass
+        elif self._is_files_with_matches():
+            if count > 0:
+                self.logger.print(str(file))
+        elif self._is_count():
+            self.logger.print(f"{file}: {count}")
+        elif is_binary_match:
+            self._output_binary_match(file)
+        elif self._get_context() == (0, 0):
+            self._output_lines(file, ((num, line, True) for num, line in found))
+        else:
+            self._output_lines(file, found)
+        return count > 0
+
+    def _output_lines(self, file: Path | str, lines: Iterable[tuple[int, str, bool]]) -> bool:
+        """
+        Print matching and context lines of a file grouped under its name.
+        Context lines are marked with '-' instead of ':' and groups of lines that
+        are not adjacent are separated with '--'.
+        :param file: File or archive member that was searched.
+        :type file: Path | str
+        :param lines: Line numbers, lines and flags indicating a matching line.
+        :type lines: Iterable[tuple[int, str, bool]]
+        :return: Flag indicating if anything was printed.
+        :rtype: bool
+        """
+        last_num = None
+        for num, line, is_match in lines:
+            if last_num is None:
+                self.logger.print(f"file: {file}")
+            elif num > last_num + 1:
+                self.logger.print(CommandGrep.GROUP_SEPARATOR)
+            self.logger.print(f"{num}: {line}" if is_match else f"{num}- {line}")
+            last_num = num
+        return last_num is not None
+
+    def _output_binary_match(self, file: Path | str):
+        """
+        Report a binary file containing the pattern instead of printing its lines.
+        :param file: Binary file or archive member that matches.
+        :type file: Path | str
+        :return: None
+        :rtype: None
+        """
+        self.logger.print(f"binary file matches: {file}")
+
+    def _log_unreadable(self, file: Path):
+        """
+        Report a file that could not be read during the search.
+        :param file: File that failed to be read.
+        :type file: Path
         :return: None
         :rtype: None
         """
-        pattern = self._get_options_arguments("-p", "--pattern")
-        text = file.read_text(CommandGrep.ENCODING_MODE, CommandGrep.ERRORS_MODE)
-        found = []
-        flag = 0
-
-        if AbstractCommand.is_in_parsed_arguments("-i", "--ignore-case", self.parsed_arguments):
-            flag = re.IGNORECASE
-
-        for num, line in enumerate(text.splitlines()):
-            if re.search(pattern, line, flags=flag) is not None:
-                found.append(f"{num + 1}: {line}")
-        if len(found) > 0:
-            self.logger.print(f"file: {file}")
-            for line in found:
-                self.logger.print(line)
\ No newline at end of file
+        message = NotAccessToReadException.MESSAGE + str(file)
+        self.logger.print(message)
+        self.logger.error(message)
\ No newline at end of file
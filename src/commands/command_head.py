@@ -0,0 +1,87 @@
+from pathlib import Path
+
+from src.commands.abstract_commands import AbstractCommand
+from src.common.context import Context
+from src.common.input_arguments import InputArguments
+from src.common.logger import Logger
+from src.common.option import Option
+from src.common.parser import Parser
+from src.exception.command_exception import NotEnoughArgumentsException
+from src.utils.line_utils import LineUtils
+from src.utils.path_utils import PathUtils
+
+
+class CommandHead(AbstractCommand):
+    OPTIONS: set[Option] = {
+        Option("Показать список всех опций", "-h", "--help", False, True),
+        Option("Количество выводимых строк", "-n", "--lines", True, False)
+    }
+    DEFAULT_LINES: int = 10
+
+    def __init__(self, parser: Parser, logger: Logger):
+        """
+        Initialize the head command with parser and logger.
+        :param parser: Parser used to analyze command arguments.
+        :type parser: Parser
+        :param logger: Logger instance for output.
+        :type logger: Logger
+        :return: None
+        :rtype: None
+        """
+        super().__init__(CommandHead.OPTIONS, parser, logger)
+
+    def execute(self, arguments: InputArguments, context: Context):
+        """
+        Output the first lines of the provided files.
+        :param arguments: Parsed command arguments.
+        :type arguments: InputArguments
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        self.parsed_arguments = self.parser.parse(CommandHead.OPTIONS, arguments)
+        if self.output_help_if_need():
+            return
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_presence_file)
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_readable)
+
+        count_position_arguments = len(self.parsed_arguments.position_arguments)
+
+        match count_position_arguments:
+            case 0:
+                raise NotEnoughArgumentsException()
+            case _:
+                count = self._get_lines_count()
+                for path_as_str in self.parsed_arguments.position_arguments:
+                    if count_position_arguments > 1:
+                        self.logger.print(f"==> {path_as_str} <==")
+                    self._output_head(Path(path_as_str), count)
+
+    def _get_lines_count(self) -> int:
+        """
+        Determine the number of lines to output.
+        :return: Requested number of lines or the default one.
+        :rtype: int
+        """
+        if AbstractCommand.is_in_parsed_arguments("-n", "--lines", self.parsed_arguments):
+            return self._get_int_options_arguments("-n", "--lines")
+        return CommandHead.DEFAULT_LINES
+
+    def _output_head(self, path: Path, count: int):
+        """
+        Output the first lines of a file without reading the rest of it.
+        :param path: File to output.
+        :type path: Path
+        :param count: Number of lines.
+        :type count: int
+        :return: None
+        :rtype: None
+        """
+        last_chunk = b""
+        with path.open("rb") as stream:
+            for chunk in LineUtils.iterate_head_chunks(stream, count):
+                self.logger.write_bytes(chunk)
+                last_chunk = chunk
+        if last_chunk != b"" and not last_chunk.endswith(LineUtils.LINE_SEPARATOR):
+            self.logger.print("")
@@ -1,12 +1,19 @@
+import heapq
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
 from src.commands.abstract_commands import AbstractCommand
 from src.common.context import Context
+from src.common.entry_record import EntryRecord
 from src.common.input_arguments import InputArguments
 from src.common.logger import Logger
 from src.common.option import Option
+from src.common.ownership_cache import OwnershipCache
 from src.common.parsed_arguments import ParsedArguments
 from src.common.parser import Parser
+from src.exception.command_exception import NotAccessToReadException, UnexpectedArgumentsException
+from src.utils.directory_walker import DirectoryWalker
 from src.utils.path_utils import PathUtils
 
 
@@ -14,11 +21,22 @@ class CommandLS(AbstractCommand):
     OPTIONS = {
         Option("Показать список файлов в директории", "-l", "--list", False, True),
         Option("Показать список всех опций", "-h", "--help", False, True),
-        Option("Включить в список скрытые файлы", "-a", "--all", False, True)
+        Option("Включить в список скрытые файлы", "-a", "--all", False, True),
+        Option("Выводить содержимое порциями по мере чтения каталога", "-s", "--stream", False, True),
+        Option("Рекурсивно вывести содержимое подкаталогов", "-R", "--recursive", False, True),
+        Option("Ограничить глубину рекурсивного обхода", "-D", "--max-depth", True, False),
+        Option("Отсортировать по размеру, начиная с наибольших", "-S", "--size-sort", False, True),
+        Option("Отсортировать по времени изменения, начиная с новых", "-t", "--time", False, True),
+        Option("Вывести только N наибольших или самых новых записей", "-T", "--top", True, False)
     }
     DIRECTORY_EMOJI = "🗂"
     FILE_EMOJI = "📄"
     UNEXPECTED_TYPE = "❔"
+    STREAM_CHUNK_SIZE = 1024
+    STREAM_ALIGN_LINK = 3
+    STREAM_ALIGN_OWNER = 8
+    STREAM_ALIGN_GROUP = 8
+    STREAM_ALIGN_BYTES = 12
 
     def __init__(self, parser: Parser, logger: Logger):
         """
@@ -58,8 +76,7 @@ class CommandLS(AbstractCommand):
             case 0:
                 PathUtils.check_presence(context.current_directory)
                 PathUtils.check_readable(context.current_directory)
-                directory_content = PathUtils.get_directory_content(context.current_directory)
-                self._output_content(directory_content, self.parsed_arguments, False)
+                self._output_directory(context.current_directory, False, context)
             case _:
                 is_write_path = count_position_arguments != 1
                 for path in self.parsed_arguments.position_arguments:
@@ -67,95 +84,257 @@ class CommandLS(AbstractCommand):
                     if Path(current_path).is_file():
                         self.logger.print(current_path.name)
                         continue
-                    directory_content = PathUtils.get_directory_content(current_path)
-                    self._output_content(directory_content, self.parsed_arguments, is_write_path)
+                    self._output_directory(current_path, is_write_path, context)
 
+    def _is_hidden_enable(self) -> bool:
+        """
+        Determine whether hidden entries should be listed.
+        :return: Flag indicating if the all option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-a", "--all", self.parsed_arguments)
+
+    def _is_ordering_enable(self) -> bool:
+        """
+        Determine whether any sorting or top-k option is present.
+        :return: Flag indicating if records have to be ordered.
+        :rtype: bool
+        """
+        return (AbstractCommand.is_in_parsed_arguments("-S", "--size-sort", self.parsed_arguments) or
+                AbstractCommand.is_in_parsed_arguments("-t", "--time", self.parsed_arguments) or
+                AbstractCommand.is_in_parsed_arguments("-T", "--top", self.parsed_arguments))
+
+    def _get_sort_key(self) -> Optional[Callable[[EntryRecord], float]]:
+        """
+        Select the key used to order records.
+        :return: Key function or None when no sorting option is present.
+        :rtype: Optional[Callable[[EntryRecord], float]]
+        """
+        is_size_sort = AbstractCommand.is_in_parsed_arguments("-S", "--size-sort", self.parsed_arguments)
+        is_time_sort = AbstractCommand.is_in_parsed_arguments("-t", "--time", self.parsed_arguments)
+        if is_size_sort and is_time_sort:
+            raise UnexpectedArgumentsException(["-S", "-t"])
+        if is_size_sort:
+            return lambda record: record.size
+        if is_time_sort:
+            return lambda record: record.mtime
+        return None
+
+    def _select_records(self, records: Iterable[EntryRecord]) -> list[EntryRecord]:
+        """
+        Order records according to sorting options, keeping only the top N when requested.
+        The top N records are selected with a bounded heap, so memory does not grow with the directory.
+        :param records: Records to order, possibly a lazy iterator.
+        :type records: Iterable[EntryRecord]
+        :return: Records in output order.
+        :rtype: list[EntryRecord]
+        """
+        key = self._get_sort_key()
+        if AbstractCommand.is_in_parsed_arguments("-T", "--top", self.parsed_arguments):
+            count = self._get_int_options_arguments("-T", "--top")
+            return heapq.nlargest(count, records, key=key or (lambda record: record.size))
+        if key is not None:
+            return sorted(records, key=key, reverse=True)
+        return list(records)
+
+    def _output_directory(self, directory: Path, is_write_path_name: bool, context: Context) -> None:
+        """
+        Scan a directory once and render its contents.
+        :param directory: Directory to list.
+        :type directory: Path
+        :param is_write_path_name: Flag indicating whether to prefix directory names.
+        :type is_write_path_name: bool
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        if AbstractCommand.is_in_parsed_arguments("-R", "--recursive", self.parsed_arguments):
+            self._output_tree(directory, context)
+            return
+        if AbstractCommand.is_in_parsed_arguments("-s", "--stream", self.parsed_arguments):
+            self._stream_directory(directory, is_write_path_name, context)
+            return
+        records = self._select_records(PathUtils.iterate_directory(directory, self._is_hidden_enable()))
+        self._output_content(directory, records, self.parsed_arguments, is_write_path_name, context)
 
-    def _output_content(self, paths: list[Path], parsed_arguments: ParsedArguments, is_write_path_name: bool) -> None:
+    def _output_content(self,
+                        directory: Path,
+                        records: list[EntryRecord],
+                        parsed_arguments: ParsedArguments,
+                        is_write_path_name: bool,
+                        context: Context
+    ) -> None:
         """
         Render directory contents based on selected output mode.
-        :param paths: Collection of paths to display.
-        :type paths: list[Path]
+        :param directory: Directory whose contents are displayed.
+        :type directory: Path
+        :param records: Records of the entries to display.
+        :type records: list[EntryRecord]
         :param parsed_arguments: Parsed command arguments.
         :type parsed_arguments: ParsedArguments
         :param is_write_path_name: Flag indicating whether to prefix directory names.
         :type is_write_path_name: bool
+        :param context: Shell execution context.
+        :type context: Context
         :return: None
         :rtype: None
         """
+        result = []
+        if is_write_path_name:
+            result.append(directory.name + ":\n")
         if AbstractCommand.is_in_parsed_arguments("-l", "--list", parsed_arguments):
-            program_output = self._get_ls_output_with_l_option(paths, is_write_path_name)
-            self.logger.print(program_output)
+            result.append(CommandLS._get_ls_output_with_l_option(records, context.ownership_cache))
         else:
-            program_output = self._get_ls_output_without_l_option(paths, is_write_path_name)
-            self.logger.print(program_output)
+            result.append(CommandLS._get_ls_output_without_l_option(records))
+        self.logger.print("".join(result))
+
+    def _output_tree(self, root: Path, context: Context) -> None:
+        """
+        Render the whole tree under root using the parallel directory walker.
+        :param root: Directory to start from.
+        :type root: Path
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        max_depth = None
+        if AbstractCommand.is_in_parsed_arguments("-D", "--max-depth", self.parsed_arguments):
+            max_depth = self._get_int_options_arguments("-D", "--max-depth")
+
+        walker = DirectoryWalker(self._is_hidden_enable(), max_depth, on_error=self._log_walk_error)
+        for directory, records in walker.walk(root):
+            self.logger.print(f"{directory}:")
+            self._output_content(directory, self._select_records(records), self.parsed_arguments, False, context)
+
+    def _log_walk_error(self, directory: Path, exception: OSError) -> None:
+        """
+        Report a directory that could not be read during the recursive walk.
+        :param directory: Directory that failed to be read.
+        :type directory: Path
+        :param exception: Error raised while reading.
+        :type exception: OSError
+        :return: None
+        :rtype: None
+        """
+        message = NotAccessToReadException.MESSAGE + str(directory)
+        self.logger.print(message)
+        self.logger.error(f"{message}: {exception}")
+
+    def _stream_directory(self, directory: Path, is_write_path_name: bool, context: Context) -> None:
+        """
+        Render directory contents in bounded chunks while the directory is read.
+        Long listing columns use fixed widths so no preliminary pass is needed.
+        :param directory: Directory to list.
+        :type directory: Path
+        :param is_write_path_name: Flag indicating whether to prefix directory names.
+        :type is_write_path_name: bool
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        if is_write_path_name:
+            self.logger.write(directory.name + ":\n")
+
+        is_long_listing = AbstractCommand.is_in_parsed_arguments("-l", "--list", self.parsed_arguments)
+        records = PathUtils.iterate_directory(directory, self._is_hidden_enable())
+        if self._is_ordering_enable():
+            records = self._select_records(records)
+        chunk = []
+        for record in records:
+            if is_long_listing:
+                chunk.append(CommandLS._get_formatted_string_for_l_option(
+                    CommandLS._get_columns_for_l_option(record, context.ownership_cache),
+                    CommandLS.STREAM_ALIGN_LINK,
+                    CommandLS.STREAM_ALIGN_OWNER,
+                    CommandLS.STREAM_ALIGN_GROUP,
+                    CommandLS.STREAM_ALIGN_BYTES
+                ))
+            else:
+                chunk.append(CommandLS._get_path_name_with_emoji(record))
+            if len(chunk) >= CommandLS.STREAM_CHUNK_SIZE:
+                self.logger.write("".join(chunk))
+                chunk.clear()
+        self.logger.write("".join(chunk) + "\n")
 
     @staticmethod
-    def _get_path_name_with_emoji(path: Path) -> str:
+    def _get_path_name_with_emoji(record: EntryRecord) -> str:
         """
-        Represent the path name with an emoji for its type.
-        :param path: Path to represent.
-        :type path: Path
-        :return: String containing emoji and path name.
+        Represent the entry name with an emoji for its type.
+        :param record: Record of the entry to represent.
+        :type record: EntryRecord
+        :return: String containing emoji and entry name.
         :rtype: str
         """
-        if path.is_dir():
-            return f"{CommandLS.DIRECTORY_EMOJI} {path.name} "
-        elif path.is_file():
-            return f"{CommandLS.FILE_EMOJI}{path.name} "
-        return f"{CommandLS.UNEXPECTED_TYPE}{path.name} "
+        if record.is_dir:
+            return f"{CommandLS.DIRECTORY_EMOJI} {record.name} "
+        elif record.is_file:
+            return f"{CommandLS.FILE_EMOJI}{record.name} "
+        return f"{CommandLS.UNEXPECTED_TYPE}{record.name} "
 
-    def _get_ls_output_without_l_option(self,paths: list[Path], is_write_path_name: bool) -> str:
+    @staticmethod
+    def _get_ls_output_without_l_option(records: list[EntryRecord]) -> str:
         """
         Build the ls output string without the long listing format.
-        :param paths: Collection of paths to display.
-        :type paths: list[Path]
-        :param is_write_path_name: Flag indicating whether to prefix directory names.
-        :type is_write_path_name: bool
+        :param records: Records of the entries to display.
+        :type records: list[EntryRecord]
         :return: Concatenated listing output.
         :rtype: str
         """
-        result = []
-        if is_write_path_name:
-            result.append(paths[0].parent.name + ":\n")
-        for path in paths:
-            if path.name[0] == ".":
-                if AbstractCommand.is_in_parsed_arguments("-a", "--all", self.parsed_arguments):
-                    result.append(CommandLS._get_path_name_with_emoji(path))
-            else:
-                result.append(CommandLS._get_path_name_with_emoji(path))
-        return "".join(result)
+        return "".join([CommandLS._get_path_name_with_emoji(record) for record in records])
 
-    def _get_ls_output_with_l_option(self, paths: list[Path], is_write_path_name: bool) -> str:
+    @staticmethod
+    def _get_ls_output_with_l_option(records: list[EntryRecord], ownership_cache: OwnershipCache) -> str:
         """
         Build the ls output string with the long listing format.
-        :param paths: Collection of paths to display.
-        :type paths: list[Path]
-        :param is_write_path_name: Flag indicating whether to prefix directory names.
-        :type is_write_path_name: bool
+        :param records: Records of the entries to display.
+        :type records: list[EntryRecord]
+        :param ownership_cache: Session cache of owner and group names.
+        :type ownership_cache: OwnershipCache
         :return: Concatenated long listing output.
         :rtype: str
         """
-        result = []
+        if len(records) == 0:
+            return ""
 
-        align_link = AbstractCommand._get_max_length(paths, PathUtils.get_count_links)
-        align_owner = AbstractCommand._get_max_length(paths, PathUtils.get_owner)
-        align_group = AbstractCommand._get_max_length(paths, PathUtils.get_group)
-        align_bytes = AbstractCommand._get_max_length(paths, PathUtils.get_bytes_size)
+        rows = [CommandLS._get_columns_for_l_option(record, ownership_cache) for record in records]
+        align_link = AbstractCommand._get_max_length(rows, lambda row: row[1])
+        align_owner = AbstractCommand._get_max_length(rows, lambda row: row[2])
+        align_group = AbstractCommand._get_max_length(rows, lambda row: row[3])
+        align_bytes = AbstractCommand._get_max_length(rows, lambda row: row[4])
 
-        if is_write_path_name:
-            result.append(paths[0].parent.name + ":\n")
+        return "".join(
+            [CommandLS._get_formatted_string_for_l_option(row, align_link, align_owner, align_group, align_bytes)
+             for row in rows]
+        )
 
-        for path in paths:
-            if path.name[0] == ".":
-                if AbstractCommand.is_in_parsed_arguments("-a", "--all", self.parsed_arguments):
-                    result.append(self._get_formatted_string_for_l_option(path, align_link, align_owner, align_group, align_bytes))
-            else:
-                result.append(self._get_formatted_string_for_l_option(path, align_link, align_owner, align_group, align_bytes))
-        return "".join(result)
+    @staticmethod
+    def _get_columns_for_l_option(record: EntryRecord,
+                                  ownership_cache: OwnershipCache
+    ) -> tuple[str, str, str, str, str, str, str]:
+        """
+        Render the long listing columns of a single entry.
+        :param record: Record of the entry to render.
+        :type record: EntryRecord
+        :param ownership_cache: Session cache of owner and group names.
+        :type ownership_cache: OwnershipCache
+        :return: Mode, links, owner, group, size, change time and name columns.
+        :rtype: tuple[str, str, str, str, str, str, str]
+        """
+        return (
+            record.get_filemode(),
+            str(record.nlink),
+            ownership_cache.get_owner(record.uid),
+            ownership_cache.get_group(record.gid),
+            str(record.size),
+            datetime.fromtimestamp(record.ctime).strftime('%Y-%m-%d %H:%M:%S'),
+            record.name,
+        )
 
-    def _get_formatted_string_for_l_option(self,
-                                           path: Path,
+    @staticmethod
+    def _get_formatted_string_for_l_option(row: tuple[str, str, str, str, str, str, str],
                                            align_link: int,
                                            align_owner: int,
                                            align_group: int,
@@ -163,8 +342,8 @@ class CommandLS(AbstractCommand):
     ) -> str:
         """
         Format a single entry for the long listing output.
-        :param path: Path to format.
-        :type path: Path
+        :param row: Rendered columns of the entry.
+        :type row: tuple[str, str, str, str, str, str, str]
         :param align_link: Alignment width for link count.
         :type align_link: int
         :param align_owner: Alignment width for owner name.
@@ -173,15 +352,16 @@ class CommandLS(AbstractCommand):
         :type align_group: int
         :param align_bytes: Alignment width for byte size.
         :type align_bytes: int
-        :return: Formatted listing string for the path.
+        :return: Formatted listing string for the entry.
         :rtype: str
         """
+        mode, links, owner, group, size, change_time, name = row
         return (
-            f"{PathUtils.get_filemode(path)} "
-            f"{PathUtils.get_count_links(path):>{align_link}} "
-            f"{PathUtils.get_owner(path):>{align_owner}} "
-            f"{PathUtils.get_group(path):<{align_group}} "
-            f"{PathUtils.get_bytes_size(path):>{align_bytes}} "
-            f"{PathUtils.get_last_change_time(path).strftime('%Y-%m-%d %H:%M:%S')} "
-            f"{PathUtils.get_path_name(path)} \n"
-        )
\ No newline at end of file
+            f"{mode} "
+            f"{links:>{align_link}} "
+            f"{owner:>{align_owner}} "
+            f"{group:<{align_group}} "
+            f"{size:>{align_bytes}} "
+            f"{change_time} "
+            f"{name} \n"
+        )
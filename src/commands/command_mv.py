@@ -14,7 +14,11 @@ from src.utils.path_utils import PathUtils
 
 class CommandMV(AbstractCommand):
     OPTIONS = {
-        Option("Показать список всех опций", "-h", "--help", False, True)
+        Option("Показать список всех опций", "-h", "--help", False, True),
+        Option("Размер блока копирования между файловыми системами (допустимы суффиксы K, M, G)",
+               "-k", "--chunk-size", True, False),
+        Option("Ограничение скорости записи в байтах в секунду (допустимы суффиксы K, M, G)",
+               "-b", "--bwlimit", True, False)
     }
 
     def __init__(self, parser: Parser, logger: Logger):
@@ -48,7 +52,8 @@ class CommandMV(AbstractCommand):
         correct_paths.append(self.parsed_arguments.position_arguments[-1])
 
         count_position_arguments = len(correct_paths)
-
+        chunk_size = self._get_chunk_size("-k", "--chunk-size")
+        limiter = self._get_rate_limiter("-b", "--bwlimit")
 
         match count_position_arguments:
             case 0 | 1:
@@ -60,7 +65,7 @@ class CommandMV(AbstractCommand):
                 if not PathUtils.is_path_exists(dest):
                     PathUtils.check_writable(context.current_directory)
 
-                PathUtils.move(src, dest)
+                PathUtils.move(src, dest, chunk_size, limiter)
             case _:
                 dest = PathUtils.get_resolved_path(Path(correct_paths[-1]))
                 PathUtils.check_presence(dest)
@@ -68,4 +73,4 @@ class CommandMV(AbstractCommand):
 
                 for src_as_str in correct_paths[:-1]:
                     src = PathUtils.get_resolved_path(Path(src_as_str))
-                    PathUtils.move(src, dest)
+                    PathUtils.move(src, dest, chunk_size, limiter)
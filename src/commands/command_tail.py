@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+
+from src.commands.abstract_commands import AbstractCommand
+from src.common.context import Context
+from src.common.input_arguments import InputArguments
+from src.common.logger import Logger
+from src.common.option import Option
+from src.common.parser import Parser
+from src.exception.command_exception import NotEnoughArgumentsException, UnexpectedArgumentsException
+from src.utils.file_follower import FileFollower
+from src.utils.line_utils import LineUtils
+from src.utils.path_utils import PathUtils
+
+
+class CommandTail(AbstractCommand):
+    OPTIONS: set[Option] = {
+        Option("Показать список всех опций", "-h", "--help", False, True),
+        Option("Количество выводимых строк", "-n", "--lines", True, False),
+        Option("Выводить новые строки по мере дописывания файла (Ctrl-C для выхода)", "-f", "--follow", False, True)
+    }
+    DEFAULT_LINES: int = 10
+
+    def __init__(self, parser: Parser, logger: Logger):
+        """
+        Initialize the tail command with parser and logger.
+        :param parser: Parser used to analyze command arguments.
+        :type parser: Parser
+        :param logger: Logger instance for output.
+        :type logger: Logger
+        :return: None
+        :rtype: None
+        """
+        super().__init__(CommandTail.OPTIONS, parser, logger)
+
+    def execute(self, arguments: InputArguments, context: Context):
+        """
+        Output the last lines of the provided files.
+        :param arguments: Parsed command arguments.
+        :type arguments: InputArguments
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        self.parsed_arguments = self.parser.parse(CommandTail.OPTIONS, arguments)
+        if self.output_help_if_need():
+            return
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_presence_file)
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_readable)
+
+        count_position_arguments = len(self.parsed_arguments.position_arguments)
+
+        match count_position_arguments:
+            case 0:
+                raise NotEnoughArgumentsException()
+            case _ if self._is_follow():
+                if count_position_arguments > 1:
+                    raise UnexpectedArgumentsException(self.parsed_arguments.position_arguments[1:])
+                path = Path(self.parsed_arguments.position_arguments[0])
+                offset = self._output_tail(path, self._get_lines_count())
+                FileFollower(path, offset).follow(self.logger.write_bytes)
+            case _:
+                count = self._get_lines_count()
+                for path_as_str in self.parsed_arguments.position_arguments:
+                    if count_position_arguments > 1:
+                        self.logger.print(f"==> {path_as_str} <==")
+                    self._output_tail(Path(path_as_str), count)
+
+    def _is_follow(self) -> bool:
+        """
+        Determine whether the file is followed after its last lines are printed.
+        :return: Flag indicating if the follow option is present.
+        :rtype: bool
+        """
+        return AbstractCommand.is_in_parsed_arguments("-f", "--follow", self.parsed_arguments)
+
+    def _get_lines_count(self) -> int:
+        """
+        Determine the number of lines to output.
+        :return: Requested number of lines or the default one.
+        :rtype: int
+        """
+        if AbstractCommand.is_in_parsed_arguments("-n", "--lines", self.parsed_arguments):
+            return self._get_int_options_arguments("-n", "--lines")
+        return CommandTail.DEFAULT_LINES
+
+    def _output_tail(self, path: Path, count: int) -> int:
+        """
+        Output the last lines of a file reading it backwards from the end.
+        An unterminated last line is completed with a newline unless the file is followed.
+        :param path: File to output.
+        :type path: Path
+        :param count: Number of lines.
+        :type count: int
+        :return: Position right after the output bytes.
+        :rtype: int
+        """
+        with path.open("rb") as stream:
+            offset = LineUtils.find_tail_offset(stream, count)
+            size = stream.seek(0, os.SEEK_END)
+            if offset == size:
+                return size
+            stream.seek(size - 1)
+            is_terminated = stream.read(1) == LineUtils.LINE_SEPARATOR
+            stream.seek(offset)
+            self.logger.write_stream(stream)
+            end = stream.tell()
+        if not is_terminated and not self._is_follow():
+            self.logger.print("")
+        return end
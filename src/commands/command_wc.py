@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.commands.abstract_commands import AbstractCommand
+from src.common.context import Context
+from src.common.input_arguments import InputArguments
+from src.common.logger import Logger
+from src.common.option import Option
+from src.common.parser import Parser
+from src.exception.command_exception import NotEnoughArgumentsException
+from src.utils.count_utils import CountUtils
+from src.utils.path_utils import PathUtils
+
+
+class CommandWC(AbstractCommand):
+    OPTIONS: set[Option] = {
+        Option("Показать список всех опций", "-h", "--help", False, True),
+        Option("Вывести количество строк", "-l", "--lines", False, True),
+        Option("Вывести количество слов", "-w", "--words", False, True),
+        Option("Вывести количество байт", "-c", "--bytes", False, True),
+        Option("Количество процессов для подсчёта по нескольким файлам", "-j", "--jobs", True, False)
+    }
+    TOTAL_NAME: str = "total"
+
+    def __init__(self, parser: Parser, logger: Logger):
+        """
+        Initialize the wc command with parser and logger.
+        :param parser: Parser used to analyze command arguments.
+        :type parser: Parser
+        :param logger: Logger instance for output.
+        :type logger: Logger
+        :return: None
+        :rtype: None
+        """
+        super().__init__(CommandWC.OPTIONS, parser, logger)
+
+    def execute(self, arguments: InputArguments, context: Context):
+        """
+        Output the numbers of lines, words and bytes of the provided files.
+        :param arguments: Parsed command arguments.
+        :type arguments: InputArguments
+        :param context: Shell execution context.
+        :type context: Context
+        :return: None
+        :rtype: None
+        """
+        self.parsed_arguments = self.parser.parse(CommandWC.OPTIONS, arguments)
+        if self.output_help_if_need():
+            return
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_presence_file)
+        self._remove_if(self.parsed_arguments.position_arguments, PathUtils.check_readable)
+
+        count_position_arguments = len(self.parsed_arguments.position_arguments)
+
+        match count_position_arguments:
+            case 0:
+                raise NotEnoughArgumentsException()
+            case _:
+                names = self.parsed_arguments.position_arguments
+                rows = list(zip(self._count_files([Path(name) for name in names]), names))
+                if count_position_arguments > 1:
+                    rows.append((tuple(sum(column) for column in zip(*(counts for counts, _ in rows))),
+                                 CommandWC.TOTAL_NAME))
+                self._output_rows(rows)
+
+    def _count_files(self, files: list[Path]) -> list[tuple[int, int, int]]:
+        """
+        Count the files, several of them in parallel on a process pool.
+        :param files: Files to count.
+        :type files: list[Path]
+        :return: Numbers of lines, words and bytes in the order of the files.
+        :rtype: list[tuple[int, int, int]]
+        """
+        jobs = min(self._get_jobs(), len(files))
+        if jobs <= 1:
+            return [CountUtils.count_file(file) for file in files]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(CountUtils.count_file, files))
+
+    def _get_jobs(self) -> int:
+        """
+        Determine the number of worker processes.
+        :return: Requested number of jobs or the number of cores.
+        :rtype: int
+        """
+        if AbstractCommand.is_in_parsed_arguments("-j", "--jobs", self.parsed_arguments):
+            return max(1, self._get_int_options_arguments("-j", "--jobs"))
+        return os.cpu_count() or 1
+
+    def _get_selected_columns(self) -> list[int]:
+        """
+        Determine which of the counts are printed.
+        :return: Indexes of the lines, words and bytes columns, all of them when none is selected.
+        :rtype: list[int]
+        """
+        selected = [index for index, (short_name, long_name)
+                    in enumerate([("-l", "--lines"), ("-w", "--words"), ("-c", "--bytes")])
+                    if AbstractCommand.is_in_parsed_arguments(short_name, long_name, self.parsed_arguments)]
+        return selected or [0, 1, 2]
+
+    def _output_rows(self, rows: list[tuple[tuple[int, int, int], str]]):
+        """
+        Print the selected counts aligned to the widest number.
+        :param rows: Counts with the file names.
+        :type rows: list[tuple[tuple[int, int, int], str]]
+        :return: None
+        :rtype: None
+        """
+        columns = self._get_selected_columns()
+        width = max(len(str(counts[column])) for counts, _ in rows for column in columns)
+        for counts, name in rows:
+            self.logger.print(" ".join(f"{counts[column]:>{width}}" for column in columns) + f" {name}")
@@ -20,6 +20,8 @@ class CommandZIP(AbstractCommand):
         Option("Создать архив", "-c", "--create", False, False),
         Option("Разархивировать архив", "-x", "--extract", False, False),
         Option("Указывает имя создаваемого архива", "-f", "--file", True, False),
+        Option("Ограничение скорости записи в байтах в секунду (допустимы суффиксы K, M, G)",
+               "-b", "--bwlimit", True, False),
     }
 
     def __init__(self, parser: Parser, logger: Logger):
@@ -77,7 +79,7 @@ class CommandZIP(AbstractCommand):
             [PathUtils.get_resolved_path(Path(file)) for file in self.parsed_arguments.position_arguments]
         )
         archive_name = self._get_options_arguments("-f", "--file")
-        PathUtils.create_zip_archive(archive_name, added_files)
+        PathUtils.create_zip_archive(archive_name, added_files, self._get_rate_limiter("-b", "--bwlimit"))
 
     def _if_extract_situation(self):
         """
@@ -86,7 +88,7 @@ class CommandZIP(AbstractCommand):
         :rtype: None
         """
         archive_name = self._get_options_arguments("-f", "--file")
-        PathUtils.unzip_archive(archive_name)
+        PathUtils.unzip_archive(archive_name, self._get_rate_limiter("-b", "--bwlimit"))
 
     def _is_create_situation(self) -> bool:
         """
@@ -1,10 +1,12 @@
 from pathlib import Path
 from os import chdir
 
+from src.common.ownership_cache import OwnershipCache
 
 
 class Context:
     current_directory: Path
+    ownership_cache: OwnershipCache
 
     HOME = Path.home()
     HISTORY_PATH = HOME / '.history'
@@ -17,4 +19,5 @@ class Context:
         :rtype: None
         """
         self.current_directory = Context.HOME
+        self.ownership_cache = OwnershipCache()
         chdir(self.current_directory)
\ No newline at end of file
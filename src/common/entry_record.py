@@ -0,0 +1,84 @@
+from stat import S_ISDIR, filemode
+
+
+class EntryRecord:
+    name: str
+    path: str
+    mode: int
+    nlink: int
+    uid: int
+    gid: int
+    size: int
+    mtime: float
+    ctime: float
+    is_dir: bool
+    is_file: bool
+
+    __slots__ = ("name", "path", "mode", "nlink", "uid", "gid", "size", "mtime", "ctime", "is_dir", "is_file")
+
+    def __init__(self,
+                 name: str,
+                 path: str,
+                 mode: int,
+                 nlink: int,
+                 uid: int,
+                 gid: int,
+                 size: int,
+                 mtime: float,
+                 ctime: float,
+                 is_dir: bool,
+                 is_file: bool):
+        """
+        Initialize the compact record describing a single directory entry.
+        :param name: Final path component of the entry.
+        :type name: str
+        :param path: Full path of the entry.
+        :type path: str
+        :param mode: Raw st_mode value of the entry.
+        :type mode: int
+        :param nlink: Number of hard links.
+        :type nlink: int
+        :param uid: Numeric owner identifier.
+        :type uid: int
+        :param gid: Numeric group identifier.
+        :type gid: int
+        :param size: Size of the entry in bytes.
+        :type size: int
+        :param mtime: Last modification timestamp.
+        :type mtime: float
+        :param ctime: Last metadata change timestamp.
+        :type ctime: float
+        :param is_dir: Flag indicating whether the entry is a directory.
+        :type is_dir: bool
+        :param is_file: Flag indicating whether the entry is a regular file.
+        :type is_file: bool
+        :return: None
+        :rtype: None
+        """
+        self.name = name
+        self.path = path
+        self.mode = mode
+        self.nlink = nlink
+        self.uid = uid
+        self.gid = gid
+        self.size = size
+        self.mtime = mtime
+        self.ctime = ctime
+        self.is_dir = is_dir
+        self.is_file = is_file
+
+    def get_filemode(self) -> str:
+        """
+        Retrieve the POSIX file mode string for the entry.
+        :return: POSIX permission string.
+        :rtype: str
+        """
+        return filemode(self.mode)
+
+    def is_real_directory(self) -> bool:
+        """
+        Determine whether the entry is a directory that is not reached through a link.
+        :return: Flag indicating if the entry can be descended into safely.
+        :rtype: bool
+        """
+        return S_ISDIR(self.mode)
@@ -1,4 +1,8 @@
 import logging
+import sys
+from typing import BinaryIO
+
+from src.utils.copy_utils import CopyUtils
 
 
 class Logger:
@@ -48,6 +52,40 @@ class Logger:
         """
         print(message)
 
+    def write(self, message: str) -> None:
+        """
+        Write a message to standard output without a trailing newline.
+        :param message: Message to write.
+        :type message: str
+        :return: None
+        :rtype: None
+        """
+        print(message, end="", flush=True)
+
+    def write_bytes(self, data: bytes) -> None:
+        """
+        Write raw bytes to standard output.
+        :param data: Bytes to write.
+        :type data: bytes
+        :return: None
+        :rtype: None
+        """
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    def write_stream(self, stream: BinaryIO) -> None:
+        """
+        Copy a binary stream to standard output as is, without decoding it.
+        :param stream: Stream opened in binary mode.
+        :type stream: BinaryIO
+        :return: None
+        :rtype: None
+        """
+        sys.stdout.flush()
+        CopyUtils.send_stream(stream, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+
     def error(self, message: str) -> None:
         """
         Log an error message.
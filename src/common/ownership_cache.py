@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+from src.utils.path_utils import PathUtils
+
+
+class OwnershipCache:
+    max_size: int
+    ttl: float
+    _owners: OrderedDict[int, tuple[str, float]]
+    _groups: OrderedDict[int, tuple[str, float]]
+    _lock: Lock
+
+    MAX_SIZE = 4096
+    TTL_SECONDS = 300.0
+
+    def __init__(self, max_size: int = MAX_SIZE, ttl: float = TTL_SECONDS):
+        """
+        Initialize the session cache of uid and gid names.
+        :param max_size: Maximum number of names kept per kind.
+        :type max_size: int
+        :param ttl: Number of seconds a resolved name stays valid.
+        :type ttl: float
+        :return: None
+        :rtype: None
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._owners = OrderedDict()
+        self._groups = OrderedDict()
+        self._lock = Lock()
+
+    def get_owner(self, uid: int) -> str:
+        """
+        Retrieve the user name for a uid, resolving it only on a cache miss.
+        :param uid: Numeric user identifier.
+        :type uid: int
+        :return: User name.
+        :rtype: str
+        """
+        return self._get(self._owners, uid, PathUtils.get_owner_name)
+
+    def get_group(self, gid: int) -> str:
+        """
+        Retrieve the group name for a gid, resolving it only on a cache miss.
+        :param gid: Numeric group identifier.
+        :type gid: int
+        :return: Group name.
+        :rtype: str
+        """
+        return self._get(self._groups, gid, PathUtils.get_group_name)
+
+    def _get(self, names: OrderedDict[int, tuple[str, float]], identifier: int, resolve: Callable[[int], str]) -> str:
+        """
+        Look up a name in the given table evicting expired and least recently used entries.
+        :param names: Table to search.
+        :type names: OrderedDict[int, tuple[str, float]]
+        :param identifier: Numeric identifier to resolve.
+        :type identifier: int
+        :param resolve: Resolver used on a cache miss.
+        :type resolve: Callable[[int], str]
+        :return: Resolved name.
+        :rtype: str
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = names.get(identifier)
+            if cached is not None and cached[1] > now:
+                names.move_to_end(identifier)
+                return cached[0]
+
+        name = resolve(identifier)
+        with self._lock:
+            names[identifier] = (name, now + self.ttl)
+            names.move_to_end(identifier)
+            while len(names) > self.max_size:
+                names.popitem(last=False)
+        return name
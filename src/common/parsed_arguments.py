@@ -1,26 +1,34 @@
+from typing import Optional
+
+
 class ParsedArguments:
     position_arguments: list[str]
     options_without_argument: set[str]
     options_with_argument: dict[str, str]
+    options_arguments_sequence: list[tuple[str, str]]
 
     def __init__(self,
                  position_arguments: list[str],
                  options_without_arguments: set[str],
-                 options_with_arguments: dict[str, str]):
+                 options_with_arguments: dict[str, str],
+                 options_arguments_sequence: Optional[list[tuple[str, str]]] = None):
         """
         Initialize the parsed arguments container.
         :param position_arguments: Collected positional arguments.
         :type position_arguments: list[str]
         :param options_without_arguments: Options provided without values.
         :type options_without_arguments: set[str]
-        :param options_with_arguments: Options mapped to their argument values.
+        :param options_with_arguments: Options mapped to their last argument values.
         :type options_with_arguments: dict[str, str]
+        :param options_arguments_sequence: Every option argument in input order, including repeated ones.
+        :type options_arguments_sequence: Optional[list[tuple[str, str]]]
         :return: None
         :rtype: None
         """
         self.position_arguments = position_arguments
         self.options_without_argument = options_without_arguments
         self.options_with_argument = options_with_arguments
+        self.options_arguments_sequence = options_arguments_sequence if options_arguments_sequence is not None else []
 
     def get_position_arguments(self) -> list[str]:
         """
@@ -46,6 +54,14 @@ class ParsedArguments:
         """
         return self.options_with_argument
 
+    def get_options_arguments_sequence(self) -> list[tuple[str, str]]:
+        """
+        Retrieve every option argument in input order.
+        :return: Pairs of option names and argument values.
+        :rtype: list[tuple[str, str]]
+        """
+        return self.options_arguments_sequence
+
     def __eq__(self, other):
         """
         Compare parsed arguments instances for equality.
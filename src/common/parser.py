@@ -21,6 +21,7 @@ class Parser:
     position_arguments: list[str]
     options_without_arguments: set[str]
     options_with_arguments: dict[str, str]
+    options_arguments_sequence: list[tuple[str, str]]
 
     BEGINNING_OPTION_CHAR = '-'
     POSITIONAL_POINT = "--"
@@ -43,7 +44,10 @@ class Parser:
             self._parse_arguments()
             self._next()
 
-        return ParsedArguments(self.position_arguments, self.options_without_arguments, self.options_with_arguments)
+        return ParsedArguments(self.position_arguments,
+                               self.options_without_arguments,
+                               self.options_with_arguments,
+                               self.options_arguments_sequence)
 
     def _parse_option_for_dict(self, available_options: set[Option]) -> None:
         """
@@ -130,6 +134,7 @@ class Parser:
         if self._is_option(self._get_current()):
             raise NotArgumentForOptionException(self._get_current())
         self.options_with_arguments[option] = self._get_current()
+        self.options_arguments_sequence.append((option, self._get_current()))
 
     def _parse_single_option(self, option: str) -> None:
         """
@@ -355,6 +360,7 @@ class Parser:
         self.position_arguments = list()
         self.options_without_arguments = set()
         self.options_with_arguments = dict()
+        self.options_arguments_sequence = list()
         self.is_next_position = False
         self._options_by_short_name = {}
         self._options_by_full_name = {}
\ No newline at end of file
@@ -5,12 +5,15 @@ from src.commands.command_cat import CommandCat
 from src.commands.command_cd import CommandCD
 from src.commands.command_cp import CommandCP
 from src.commands.command_grep import CommandGrep
+from src.commands.command_head import CommandHead
 from src.commands.command_history import CommandHistory
 from src.commands.command_ls import CommandLS
 from src.commands.command_mv import CommandMV
 from src.commands.command_rm import CommandRM
+from src.commands.command_tail import CommandTail
 from src.commands.command_tar import CommandTAR
 from src.commands.command_undo import CommandUndo
+from src.commands.command_wc import CommandWC
 from src.commands.command_zip import CommandZIP
 from src.common.logger import Logger
 from src.common.parser import Parser
@@ -49,12 +52,15 @@ class CommandFactoryImp(AbstractCommandFactory):
         "ls": CommandLS,
         "cd": CommandCD,
         "cat": CommandCat,
+        "head": CommandHead,
+        "tail": CommandTail,
         "cp": CommandCP,
         "mv": CommandMV,
         "rm": CommandRM,
         "tar": CommandTAR,
         "zip": CommandZIP,
         "grep": CommandGrep,
+        "wc": CommandWC,
         "history": CommandHistory,
         "undo": CommandUndo
     }
@@ -0,0 +1,106 @@
+import bz2
+import gzip
+import io
+import lzma
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+class ArchiveUtils:
+    MEMBER_SEPARATOR = "!"
+    BUFFER_SIZE = 64 * 1024
+    TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+    ZIP_SUFFIXES = (".zip",)
+    COMPRESSED_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+    READ_ERRORS = (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile, lzma.LZMAError)
+
+    @staticmethod
+    def is_archive(path: Path) -> bool:
+        """
+        Determine by the name whether the file is compressed or bundles other files.
+        :param path: File path to check.
+        :type path: Path
+        :return: Flag indicating if the file is read through decompression.
+        :rtype: bool
+        """
+        return ArchiveUtils.is_bundle(path) or path.suffix.lower() in ArchiveUtils.COMPRESSED_OPENERS
+
+    @staticmethod
+    def is_bundle(path: Path) -> bool:
+        """
+        Determine by the name whether the file is a tar or zip archive of several members.
+        :param path: File path to check.
+        :type path: Path
+        :return: Flag indicating if the file consists of members.
+        :rtype: bool
+        """
+        name = path.name.lower()
+        return name.endswith(ArchiveUtils.TAR_SUFFIXES) or name.endswith(ArchiveUtils.ZIP_SUFFIXES)
+
+    @staticmethod
+    def iterate_members(path: Path) -> Iterator[tuple[str, BinaryIO]]:
+        """
+        Lazily open every regular file stored in the archive as a decompressing stream.
+        Members are read in place one after another, nothing is extracted to disk.
+        A compressed single file is its own only member.
+        :param path: Archive path.
+        :type path: Path
+        :return: Iterator over display names 'archive!member' and peekable member streams.
+        :rtype: Iterator[tuple[str, BinaryIO]]
+        """
+        name = path.name.lower()
+        if name.endswith(ArchiveUtils.TAR_SUFFIXES):
+            yield from ArchiveUtils._iterate_tar_members(path)
+        elif name.endswith(ArchiveUtils.ZIP_SUFFIXES):
+            yield from ArchiveUtils._iterate_zip_members(path)
+        else:
+            with ArchiveUtils.COMPRESSED_OPENERS[path.suffix.lower()](path, "rb") as stream:
+                yield str(path), io.BufferedReader(stream, ArchiveUtils.BUFFER_SIZE)
+
+    @staticmethod
+    def get_member_name(path: Path, member: str) -> str:
+        """
+        Compose the name under which a member is reported.
+        :param path: Archive path.
+        :type path: Path
+        :param member: Name of the member inside the archive.
+        :type member: str
+        :return: Name in the 'archive!member' form.
+        :rtype: str
+        """
+        return f"{path}{ArchiveUtils.MEMBER_SEPARATOR}{member}"
+
+    @staticmethod
+    def _iterate_tar_members(path: Path) -> Iterator[tuple[str, BinaryIO]]:
+        """
+        Stream the members of a possibly compressed tar archive in a single pass.
+        :param path: Archive path.
+        :type path: Path
+        :return: Iterator over display names and member streams.
+        :rtype: Iterator[tuple[str, BinaryIO]]
+        """
+        with tarfile.open(path, "r|*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                with tar.extractfile(member) as stream:
+                    yield ArchiveUtils.get_member_name(path, member.name), stream
+
+    @staticmethod
+    def _iterate_zip_members(path: Path) -> Iterator[tuple[str, BinaryIO]]:
+        """
+        Open the members of a zip archive one by one.
+        :param path: Archive path.
+        :type path: Path
+        :return: Iterator over display names and member streams.
+        :rtype: Iterator[tuple[str, BinaryIO]]
+        """
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as stream:
+                    yield (ArchiveUtils.get_member_name(path, info.filename),
+                           io.BufferedReader(stream, ArchiveUtils.BUFFER_SIZE))
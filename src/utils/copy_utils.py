@@ -0,0 +1,443 @@
+import errno
+import hashlib
+import io
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from src.utils.rate_limiter import RateLimiter
+from src.utils.sparse_utils import SparseUtils
+
+
+class CopyUtils:
+    CHUNK_SIZE = 8 * 1024 * 1024
+    HASH_ALGORITHM = "blake2b"
+    FALLBACK_ERRNOS = frozenset({errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.EXDEV})
+
+    @staticmethod
+    def copy_file(src: Path,
+                  dest: Path,
+                  chunk_size: Optional[int] = None,
+                  is_copy_stat: bool = False,
+                  limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy the content of a file and its permission bits or all its metadata.
+        The data goes through send_stream, so on Linux it is usually copied by
+        the kernel without passing through user space. Of a sparse file only the
+        data regions are copied and the holes are recreated at the destination.
+        :param src: Source file.
+        :type src: Path
+        :param dest: Destination file path.
+        :type dest: Path
+        :param chunk_size: Number of bytes moved at once, the default chunk size if None.
+        :type chunk_size: Optional[int]
+        :param is_copy_stat: Flag indicating whether times and flags are copied as well, like shutil.copy2.
+        :type is_copy_stat: bool
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of copied bytes, without the holes of a sparse file.
+        :rtype: int
+        """
+        if os.path.exists(dest) and os.path.samefile(src, dest):
+            raise shutil.SameFileError(f"{src} and {dest} are the same file")
+        with open(src, "rb") as source, open(dest, "wb") as destination:
+            source_stat = os.fstat(source.fileno())
+            if SparseUtils.is_sparse(source_stat):
+                copied = CopyUtils._copy_sparse(source.fileno(), destination.fileno(), source_stat.st_size,
+                                                chunk_size or CopyUtils.CHUNK_SIZE, limiter)
+            else:
+                copied = CopyUtils.send_stream(source, destination, chunk_size, limiter)
+        if is_copy_stat:
+            shutil.copystat(src, dest)
+        else:
+            shutil.copymode(src, dest)
+        return copied
+
+    @staticmethod
+    def link_file(src: Path, dest: Path) -> None:
+        """
+        Make the destination another name of the source file instead of copying its data.
+        An existing destination is replaced, like a copied file overwrites it.
+        :param src: Source file.
+        :type src: Path
+        :param dest: Destination file path, on the same filesystem as the source.
+        :type dest: Path
+        :return: None
+        :rtype: None
+        """
+        try:
+            os.link(src, dest)
+        except FileExistsError:
+            if os.path.samefile(src, dest):
+                return
+            os.unlink(dest)
+            os.link(src, dest)
+
+    @staticmethod
+    def is_up_to_date(src: Path, dest: Path, is_checksum: bool = False) -> bool:
+        """
+        Determine whether the destination already holds a copy of the source file.
+        By default the files are considered equal when their sizes and
+        modification times match, which needs only two stat calls. With the
+        checksum flag the times are ignored and the content hashes are compared
+        instead, for files of the same size.
+        :param src: Source file.
+        :type src: Path
+        :param dest: Destination file path.
+        :type dest: Path
+        :param is_checksum: Flag indicating whether the content is compared instead of the times.
+        :type is_checksum: bool
+        :return: Flag indicating if copying the file can be skipped.
+        :rtype: bool
+        """
+        try:
+            dest_stat = os.stat(dest)
+        except FileNotFoundError:
+            return False
+        src_stat = os.stat(src)
+        if src_stat.st_size != dest_stat.st_size:
+            return False
+        if not is_checksum:
+            return src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+        return CopyUtils.get_file_digest(src) == CopyUtils.get_file_digest(dest)
+
+    @staticmethod
+    def get_file_digest(path: Path) -> bytes:
+        """
+        Hash the content of a file.
+        :param path: File to hash.
+        :type path: Path
+        :return: Digest of the content.
+        :rtype: bytes
+        """
+        with open(path, "rb") as stream:
+            return hashlib.file_digest(stream, CopyUtils.HASH_ALGORITHM).digest()
+
+    @staticmethod
+    def send_stream(source: BinaryIO,
+                    destination: BinaryIO,
+                    chunk_size: Optional[int] = None,
+                    limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy the rest of the source stream to the destination stream without decoding it.
+        When both ends are backed by file descriptors the bytes are moved by the
+        kernel, with copy_file_range between files and with sendfile where the
+        former is refused. Otherwise, and from the point the kernel gives up,
+        they go through one reusable buffer of the chunk size. With a limiter no
+        call moves more than the limiter allows at once.
+        :param source: Stream opened in binary mode for reading.
+        :type source: BinaryIO
+        :param destination: Stream opened in binary mode for writing.
+        :type destination: BinaryIO
+        :param chunk_size: Number of bytes moved at once, the default chunk size if None.
+        :type chunk_size: Optional[int]
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of copied bytes.
+        :rtype: int
+        """
+        chunk_size = CopyUtils._get_chunk_size(chunk_size or CopyUtils.CHUNK_SIZE, limiter)
+        copied = 0
+        source_fd = CopyUtils._get_fileno(source)
+        destination_fd = CopyUtils._get_fileno(destination)
+        if source_fd is not None and destination_fd is not None:
+            destination.flush()
+            offset = source.tell()
+            if hasattr(os, "copy_file_range"):
+                copied += CopyUtils._copy_file_range(source_fd, destination_fd, offset, chunk_size, limiter)
+            if hasattr(os, "sendfile"):
+                copied += CopyUtils._send_file(source_fd, destination_fd, offset + copied, chunk_size, limiter)
+            source.seek(offset + copied)
+        return copied + CopyUtils._copy_buffered(source, destination, chunk_size, limiter)
+
+    @staticmethod
+    def _copy_sparse(source_fd: int,
+                     destination_fd: int,
+                     size: int,
+                     chunk_size: int,
+                     limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy only the data regions of a sparse file to the same offsets of the destination.
+        The destination is extended to the full size at the end, so the holes
+        between the regions and after the last one stay unallocated.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the empty destination file.
+        :type destination_fd: int
+        :param size: Size of the source file.
+        :type size: int
+        :param chunk_size: Number of bytes copied by one call.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of copied bytes.
+        :rtype: int
+        """
+        copied = 0
+        buffer = bytearray(CopyUtils._get_chunk_size(chunk_size, limiter))
+        for offset, length in SparseUtils.iterate_data_regions(source_fd, size):
+            copied += CopyUtils.copy_range(source_fd, destination_fd, offset, offset + length, buffer, limiter) - offset
+        os.ftruncate(destination_fd, size)
+        return copied
+
+    @staticmethod
+    def copy_range(source_fd: int,
+                   destination_fd: int,
+                   offset: int,
+                   end: int,
+                   buffer: bytearray,
+                   limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy a region of a file to the same offsets of the destination file.
+        The region is copied with copy_file_range where possible and through the
+        buffer with positioned reads and writes otherwise, so neither file
+        position is used.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Start of the region.
+        :type offset: int
+        :param end: End of the region.
+        :type end: int
+        :param buffer: Reusable buffer, whose size is also the number of bytes copied by one call.
+        :type buffer: bytearray
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Offset reached, short of the end when the source shrank.
+        :rtype: int
+        """
+        if hasattr(os, "copy_file_range"):
+            offset = CopyUtils._copy_file_range_at(source_fd, destination_fd, offset, end, len(buffer), limiter)
+        if offset < end:
+            offset = CopyUtils._copy_positioned(source_fd, destination_fd, offset, end, buffer, limiter)
+        return offset
+
+    @staticmethod
+    def _copy_file_range_at(source_fd: int,
+                            destination_fd: int,
+                            offset: int,
+                            end: int,
+                            chunk_size: int,
+                            limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy a region with copy_file_range to the same offset of the destination.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Start of the region.
+        :type offset: int
+        :param end: End of the region.
+        :type end: int
+        :param chunk_size: Number of bytes copied by one call.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Offset reached, short of the end when the call is not supported for the descriptors.
+        :rtype: int
+        """
+        while offset < end:
+            try:
+                sent = os.copy_file_range(source_fd, destination_fd, min(chunk_size, end - offset), offset, offset)
+            except OSError as error:
+                if error.errno in CopyUtils.FALLBACK_ERRNOS:
+                    return offset
+                raise
+            if sent == 0:
+                return offset
+            CopyUtils._consume(limiter, sent)
+            offset += sent
+        return offset
+
+    @staticmethod
+    def _copy_positioned(source_fd: int,
+                         destination_fd: int,
+                         offset: int,
+                         end: int,
+                         buffer: bytearray,
+                         limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy a region through the buffer with positioned reads and writes.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Start of the region.
+        :type offset: int
+        :param end: End of the region.
+        :type end: int
+        :param buffer: Reusable buffer.
+        :type buffer: bytearray
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Offset reached, short of the end when the source shrank.
+        :rtype: int
+        """
+        view = memoryview(buffer)
+        while offset < end:
+            size = os.preadv(source_fd, [view[:min(len(view), end - offset)]], offset)
+            if size == 0:
+                return offset
+            CopyUtils.write_at(destination_fd, view[:size], offset)
+            CopyUtils._consume(limiter, size)
+            offset += size
+        return offset
+
+    @staticmethod
+    def write_at(fd: int, data: memoryview, offset: int) -> None:
+        """
+        Write all the data at an offset of a file, repeating short writes.
+        :param fd: Descriptor of the file.
+        :type fd: int
+        :param data: Data to write.
+        :type data: memoryview
+        :param offset: Position in the file.
+        :type offset: int
+        :return: None
+        :rtype: None
+        """
+        written = 0
+        while written < len(data):
+            written += os.pwrite(fd, data[written:], offset + written)
+
+    @staticmethod
+    def _copy_file_range(source_fd: int,
+                         destination_fd: int,
+                         offset: int,
+                         chunk_size: int,
+                         limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy bytes between files with copy_file_range until the end of the source.
+        The destination is written at its current position.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Position in the source to start from.
+        :type offset: int
+        :param chunk_size: Number of bytes copied by one call.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of copied bytes, possibly short when the call is not supported for the descriptors.
+        :rtype: int
+        """
+        copied = 0
+        while True:
+            try:
+                sent = os.copy_file_range(source_fd, destination_fd, chunk_size, offset + copied)
+            except OSError as error:
+                if error.errno in CopyUtils.FALLBACK_ERRNOS:
+                    return copied
+                raise
+            if sent == 0:
+                return copied
+            CopyUtils._consume(limiter, sent)
+            copied += sent
+
+    @staticmethod
+    def _send_file(source_fd: int,
+                   destination_fd: int,
+                   offset: int,
+                   chunk_size: int,
+                   limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Move bytes between file descriptors with sendfile until the end of the source.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination.
+        :type destination_fd: int
+        :param offset: Position in the source to start from.
+        :type offset: int
+        :param chunk_size: Number of bytes moved by one call.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of moved bytes, possibly short when sendfile is not supported for the descriptors.
+        :rtype: int
+        """
+        copied = 0
+        while True:
+            try:
+                sent = os.sendfile(destination_fd, source_fd, offset + copied, chunk_size)
+            except OSError as error:
+                if error.errno in CopyUtils.FALLBACK_ERRNOS:
+                    return copied
+                raise
+            if sent == 0:
+                return copied
+            CopyUtils._consume(limiter, sent)
+            copied += sent
+
+    @staticmethod
+    def _copy_buffered(source: BinaryIO,
+                       destination: BinaryIO,
+                       chunk_size: int,
+                       limiter: Optional[RateLimiter] = None) -> int:
+        """
+        Copy the rest of the source through a single preallocated buffer.
+        :param source: Stream opened in binary mode for reading.
+        :type source: BinaryIO
+        :param destination: Stream opened in binary mode for writing.
+        :type destination: BinaryIO
+        :param chunk_size: Size of the buffer.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of copied bytes.
+        :rtype: int
+        """
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        copied = 0
+        while size := source.readinto(buffer):
+            destination.write(view[:size])
+            CopyUtils._consume(limiter, size)
+            copied += size
+        return copied
+
+    @staticmethod
+    def _get_chunk_size(chunk_size: int, limiter: Optional[RateLimiter]) -> int:
+        """
+        Reduce the number of bytes moved by one call to what the limiter allows at once.
+        :param chunk_size: Preferred number of bytes.
+        :type chunk_size: int
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Number of bytes to move by one call.
+        :rtype: int
+        """
+        return limiter.get_chunk_size(chunk_size) if limiter is not None else chunk_size
+
+    @staticmethod
+    def _consume(limiter: Optional[RateLimiter], amount: int):
+        """
+        Account for moved bytes, waiting as long as the limiter requires.
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :param amount: Number of moved bytes.
+        :type amount: int
+        :return: None
+        :rtype: None
+        """
+        if limiter is not None:
+            limiter.consume(amount)
+
+    @staticmethod
+    def _get_fileno(stream: BinaryIO) -> Optional[int]:
+        """
+        Retrieve the file descriptor of a stream reading or writing an OS file directly.
+        Wrappers such as decompressing readers expose the descriptor of the
+        underlying file, whose bytes differ from the stream content, so only plain
+        file objects qualify.
+        :param stream: Stream to inspect.
+        :type stream: BinaryIO
+        :return: File descriptor or None when the stream has no usable one.
+        :rtype: Optional[int]
+        """
+        raw = getattr(stream, "raw", stream)
+        if not isinstance(raw, io.FileIO) or raw.closed:
+            return None
+        return raw.fileno()
@@ -0,0 +1,42 @@
+from pathlib import Path
+from typing import BinaryIO
+
+
+class CountUtils:
+    CHUNK_SIZE = 1024 * 1024
+    LINE_SEPARATOR = b"\n"
+    WHITESPACE = b" \t\n\r\x0b\x0c"
+
+    @staticmethod
+    def count_file(file: Path) -> tuple[int, int, int]:
+        """
+        Count lines, words and bytes of a file; safe to run in a worker process.
+        :param file: File path to inspect.
+        :type file: Path
+        :return: Numbers of lines, words and bytes.
+        :rtype: tuple[int, int, int]
+        """
+        with file.open("rb") as stream:
+            return CountUtils.count_stream(stream)
+
+    @staticmethod
+    def count_stream(stream: BinaryIO) -> tuple[int, int, int]:
+        """
+        Count lines, words and bytes of a stream in fixed-size chunks.
+        Lines and words are counted by bytes.count and bytes.split over whole
+        chunks, a word cut by a chunk boundary is counted once.
+        :param stream: Stream opened in binary mode.
+        :type stream: BinaryIO
+        :return: Numbers of lines, words and bytes.
+        :rtype: tuple[int, int, int]
+        """
+        lines = words = size = 0
+        is_inside_word = False
+        while chunk := stream.read(CountUtils.CHUNK_SIZE):
+            lines += chunk.count(CountUtils.LINE_SEPARATOR)
+            words += len(chunk.split())
+            if is_inside_word and chunk[0] not in CountUtils.WHITESPACE:
+                words -= 1
+            is_inside_word = chunk[-1] not in CountUtils.WHITESPACE
+            size += len(chunk)
+        return lines, words, size
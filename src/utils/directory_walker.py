@@ -0,0 +1,130 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from src.common.entry_record import EntryRecord
+from src.utils.path_utils import PathUtils
+
+
+class DirectoryWalker:
+    include_hidden: bool
+    max_depth: Optional[int]
+    max_workers: Optional[int]
+    on_error: Optional[Callable[[Path, OSError], None]]
+
+    MAX_PENDING_PER_WORKER = 4
+
+    def __init__(self,
+                 include_hidden: bool,
+                 max_depth: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 on_error: Optional[Callable[[Path, OSError], None]] = None):
+        """
+        Initialize the parallel directory walker.
+        :param include_hidden: Flag indicating whether hidden entries are read and descended into.
+        :type include_hidden: bool
+        :param max_depth: Deepest level to descend to, None for unlimited.
+        :type max_depth: Optional[int]
+        :param max_workers: Number of scanning threads, None for the executor default.
+        :type max_workers: Optional[int]
+        :param on_error: Callback for directories that could not be read, None to raise.
+        :type on_error: Optional[Callable[[Path, OSError], None]]
+        :return: None
+        :rtype: None
+        """
+        self.include_hidden = include_hidden
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+        self.on_error = on_error
+
+    def walk(self, root: Path) -> Iterator[tuple[Path, list[EntryRecord]]]:
+        """
+        Walk the tree under root scanning subdirectories concurrently.
+        Directories are yielded in pre-order with entries sorted by name, so the
+        result does not depend on thread scheduling. Only the next few
+        directories of the pre-order are scanned ahead, so memory does not grow
+        with the width of the tree.
+        :param root: Directory to start from.
+        :type root: Path
+        :return: Iterator over directories and their sorted entry records.
+        :rtype: Iterator[tuple[Path, list[EntryRecord]]]
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        max_pending = (self.max_workers or os.cpu_count() or 1) * DirectoryWalker.MAX_PENDING_PER_WORKER
+        try:
+            stack: list[tuple[Path, int, Optional[Future]]] = [(root, 0, None)]
+            pending = 0
+            while stack:
+                pending = self._submit_scans(executor, stack, pending, max_pending)
+                directory, depth, future = stack.pop()
+                pending -= 1
+                records = self._get_records(directory, future)
+                if records is None:
+                    continue
+
+                if self.max_depth is None or depth < self.max_depth:
+                    stack.extend(
+                        (Path(record.path), depth + 1, None)
+                        for record in reversed(records) if record.is_real_directory()
+                    )
+                yield directory, records
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_scans(self,
+                      executor: ThreadPoolExecutor,
+                      stack: list[tuple[Path, int, Optional[Future]]],
+                      pending: int,
+                      max_pending: int) -> int:
+        """
+        Schedule scans of the directories nearest to the top of the stack until the window is full.
+        :param executor: Executor running the scans.
+        :type executor: ThreadPoolExecutor
+        :param stack: Directories waiting to be yielded with their depths and scheduled scans.
+        :type stack: list[tuple[Path, int, Optional[Future]]]
+        :param pending: Number of scans scheduled for the directories on the stack.
+        :type pending: int
+        :param max_pending: Largest number of scans scheduled at once.
+        :type max_pending: int
+        :return: Number of scans scheduled after this call.
+        :rtype: int
+        """
+        index = len(stack) - 1
+        while pending < max_pending and index >= 0:
+            directory, depth, future = stack[index]
+            if future is None:
+                stack[index] = (directory, depth, executor.submit(self._scan, directory))
+                pending += 1
+            index -= 1
+        return pending
+
+    def _scan(self, directory: Path) -> list[EntryRecord]:
+        """
+        Read a single directory and sort its records by name.
+        :param directory: Directory to read.
+        :type directory: Path
+        :return: Sorted entry records.
+        :rtype: list[EntryRecord]
+        """
+        records = PathUtils.scan_directory(directory, self.include_hidden)
+        records.sort(key=lambda record: record.name)
+        return records
+
+    def _get_records(self, directory: Path, future: Future) -> Optional[list[EntryRecord]]:
+        """
+        Wait for a scheduled scan and report read failures.
+        :param directory: Directory that was scanned.
+        :type directory: Path
+        :param future: Pending scan result.
+        :type future: Future
+        :return: Entry records or None when the directory could not be read.
+        :rtype: Optional[list[EntryRecord]]
+        """
+        try:
+            return future.result()
+        except OSError as exception:
+            if self.on_error is None:
+                raise
+            self.on_error(directory, exception)
+            return None
@@ -0,0 +1,237 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+
+class AbstractWatcher(ABC):
+    @abstractmethod
+    def wait(self, is_changed: bool):
+        """
+        Block until the followed file has probably changed.
+        :param is_changed: Flag indicating whether the previous wait was followed by new data.
+        :type is_changed: bool
+        :return: None
+        :rtype: None
+        """
+        pass
+
+    def close(self):
+        """
+        Release the resources of the watcher.
+        :return: None
+        :rtype: None
+        """
+        pass
+
+
+class InotifyWatcher(AbstractWatcher):
+    fd: int
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = os.O_CLOEXEC
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENTS_BUFFER_SIZE = 64 * 1024
+    TIMEOUT = 1.0
+
+    def __init__(self, fd: int):
+        """
+        Initialize the watcher over an inotify descriptor.
+        :param fd: Inotify descriptor with the directory watch added.
+        :type fd: int
+        :return: None
+        :rtype: None
+        """
+        self.fd = fd
+
+    @staticmethod
+    def create(path: Path) -> Optional["InotifyWatcher"]:
+        """
+        Watch the directory of the file, so that a rotated file is noticed as well.
+        :param path: Followed file.
+        :type path: Path
+        :return: Watcher or None when inotify is not available.
+        :rtype: Optional[InotifyWatcher]
+        """
+        library_name = ctypes.util.find_library("c")
+        try:
+            libc = ctypes.CDLL(library_name, use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None
+
+        inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = inotify_init1(InotifyWatcher.IN_NONBLOCK | InotifyWatcher.IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if inotify_add_watch(fd, os.fsencode(path.parent), InotifyWatcher.WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return InotifyWatcher(fd)
+
+    def wait(self, is_changed: bool):
+        """
+        Sleep until the directory reports an event, waking up periodically as a safety net.
+        :param is_changed: Flag indicating whether the previous wait was followed by new data.
+        :type is_changed: bool
+        :return: None
+        :rtype: None
+        """
+        readable, _, _ = select.select([self.fd], [], [], InotifyWatcher.TIMEOUT)
+        if readable:
+            try:
+                while os.read(self.fd, InotifyWatcher.EVENTS_BUFFER_SIZE):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        """
+        Close the inotify descriptor.
+        :return: None
+        :rtype: None
+        """
+        os.close(self.fd)
+
+
+class PollingWatcher(AbstractWatcher):
+    interval: float
+
+    MIN_INTERVAL = 0.05
+    MAX_INTERVAL = 1.0
+    BACKOFF_FACTOR = 2
+
+    def __init__(self):
+        """
+        Initialize the polling watcher with the shortest interval.
+        :return: None
+        :rtype: None
+        """
+        self.interval = PollingWatcher.MIN_INTERVAL
+
+    def wait(self, is_changed: bool):
+        """
+        Sleep for an interval that grows while the file stays unchanged and resets on new data.
+        :param is_changed: Flag indicating whether the previous wait was followed by new data.
+        :type is_changed: bool
+        :return: None
+        :rtype: None
+        """
+        if is_changed:
+            self.interval = PollingWatcher.MIN_INTERVAL
+        else:
+            self.interval = min(self.interval * PollingWatcher.BACKOFF_FACTOR, PollingWatcher.MAX_INTERVAL)
+        time.sleep(self.interval)
+
+
+class FileFollower:
+    path: Path
+    offset: int
+    watcher: AbstractWatcher
+    is_stopped: bool
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, path: Path, offset: int, watcher: Optional[AbstractWatcher] = None):
+        """
+        Initialize the follower of a growing file.
+        :param path: File to follow.
+        :type path: Path
+        :param offset: Position to start reading from.
+        :type offset: int
+        :param watcher: Change detector, inotify when available and adaptive polling otherwise if None.
+        :type watcher: Optional[AbstractWatcher]
+        :return: None
+        :rtype: None
+        """
+        self.path = path
+        self.offset = offset
+        self.watcher = watcher or InotifyWatcher.create(path) or PollingWatcher()
+        self.is_stopped = False
+
+    def follow(self, output: Callable[[bytes], None]):
+        """
+        Output the bytes appended to the file until stopped or interrupted with Ctrl-C.
+        Only new bytes are read. When the name starts pointing to another inode
+        the old file is drained and the new one is read from its beginning, a
+        truncated file is read again from its beginning.
+        :param output: Consumer of the appended bytes.
+        :type output: Callable[[bytes], None]
+        :return: None
+        :rtype: None
+        """
+        stream = open(self.path, "rb", buffering=0)
+        stream.seek(self.offset)
+        try:
+            while not self.is_stopped:
+                is_changed = FileFollower._drain(stream, output)
+                if os.fstat(stream.fileno()).st_size < stream.tell():
+                    stream.seek(0)
+                    is_changed = True
+                if self._is_rotated(stream):
+                    try:
+                        rotated_stream = open(self.path, "rb", buffering=0)
+                    except FileNotFoundError:
+                        self.watcher.wait(is_changed)
+                        continue
+                    FileFollower._drain(stream, output)
+                    stream.close()
+                    stream = rotated_stream
+                    continue
+                self.watcher.wait(is_changed)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stream.close()
+            self.watcher.close()
+
+    def stop(self):
+        """
+        Ask the follower to return after the current wait.
+        :return: None
+        :rtype: None
+        """
+        self.is_stopped = True
+
+    def _is_rotated(self, stream: BinaryIO) -> bool:
+        """
+        Determine whether the followed name has been replaced by another file.
+        :param stream: Currently opened file.
+        :type stream: BinaryIO
+        :return: Flag indicating if a new file exists under the name.
+        :rtype: bool
+        """
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(stream.fileno())
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+
+    @staticmethod
+    def _drain(stream: BinaryIO, output: Callable[[bytes], None]) -> bool:
+        """
+        Output everything available in the file from the current position.
+        :param stream: Opened file.
+        :type stream: BinaryIO
+        :param output: Consumer of the read bytes.
+        :type output: Callable[[bytes], None]
+        :return: Flag indicating if anything was read.
+        :rtype: bool
+        """
+        is_read = False
+        while chunk := stream.read(FileFollower.CHUNK_SIZE):
+            output(chunk)
+            is_read = True
+        return is_read
@@ -0,0 +1,134 @@
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterator
+
+from src.utils.gitignore_rules import GitignoreRules
+
+
+class FileWalker:
+    include: list[str]
+    exclude: list[str]
+    exclude_dirs: list[str]
+    is_gitignore: bool
+
+    GIT_DIRECTORY = ".git"
+
+    def __init__(self,
+                 include: list[str],
+                 exclude: list[str],
+                 exclude_dirs: list[str],
+                 is_gitignore: bool):
+        """
+        Initialize the pruning file walker.
+        :param include: Globs of file names to keep, empty to keep every file.
+        :type include: list[str]
+        :param exclude: Globs of file names to skip.
+        :type exclude: list[str]
+        :param exclude_dirs: Globs of directory names that are never entered.
+        :type exclude_dirs: list[str]
+        :param is_gitignore: Flag indicating whether .gitignore files are honoured.
+        :type is_gitignore: bool
+        :return: None
+        :rtype: None
+        """
+        self.include = include
+        self.exclude = exclude
+        self.exclude_dirs = exclude_dirs
+        self.is_gitignore = is_gitignore
+
+    def walk(self, root: Path) -> Iterator[Path]:
+        """
+        Lazily yield files below root applying the rules while walking.
+        Excluded directories are pruned before they are opened, and entry types
+        come from scandir, so no file is stat-ed just to be classified.
+        :param root: Directory to walk.
+        :type root: Path
+        :return: Iterator over the files kept by the rules.
+        :rtype: Iterator[Path]
+        """
+        stack = [(str(root), self._get_rules(str(root), []))]
+        while stack:
+            directory, rules = stack.pop()
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._is_directory_kept(entry, rules):
+                                subdirectories.append(entry.path)
+                        elif entry.is_file() and self._is_file_kept(entry, rules):
+                            yield Path(entry.path)
+            except OSError:
+                continue
+            for subdirectory in reversed(subdirectories):
+                stack.append((subdirectory, self._get_rules(subdirectory, rules)))
+
+    def _get_rules(self, directory: str, parent_rules: list[GitignoreRules]) -> list[GitignoreRules]:
+        """
+        Extend the inherited .gitignore rules with the rules of the directory.
+        :param directory: Directory being entered.
+        :type directory: str
+        :param parent_rules: Rules inherited from the ancestors.
+        :type parent_rules: list[GitignoreRules]
+        :return: Rules applying inside the directory.
+        :rtype: list[GitignoreRules]
+        """
+        if not self.is_gitignore:
+            return parent_rules
+        rules = GitignoreRules.from_directory(directory)
+        if rules is None:
+            return parent_rules
+        return parent_rules + [rules]
+
+    def _is_directory_kept(self, entry: os.DirEntry, rules: list[GitignoreRules]) -> bool:
+        """
+        Determine whether a subdirectory has to be entered.
+        :param entry: Directory entry of the subdirectory.
+        :type entry: os.DirEntry
+        :param rules: .gitignore rules applying to the entry.
+        :type rules: list[GitignoreRules]
+        :return: Flag indicating if the subdirectory is walked.
+        :rtype: bool
+        """
+        if any(fnmatchcase(entry.name, glob) for glob in self.exclude_dirs):
+            return False
+        if self.is_gitignore and entry.name == FileWalker.GIT_DIRECTORY:
+            return False
+        return not FileWalker._is_ignored(entry, True, rules)
+
+    def _is_file_kept(self, entry: os.DirEntry, rules: list[GitignoreRules]) -> bool:
+        """
+        Determine whether a file has to be searched.
+        :param entry: Directory entry of the file.
+        :type entry: os.DirEntry
+        :param rules: .gitignore rules applying to the entry.
+        :type rules: list[GitignoreRules]
+        :return: Flag indicating if the file is yielded.
+        :rtype: bool
+        """
+        if self.include and not any(fnmatchcase(entry.name, glob) for glob in self.include):
+            return False
+        if any(fnmatchcase(entry.name, glob) for glob in self.exclude):
+            return False
+        return not FileWalker._is_ignored(entry, False, rules)
+
+    @staticmethod
+    def _is_ignored(entry: os.DirEntry, is_directory: bool, rules: list[GitignoreRules]) -> bool:
+        """
+        Apply .gitignore rules from the outermost to the innermost one.
+        :param entry: Directory entry to check.
+        :type entry: os.DirEntry
+        :param is_directory: Flag indicating whether the entry is a directory.
+        :type is_directory: bool
+        :param rules: .gitignore rules applying to the entry.
+        :type rules: list[GitignoreRules]
+        :return: Flag indicating if the entry is ignored.
+        :rtype: bool
+        """
+        is_ignored = False
+        for current_rules in rules:
+            result = current_rules.match(entry.path, entry.name, is_directory)
+            if result is not None:
+                is_ignored = result
+        return is_ignored
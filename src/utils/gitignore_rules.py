@@ -0,0 +1,136 @@
+import re
+from pathlib import Path
+from typing import Optional
+
+
+class GitignoreRules:
+    base: str
+    rules: list[tuple[re.Pattern, bool, bool, bool]]
+
+    FILE_NAME = ".gitignore"
+    COMMENT_CHAR = "#"
+    NEGATION_CHAR = "!"
+    SEPARATOR = "/"
+
+    def __init__(self, base: str, lines: list[str]):
+        """
+        Initialize the rules of a single .gitignore file.
+        :param base: Directory containing the .gitignore file.
+        :type base: str
+        :param lines: Lines of the .gitignore file.
+        :type lines: list[str]
+        :return: None
+        :rtype: None
+        """
+        self.base = base
+        self.rules = []
+        for line in lines:
+            rule = GitignoreRules._parse_line(line)
+            if rule is not None:
+                self.rules.append(rule)
+
+    @staticmethod
+    def from_directory(directory: str) -> Optional["GitignoreRules"]:
+        """
+        Read the .gitignore file of a directory if there is one.
+        :param directory: Directory to look into.
+        :type directory: str
+        :return: Parsed rules or None when the directory has no readable .gitignore.
+        :rtype: Optional[GitignoreRules]
+        """
+        try:
+            lines = (Path(directory) / GitignoreRules.FILE_NAME).read_text(errors="ignore").splitlines()
+        except OSError:
+            return None
+        rules = GitignoreRules(directory, lines)
+        return rules if len(rules.rules) > 0 else None
+
+    def match(self, path: str, name: str, is_directory: bool) -> Optional[bool]:
+        """
+        Apply the rules to an entry below the base directory; the last matching rule wins.
+        :param path: Full path of the entry.
+        :type path: str
+        :param name: Final path component of the entry.
+        :type name: str
+        :param is_directory: Flag indicating whether the entry is a directory.
+        :type is_directory: bool
+        :return: True when ignored, False when re-included by a negation, None when no rule matches.
+        :rtype: Optional[bool]
+        """
+        relative_path = path[len(self.base) + 1:]
+        result = None
+        for pattern, is_anchored, is_directory_only, is_negated in self.rules:
+            if is_directory_only and not is_directory:
+                continue
+            if pattern.match(relative_path if is_anchored else name) is not None:
+                result = not is_negated
+        return result
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[tuple[re.Pattern, bool, bool, bool]]:
+        """
+        Parse a single .gitignore line.
+        :param line: Line to parse.
+        :type line: str
+        :return: Compiled pattern with anchored, directory-only and negation flags or None for blank lines.
+        :rtype: Optional[tuple[re.Pattern, bool, bool, bool]]
+        """
+        line = line.rstrip()
+        if line == "" or line.startswith(GitignoreRules.COMMENT_CHAR):
+            return None
+
+        is_negated = line.startswith(GitignoreRules.NEGATION_CHAR)
+        if is_negated:
+            line = line[1:]
+        is_directory_only = line.endswith(GitignoreRules.SEPARATOR)
+        line = line.rstrip(GitignoreRules.SEPARATOR)
+        if line == "":
+            return None
+
+        is_anchored = GitignoreRules.SEPARATOR in line
+        line = line.lstrip(GitignoreRules.SEPARATOR)
+        return re.compile(GitignoreRules._translate(line) + r"\Z"), is_anchored, is_directory_only, is_negated
+
+    @staticmethod
+    def _translate(glob: str) -> str:
+        """
+        Convert a gitignore glob into a regular expression.
+        :param glob: Glob to convert.
+        :type glob: str
+        :return: Regular expression source equivalent to the glob.
+        :rtype: str
+        """
+        result = []
+        index = 0
+        length = len(glob)
+        while index < length:
+            char = glob[index]
+            if glob.startswith("**/", index) and (index == 0 or glob[index - 1] == GitignoreRules.SEPARATOR):
+                result.append("(?:.*/)?")
+                index += 3
+                continue
+            if glob.startswith("**", index):
+                result.append(".*")
+                index += 2
+                continue
+            if char == "*":
+                result.append("[^/]*")
+            elif char == "?":
+                result.append("[^/]")
+            elif char == "[":
+                closing = glob.find("]", index + 2)
+                if closing == -1:
+                    result.append(re.escape(char))
+                else:
+                    content = glob[index + 1:closing].replace("\\", "\\\\")
+                    if content.startswith("!"):
+                        content = "^" + content[1:]
+                    result.append(f"[{content}]")
+                    index = closing
+            elif char == "\\" and index + 1 < length:
+                index += 1
+                result.append(re.escape(glob[index]))
+            else:
+                result.append(re.escape(char))
+            index += 1
+        return "".join(result)
@@ -0,0 +1,68 @@
+import os
+from typing import BinaryIO, Iterator
+
+
+class LineUtils:
+    LINE_SEPARATOR = b"\n"
+    BLOCK_SIZE = 64 * 1024
+
+    @staticmethod
+    def iterate_head_chunks(stream: BinaryIO, count: int) -> Iterator[bytes]:
+        """
+        Yield the beginning of a stream up to the end of its count-th line.
+        Reading stops in the block containing that line, so the cost depends on
+        the length of the lines only and not on the size of the file.
+        :param stream: Stream opened in binary mode.
+        :type stream: BinaryIO
+        :param count: Number of lines to yield.
+        :type count: int
+        :return: Iterator over consecutive chunks of the first lines.
+        :rtype: Iterator[bytes]
+        """
+        remaining = count
+        while remaining > 0 and (chunk := stream.read(LineUtils.BLOCK_SIZE)):
+            found = chunk.count(LineUtils.LINE_SEPARATOR)
+            if found < remaining:
+                remaining -= found
+                yield chunk
+                continue
+            position = -1
+            for _ in range(remaining):
+                position = chunk.find(LineUtils.LINE_SEPARATOR, position + 1)
+            yield chunk[:position + 1]
+            return
+
+    @staticmethod
+    def find_tail_offset(stream: BinaryIO, count: int) -> int:
+        """
+        Find where the last count lines of a seekable stream start.
+        Blocks are read backwards from the end until enough line separators are
+        found, a separator terminating the last line does not start a new one.
+        :param stream: Seekable stream opened in binary mode.
+        :type stream: BinaryIO
+        :param count: Number of lines to keep.
+        :type count: int
+        :return: Offset of the first byte of the last lines.
+        :rtype: int
+        """
+        size = stream.seek(0, os.SEEK_END)
+        if count == 0 or size == 0:
+            return size
+
+        end = size
+        stream.seek(size - 1)
+        if stream.read(1) == LineUtils.LINE_SEPARATOR:
+            end -= 1
+
+        remaining = count
+        while end > 0:
+            start = max(0, end - LineUtils.BLOCK_SIZE)
+            stream.seek(start)
+            block = stream.read(end - start)
+            position = len(block)
+            while (position := block.rfind(LineUtils.LINE_SEPARATOR, 0, position)) != -1:
+                remaining -= 1
+                if remaining == 0:
+                    return start + position + 1
+            end = start
+        return 0
@@ -0,0 +1,148 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class AbstractMatcher(ABC):
+    NOT_FOUND = (-1, -1)
+
+    @abstractmethod
+    def find_span(self, text: str, position: int) -> tuple[int, int]:
+        """
+        Find the bounds of the first occurrence at or after the position.
+        :param text: Buffer to search.
+        :type text: str
+        :param position: Index to start searching from.
+        :type position: int
+        :return: Start and end of the occurrence or (-1, -1) when there is none.
+        :rtype: tuple[int, int]
+        """
+        pass
+
+    def find(self, text: str, position: int) -> int:
+        """
+        Find the start of the first occurrence at or after the position.
+        :param text: Buffer to search.
+        :type text: str
+        :param position: Index to start searching from.
+        :type position: int
+        :return: Index of the occurrence or -1 when there is none.
+        :rtype: int
+        """
+        return self.find_span(text, position)[0]
+
+
+class RegexMatcher(AbstractMatcher):
+    pattern: re.Pattern
+
+    def __init__(self, pattern: re.Pattern):
+        """
+        Initialize the matcher backed by the regular expression engine.
+        :param pattern: Compiled search pattern.
+        :type pattern: re.Pattern
+        :return: None
+        :rtype: None
+        """
+        self.pattern = pattern
+
+    def find_span(self, text: str, position: int) -> tuple[int, int]:
+        """
+        Find the first regular expression match at or after the position.
+        :param text: Buffer to search.
+        :type text: str
+        :param position: Index to start searching from.
+        :type position: int
+        :return: Start and end of the match or (-1, -1) when there is none.
+        :rtype: tuple[int, int]
+        """
+        match = self.pattern.search(text, position)
+        if match is None:
+            return AbstractMatcher.NOT_FOUND
+        return match.span()
+
+
+class LiteralMatcher(AbstractMatcher):
+    literal: str
+
+    def __init__(self, literal: str):
+        """
+        Initialize the matcher for a single plain string.
+        :param literal: String to search for.
+        :type literal: str
+        :return: None
+        :rtype: None
+        """
+        self.literal = literal
+
+    def find_span(self, text: str, position: int) -> tuple[int, int]:
+        """
+        Find the literal with the substring search of str.
+        :param text: Buffer to search.
+        :type text: str
+        :param position: Index to start searching from.
+        :type position: int
+        :return: Start and end of the occurrence or (-1, -1) when there is none.
+        :rtype: tuple[int, int]
+        """
+        start = text.find(self.literal, position)
+        if start == -1:
+            return AbstractMatcher.NOT_FOUND
+        return start, start + len(self.literal)
+
+
+class MultiLiteralMatcher(AbstractMatcher):
+    literals: list[str]
+    _text: Optional[str]
+    _last_position: int
+    _next_positions: list[int]
+
+    UNKNOWN_POSITION = -2
+
+    def __init__(self, literals: list[str]):
+        """
+        Initialize the matcher for several plain strings.
+        :param literals: Strings to search for.
+        :type literals: list[str]
+        :return: None
+        :rtype: None
+        """
+        self.literals = literals
+        self._text = None
+        self._last_position = 0
+        self._next_positions = []
+
+    def find_span(self, text: str, position: int) -> tuple[int, int]:
+        """
+        Find the earliest occurrence of any literal.
+        The next occurrence of every literal is remembered while the buffer is
+        searched forward and looked up again only once the position moves past it,
+        so each literal scans the buffer about once in total.
+        :param text: Buffer to search.
+        :type text: str
+        :param position: Index to start searching from.
+        :type position: int
+        :return: Start and end of the earliest occurrence or (-1, -1) when there is none.
+        :rtype: tuple[int, int]
+        """
+        if text is not self._text or position < self._last_position:
+            self._text = text
+            self._next_positions = [MultiLiteralMatcher.UNKNOWN_POSITION] * len(self.literals)
+        self._last_position = position
+
+        earliest = AbstractMatcher.NOT_FOUND
+        for number, literal in enumerate(self.literals):
+            next_position = self._next_positions[number]
+            if next_position != -1 and next_position < position:
+                next_position = text.find(literal, position)
+                self._next_positions[number] = next_position
+            if next_position != -1 and (earliest[0] == -1 or next_position < earliest[0]):
+                earliest = next_position, next_position + len(literal)
+        return earliest
+
+    def __getstate__(self) -> dict:
+        """
+        Drop the cached buffer when the matcher is sent to a worker process.
+        :return: Picklable state of the matcher.
+        :rtype: dict
+        """
+        return {"literals": self.literals, "_text": None, "_last_position": 0, "_next_positions": []}
@@ -1,11 +1,17 @@
+import grp
+import io
 import os
+import pwd
 import shutil
 import tarfile
 import zipfile
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from stat import filemode
+from typing import BinaryIO, Callable, Iterator, Optional
 
+from src.common.entry_record import EntryRecord
 from src.exception.command_exception import (
     NotAccessToReadException,
     NotAccessToWriteException,
@@ -14,6 +20,11 @@ from src.exception.command_exception import (
     NotTypeFileException,
 )
 from src.exception.path_utils_exception import InvalidPathException
+from src.utils.copy_utils import CopyUtils
+from src.utils.rate_limiter import RateLimiter, ThrottledStream
+from src.utils.resumable_copier import ResumableCopier
+from src.utils.sparse_utils import SparseUtils
+from src.utils.tree_copier import CopyStatistics, TreeCopier
 
 
 class PathUtils:
@@ -177,30 +188,191 @@ class PathUtils:
         return list(path.iterdir())
 
     @staticmethod
-    def copy_file(src_path: Path, dest_path: Path) -> None:
+    def scan_directory(path: Path, include_hidden: bool) -> list[EntryRecord]:
         """
-        Copy a file from the source path to the destination path.
+        Read a directory in a single scandir pass taking one lstat per entry.
+        :param path: Directory path to inspect.
+        :type path: Path
+        :param include_hidden: Flag indicating whether hidden entries are kept.
+        :type include_hidden: bool
+        :return: Records describing the directory entries.
+        :rtype: list[EntryRecord]
+        """
+        return list(PathUtils.iterate_directory(path, include_hidden))
+
+    @staticmethod
+    def iterate_directory(path: Path, include_hidden: bool) -> Iterator[EntryRecord]:
+        """
+        Lazily yield records for a directory while it is being read.
+        :param path: Directory path to inspect.
+        :type path: Path
+        :param include_hidden: Flag indicating whether hidden entries are kept.
+        :type include_hidden: bool
+        :return: Iterator over records describing the directory entries.
+        :rtype: Iterator[EntryRecord]
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not include_hidden and entry.name.startswith("."):
+                    continue
+                yield PathUtils.get_entry_record(entry)
+
+    @staticmethod
+    def get_entry_record(entry: os.DirEntry) -> EntryRecord:
+        """
+        Build a compact record for a scandir entry.
+        :param entry: Directory entry produced by os.scandir.
+        :type entry: os.DirEntry
+        :return: Record holding the entry metadata.
+        :rtype: EntryRecord
+        """
+        stat_result = entry.stat(follow_symlinks=False)
+        return EntryRecord(
+            entry.name,
+            entry.path,
+            stat_result.st_mode,
+            stat_result.st_nlink,
+            stat_result.st_uid,
+            stat_result.st_gid,
+            stat_result.st_size,
+            stat_result.st_mtime,
+            stat_result.st_ctime,
+            entry.is_dir(),
+            entry.is_file(),
+        )
+
+    @staticmethod
+    def get_owner_name(uid: int) -> str:
+        """
+        Resolve a numeric user identifier to the user name.
+        :param uid: Numeric user identifier.
+        :type uid: int
+        :return: User name or the identifier itself when it is unknown.
+        :rtype: str
+        """
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            return str(uid)
+
+    @staticmethod
+    def get_group_name(gid: int) -> str:
+        """
+        Resolve a numeric group identifier to the group name.
+        :param gid: Numeric group identifier.
+        :type gid: int
+        :return: Group name or the identifier itself when it is unknown.
+        :rtype: str
+        """
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return str(gid)
+
+    @staticmethod
+    def copy_file(src_path: Path,
+                  dest_path: Path,
+                  chunk_size: Optional[int] = None,
+                  is_update: bool = False,
+                  is_checksum: bool = False,
+                  is_link: bool = False,
+                  is_resume: bool = False,
+                  is_verify: bool = False,
+                  limiter: Optional[RateLimiter] = None) -> CopyStatistics:
+        """
+        Copy a file from the source path to the destination path with its permission bits.
+        In update mode an up to date destination is left as is and the times are
+        copied as well, so that the next update can recognize the copy. In link
+        mode the destination becomes a hardlink to the source instead. In resume
+        mode the copy keeps a checkpoint, so that an interrupted copy continues.
         :param src_path: Source file path.
         :type src_path: Path
-        :param dest_path: Destination file path.
+        :param dest_path: Destination file path or directory to copy into.
         :type dest_path: Path
-        :return: None
-        :rtype: None
-        """
-        shutil.copy(src_path, dest_path)
+        :param chunk_size: Number of bytes moved at once, None for the default.
+        :type chunk_size: Optional[int]
+        :param is_update: Flag indicating whether an up to date destination is skipped.
+        :type is_update: bool
+        :param is_checksum: Flag indicating whether up to date files are recognized by content instead of times.
+        :type is_checksum: bool
+        :param is_link: Flag indicating whether the destination is hardlinked instead of copied.
+        :type is_link: bool
+        :param is_resume: Flag indicating whether the copy is resumable.
+        :type is_resume: bool
+        :param is_verify: Flag indicating whether the chunks of a resumable copy are hashed and verified.
+        :type is_verify: bool
+        :param limiter: Limiter of the rate the copies are written at, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Numbers of copied and skipped files and bytes.
+        :rtype: CopyStatistics
+        """
+        if dest_path.is_dir():
+            dest_path = dest_path / src_path.name
+        statistics = CopyStatistics()
+        if is_update and CopyUtils.is_up_to_date(src_path, dest_path, is_checksum):
+            statistics.add_file(False, src_path.stat().st_size)
+        else:
+            if is_link:
+                CopyUtils.link_file(src_path, dest_path)
+            elif is_resume:
+                ResumableCopier(chunk_size, is_verify, is_update, limiter).copy(src_path, dest_path)
+            else:
+                CopyUtils.copy_file(src_path, dest_path, chunk_size, is_update, limiter)
+            statistics.add_file(True, src_path.stat().st_size)
+        return statistics
 
     @staticmethod
-    def copytree(src_path: Path, dest_path: Path) -> None:
-        """
-        Copy a directory tree from source to destination.
+    def copytree(src_path: Path,
+                 dest_path: Path,
+                 max_workers: Optional[int] = None,
+                 on_error: Optional[Callable[[Path, OSError], None]] = None,
+                 chunk_size: Optional[int] = None,
+                 is_update: bool = False,
+                 is_checksum: bool = False,
+                 is_link: bool = False,
+                 is_resume: bool = False,
+                 is_verify: bool = False,
+                 limiter: Optional[RateLimiter] = None) -> CopyStatistics:
+        """
+        Copy a directory tree from source to destination copying files in parallel.
+        In update mode files whose destination is up to date are not rewritten.
+        Files hardlinked to each other are copied once and linked in the copy,
+        and in link mode all files are hardlinked to the source instead of copied.
+        In resume mode every file is copied resumably.
         :param src_path: Source directory path.
         :type src_path: Path
         :param dest_path: Destination directory path.
         :type dest_path: Path
-        :return: None
-        :rtype: None
-        """
-        shutil.copytree(src_path, dest_path, dirs_exist_ok=True)
+        :param max_workers: Number of copying threads, None for the default.
+        :type max_workers: Optional[int]
+        :param on_error: Callback for entries that could not be copied, None to raise.
+        :type on_error: Optional[Callable[[Path, OSError], None]]
+        :param chunk_size: Number of bytes moved at once, None for the default.
+        :type chunk_size: Optional[int]
+        :param is_update: Flag indicating whether up to date destination files are skipped.
+        :type is_update: bool
+        :param is_checksum: Flag indicating whether up to date files are recognized by content instead of times.
+        :type is_checksum: bool
+        :param is_link: Flag indicating whether files are hardlinked instead of copied.
+        :type is_link: bool
+        :param is_resume: Flag indicating whether files are copied resumably.
+        :type is_resume: bool
+        :param is_verify: Flag indicating whether the chunks of resumable copies are hashed and verified.
+        :type is_verify: bool
+        :param limiter: Limiter of the rate shared by all copying threads, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Numbers of copied, linked and skipped files and bytes and of failed entries.
+        :rtype: CopyStatistics
+        """
+        if is_link:
+            copy_function = CopyUtils.link_file
+        elif is_resume:
+            copy_function = ResumableCopier(chunk_size, is_verify, is_copy_stat=True, limiter=limiter).copy
+        else:
+            copy_function = partial(CopyUtils.copy_file, chunk_size=chunk_size, is_copy_stat=True, limiter=limiter)
+        skip_function = partial(CopyUtils.is_up_to_date, is_checksum=is_checksum) if is_update else None
+        copier = TreeCopier(max_workers, on_error, copy_function, skip_function, is_preserve_links=True)
+        return copier.copy(src_path, dest_path)
 
     @staticmethod
     def is_file(path: Path) -> bool:
@@ -260,17 +432,23 @@ class PathUtils:
             raise NotAccessToWriteException(str(path))
 
     @staticmethod
-    def move(src: Path, dest: Path) -> None:
+    def move(src: Path, dest: Path, chunk_size: Optional[int] = None, limiter: Optional[RateLimiter] = None) -> None:
         """
         Move a filesystem entry from the source path to the destination path.
+        Across filesystems the data is copied with the kernel-side copy backend.
         :param src: Source filesystem path.
         :type src: Path
         :param dest: Destination filesystem path.
         :type dest: Path
+        :param chunk_size: Number of bytes moved at once when copying, None for the default.
+        :type chunk_size: Optional[int]
+        :param limiter: Limiter of the rate the data is written at when copying, None for no limit.
+        :type limiter: Optional[RateLimiter]
         :return: None
         :rtype: None
         """
-        shutil.move(src, dest)
+        copy_function = partial(CopyUtils.copy_file, chunk_size=chunk_size, is_copy_stat=True, limiter=limiter)
+        shutil.move(src, dest, copy_function=copy_function)
 
     @staticmethod
     def remove(src: Path) -> None:
@@ -310,61 +488,115 @@ class PathUtils:
             raise NotEnoughPermissionToRemoveException(str(path))
 
     @staticmethod
-    def create_tar_archive(archive_name: str, files: list[Path]) -> None:
+    def create_tar_archive(archive_name: str, files: list[Path], limiter: Optional[RateLimiter] = None) -> None:
         """
         Create a gzipped tar archive from the provided files.
+        Directories are added recursively, and sparse files are stored with only
+        their data regions.
         :param archive_name: Name of the archive to create.
         :type archive_name: str
         :param files: Files to include in the archive.
         :type files: list[Path]
+        :param limiter: Limiter of the rate the archive is written at, None for no limit.
+        :type limiter: Optional[RateLimiter]
         :return: None
         :rtype: None
         """
-        with tarfile.open(archive_name, "w:gz") as tar:
+        with (open(archive_name, "wb") as stream,
+              tarfile.open(archive_name, "w:gz", PathUtils._throttle(stream, limiter),
+                           format=tarfile.PAX_FORMAT) as tar):
             for file in files:
-                tar.add(file, arcname=file.name)
+                PathUtils._add_to_tar(tar, file, file.name)
+
+    @staticmethod
+    def _add_to_tar(tar: tarfile.TarFile, path: Path, arcname: str) -> None:
+        """
+        Add a filesystem entry to the archive like TarFile.add, storing sparse files sparsely.
+        :param tar: Archive opened for writing.
+        :type tar: tarfile.TarFile
+        :param path: Entry to add.
+        :type path: Path
+        :param arcname: Name of the entry in the archive.
+        :type arcname: str
+        :return: None
+        :rtype: None
+        """
+        if tar.name is not None and os.path.abspath(path) == tar.name:
+            return
+        tarinfo = tar.gettarinfo(path, arcname)
+        if tarinfo is None:
+            return
+        if tarinfo.isreg():
+            if SparseUtils.is_sparse(os.stat(path)) and SparseUtils.add_tar_member(tar, tarinfo, path):
+                return
+            with open(path, "rb") as stream:
+                tar.addfile(tarinfo, stream)
+        elif tarinfo.isdir():
+            tar.addfile(tarinfo)
+            for name in sorted(os.listdir(path)):
+                PathUtils._add_to_tar(tar, path / name, f"{arcname}/{name}")
+        else:
+            tar.addfile(tarinfo)
 
     @staticmethod
-    def untar_archive(archive_name: str) -> None:
+    def untar_archive(archive_name: str, limiter: Optional[RateLimiter] = None) -> None:
         """
         Extract the contents of a gzipped tar archive.
         :param archive_name: Name of the archive to extract.
         :type archive_name: str
+        :param limiter: Limiter of the rate the archive is read at, None for no limit.
+        :type limiter: Optional[RateLimiter]
         :return: None
         :rtype: None
         """
-        with tarfile.open(archive_name, "r:gz") as tar:
+        with open(archive_name, "rb") as stream, tarfile.open(archive_name, "r:gz",
+                                                              PathUtils._throttle(stream, limiter)) as tar:
             tar.extractall()
 
     @staticmethod
-    def create_zip_archive(archive_name: str, files: list[Path]) -> None:
+    def create_zip_archive(archive_name: str, files: list[Path], limiter: Optional[RateLimiter] = None) -> None:
         """
         Create a ZIP archive from the provided files.
         :param archive_name: Name of the archive to create.
         :type archive_name: str
         :param files: Files to include in the archive.
         :type files: list[Path]
+        :param limiter: Limiter of the rate the archive is written at, None for no limit.
+        :type limiter: Optional[RateLimiter]
         :return: None
         :rtype: None
         """
-        with zipfile.ZipFile(archive_name, "w") as zip:
+        with open(archive_name, "wb") as stream, zipfile.ZipFile(PathUtils._throttle(stream, limiter), "w") as zip:
             for file in files:
                 zip.write(file, arcname=file.name)
 
     @staticmethod
-    def unzip_archive(archive_name: str) -> None:
+    def unzip_archive(archive_name: str, limiter: Optional[RateLimiter] = None) -> None:
         """
         Extract the contents of a ZIP archive.
         :param archive_name: Name of the archive to extract.
         :type archive_name: str
+        :param limiter: Limiter of the rate the archive is read at, None for no limit.
+        :type limiter: Optional[RateLimiter]
         :return: None
         :rtype: None
         """
-        with zipfile.ZipFile(archive_name, "r") as zip:
+        with open(archive_name, "rb") as stream, zipfile.ZipFile(PathUtils._throttle(stream, limiter), "r") as zip:
             zip.extractall()
 
     @staticmethod
-    def get_all_files_in_path(path: Path) -> list[Path]:
-        return list(
-            [cur_path for cur_path in path.rglob("*") if cur_path.is_file()]
-        )
\ No newline at end of file
+    def _throttle(stream: BinaryIO, limiter: Optional[RateLimiter]) -> BinaryIO:
+        """
+        Pass the bytes read from or written to an archive file through the rate limiter.
+        :param stream: Archive file opened in binary mode.
+        :type stream: BinaryIO
+        :param limiter: Limiter of the transfer rate, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: Stream to hand to tarfile or zipfile.
+        :rtype: BinaryIO
+        """
+        if limiter is None:
+            return stream
+        if stream.readable():
+            return io.BufferedReader(ThrottledStream(stream, limiter))
+        return ThrottledStream(stream, limiter)
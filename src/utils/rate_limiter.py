@@ -0,0 +1,161 @@
+import io
+import threading
+import time
+from typing import BinaryIO
+
+
+class RateLimiter:
+    rate: int
+    capacity: int
+    tokens: float
+    updated: float
+    lock: threading.Lock
+
+    BURST_SECONDS = 0.1
+    MIN_CAPACITY = 4096
+
+    def __init__(self, rate: int):
+        """
+        Initialize a token bucket limiting the number of bytes per second.
+        The bucket holds at most a tenth of a second of transfer, so pauses are
+        short and frequent rather than long and rare.
+        :param rate: Allowed number of bytes per second.
+        :type rate: int
+        :return: None
+        :rtype: None
+        """
+        self.rate = rate
+        self.capacity = max(int(rate * RateLimiter.BURST_SECONDS), RateLimiter.MIN_CAPACITY)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def get_chunk_size(self, chunk_size: int) -> int:
+        """
+        Limit the number of bytes moved by one call to what the bucket can hold.
+        :param chunk_size: Preferred number of bytes.
+        :type chunk_size: int
+        :return: Number of bytes to move at once.
+        :rtype: int
+        """
+        return min(chunk_size, self.capacity)
+
+    def consume(self, amount: int):
+        """
+        Take tokens for transferred bytes and sleep until the bucket is no longer in debt.
+        The bucket is shared by all threads, each of which waits for its own
+        part of the debt, so their total stays at the rate.
+        :param amount: Number of transferred bytes.
+        :type amount: int
+        :return: None
+        :rtype: None
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            delay = -self.tokens / self.rate
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ThrottledStream(io.RawIOBase):
+    stream: BinaryIO
+    limiter: RateLimiter
+
+    def __init__(self, stream: BinaryIO, limiter: RateLimiter):
+        """
+        Initialize a wrapper passing the bytes read from or written to a stream through a rate limiter.
+        :param stream: Wrapped binary stream, which stays open after the wrapper is closed.
+        :type stream: BinaryIO
+        :param limiter: Limiter of the transfer rate.
+        :type limiter: RateLimiter
+        :return: None
+        :rtype: None
+        """
+        super().__init__()
+        self.stream = stream
+        self.limiter = limiter
+
+    def readable(self) -> bool:
+        """
+        Report whether the wrapped stream supports reading.
+        :return: Flag indicating if the stream is readable.
+        :rtype: bool
+        """
+        return self.stream.readable()
+
+    def writable(self) -> bool:
+        """
+        Report whether the wrapped stream supports writing.
+        :return: Flag indicating if the stream is writable.
+        :rtype: bool
+        """
+        return self.stream.writable()
+
+    def seekable(self) -> bool:
+        """
+        Report whether the wrapped stream supports random access.
+        :return: Flag indicating if the stream is seekable.
+        :rtype: bool
+        """
+        return self.stream.seekable()
+
+    def readinto(self, buffer) -> int:
+        """
+        Read into the buffer at most one bucket of bytes at the limited rate.
+        :param buffer: Writable buffer.
+        :type buffer: Buffer
+        :return: Number of read bytes.
+        :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        size = self.stream.readinto(view[:self.limiter.get_chunk_size(len(view))])
+        self.limiter.consume(size)
+        return size
+
+    def write(self, data) -> int:
+        """
+        Write all the data at the limited rate, one bucket of bytes at a time.
+        :param data: Bytes to write.
+        :type data: Buffer
+        :return: Number of written bytes.
+        :rtype: int
+        """
+        view = memoryview(data).cast("B")
+        chunk_size = max(self.limiter.get_chunk_size(len(view)), 1)
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start:start + chunk_size]
+            self.stream.write(chunk)
+            self.limiter.consume(len(chunk))
+        return len(view)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move the position of the wrapped stream.
+        :param offset: Offset relative to whence.
+        :type offset: int
+        :param whence: Reference point of the offset.
+        :type whence: int
+        :return: New position.
+        :rtype: int
+        """
+        return self.stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        """
+        Report the position of the wrapped stream.
+        :return: Current position.
+        :rtype: int
+        """
+        return self.stream.tell()
+
+    def flush(self):
+        """
+        Flush the wrapped stream unless it has already been closed by its owner.
+        :return: None
+        :rtype: None
+        """
+        if not self.stream.closed:
+            self.stream.flush()
@@ -0,0 +1,244 @@
+import errno
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, TextIO
+
+from src.utils.copy_utils import CopyUtils
+from src.utils.rate_limiter import RateLimiter
+
+
+class ResumableCopier:
+    chunk_size: int
+    is_checksum: bool
+    is_copy_stat: bool
+    limiter: Optional[RateLimiter]
+
+    CHECKPOINT_SUFFIX = ".checkpoint"
+    VERSION = 1
+    HASH_ALGORITHM = "blake2b"
+
+    def __init__(self,
+                 chunk_size: Optional[int] = None,
+                 is_checksum: bool = False,
+                 is_copy_stat: bool = False,
+                 limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the copier of large files that can continue an interrupted copy.
+        :param chunk_size: Size of the chunks recorded in the checkpoint, the default chunk size if None.
+        :type chunk_size: Optional[int]
+        :param is_checksum: Flag indicating whether every chunk is hashed and verified before a resume relies on it.
+        :type is_checksum: bool
+        :param is_copy_stat: Flag indicating whether times and flags are copied as well, like shutil.copy2.
+        :type is_copy_stat: bool
+        :param limiter: Limiter of the rate the destination is written at, None for no limit.
+        :type limiter: Optional[RateLimiter]
+        :return: None
+        :rtype: None
+        """
+        self.chunk_size = chunk_size or CopyUtils.CHUNK_SIZE
+        self.is_checksum = is_checksum
+        self.is_copy_stat = is_copy_stat
+        self.limiter = limiter
+
+    @staticmethod
+    def get_checkpoint_path(dest: Path) -> Path:
+        """
+        Build the path of the checkpoint kept next to a destination file.
+        :param dest: Destination file path.
+        :type dest: Path
+        :return: Checkpoint file path.
+        :rtype: Path
+        """
+        return Path(f"{dest}{ResumableCopier.CHECKPOINT_SUFFIX}")
+
+    def copy(self, src: Path, dest: Path) -> int:
+        """
+        Copy a file chunk by chunk, recording every completed chunk in a checkpoint next to the destination.
+        A chunk is recorded only after its data has reached the disk, so after
+        a failure or Ctrl-C the same copy skips the recorded chunks and copies
+        the rest. The checkpoint is discarded when the source has changed, and
+        with checksums a recorded chunk is used only if the destination still
+        holds the hashed data. The checkpoint is removed once the copy is complete.
+        :param src: Source file.
+        :type src: Path
+        :param dest: Destination file path.
+        :type dest: Path
+        :return: Number of bytes copied by this call.
+        :rtype: int
+        """
+        if os.path.exists(dest) and os.path.samefile(src, dest):
+            raise shutil.SameFileError(f"{src} and {dest} are the same file")
+        checkpoint_path = ResumableCopier.get_checkpoint_path(dest)
+        source_stat = os.stat(src)
+        header = self._get_header(source_stat)
+        completed = self._load_checkpoint(checkpoint_path, header) if os.path.exists(dest) else None
+
+        copied = 0
+        buffer = bytearray(self.chunk_size)
+        with (open(src, "rb") as source,
+              open(dest, "r+b" if completed is not None else "wb") as destination,
+              open(checkpoint_path, "a" if completed is not None else "w", encoding="utf-8") as checkpoint):
+            if completed is None:
+                completed = {}
+                checkpoint.write(json.dumps(header) + "\n")
+                checkpoint.flush()
+            destination_size = os.fstat(destination.fileno()).st_size
+            for offset in range(0, source_stat.st_size, self.chunk_size):
+                end = min(offset + self.chunk_size, source_stat.st_size)
+                if offset in completed and end <= destination_size:
+                    if not self.is_checksum or self._is_chunk_intact(destination.fileno(), offset, end,
+                                                                     completed[offset], buffer):
+                        continue
+                digest = self._copy_chunk(source.fileno(), destination.fileno(), offset, end, buffer)
+                os.fdatasync(destination.fileno())
+                self._record_chunk(checkpoint, offset, digest)
+                copied += end - offset
+            os.ftruncate(destination.fileno(), source_stat.st_size)
+
+        if self.is_copy_stat:
+            shutil.copystat(src, dest)
+        else:
+            shutil.copymode(src, dest)
+        os.remove(checkpoint_path)
+        return copied
+
+    def _get_header(self, source_stat: os.stat_result) -> dict:
+        """
+        Describe the source and the chunking, which a checkpoint must match to be resumed.
+        :param source_stat: Status of the source file.
+        :type source_stat: os.stat_result
+        :return: Checkpoint header.
+        :rtype: dict
+        """
+        return {
+            "version": ResumableCopier.VERSION,
+            "size": source_stat.st_size,
+            "mtime_ns": source_stat.st_mtime_ns,
+            "chunk_size": self.chunk_size,
+            "algorithm": ResumableCopier.HASH_ALGORITHM if self.is_checksum else None
+        }
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path, header: dict) -> Optional[dict[int, Optional[str]]]:
+        """
+        Read the chunks recorded by a previous copy of the same source.
+        A line cut short by the interruption is ignored.
+        :param checkpoint_path: Checkpoint file path.
+        :type checkpoint_path: Path
+        :param header: Header the checkpoint must start with.
+        :type header: dict
+        :return: Digests by offsets of the completed chunks, or None when there is no usable checkpoint.
+        :rtype: Optional[dict[int, Optional[str]]]
+        """
+        try:
+            with open(checkpoint_path, encoding="utf-8") as checkpoint:
+                if json.loads(checkpoint.readline()) != header:
+                    return None
+                completed = {}
+                for line in checkpoint:
+                    if not line.endswith("\n"):
+                        break
+                    offset, _, digest = line.rstrip("\n").partition(" ")
+                    completed[int(offset)] = digest or None
+                return completed
+        except (OSError, ValueError):
+            return None
+
+    def _copy_chunk(self, source_fd: int, destination_fd: int, offset: int, end: int,
+                    buffer: bytearray) -> Optional[str]:
+        """
+        Copy one chunk to the same offset of the destination, hashing it when checksums are enabled.
+        :param source_fd: Descriptor of the source file.
+        :type source_fd: int
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Start of the chunk.
+        :type offset: int
+        :param end: End of the chunk.
+        :type end: int
+        :param buffer: Reusable buffer of the chunk size.
+        :type buffer: bytearray
+        :return: Hex digest of the chunk or None without checksums.
+        :rtype: Optional[str]
+        """
+        transfer_size = self.limiter.get_chunk_size(len(buffer)) if self.limiter is not None else len(buffer)
+        if not self.is_checksum:
+            transfer_buffer = memoryview(buffer)[:transfer_size]
+            if CopyUtils.copy_range(source_fd, destination_fd, offset, end, transfer_buffer, self.limiter) < end:
+                raise OSError(errno.EIO, "Source file shrank during the copy")
+            return None
+        data = ResumableCopier._read_chunk(source_fd, offset, end, buffer)
+        if len(data) < end - offset:
+            raise OSError(errno.EIO, "Source file shrank during the copy")
+        for start in range(0, len(data), transfer_size):
+            part = data[start:start + transfer_size]
+            CopyUtils.write_at(destination_fd, part, offset + start)
+            if self.limiter is not None:
+                self.limiter.consume(len(part))
+        return hashlib.new(ResumableCopier.HASH_ALGORITHM, data).hexdigest()
+
+    @staticmethod
+    def _is_chunk_intact(destination_fd: int, offset: int, end: int, digest: Optional[str],
+                         buffer: bytearray) -> bool:
+        """
+        Verify that a recorded chunk of the destination still has its recorded digest.
+        :param destination_fd: Descriptor of the destination file.
+        :type destination_fd: int
+        :param offset: Start of the chunk.
+        :type offset: int
+        :param end: End of the chunk.
+        :type end: int
+        :param digest: Recorded hex digest, None when the chunk was recorded without one.
+        :type digest: Optional[str]
+        :param buffer: Reusable buffer of the chunk size.
+        :type buffer: bytearray
+        :return: Flag indicating if the chunk can be kept.
+        :rtype: bool
+        """
+        if digest is None:
+            return False
+        data = ResumableCopier._read_chunk(destination_fd, offset, end, buffer)
+        return hashlib.new(ResumableCopier.HASH_ALGORITHM, data).hexdigest() == digest
+
+    @staticmethod
+    def _read_chunk(fd: int, offset: int, end: int, buffer: bytearray) -> memoryview:
+        """
+        Read a chunk of a file into the buffer.
+        :param fd: Descriptor of the file.
+        :type fd: int
+        :param offset: Start of the chunk.
+        :type offset: int
+        :param end: End of the chunk.
+        :type end: int
+        :param buffer: Reusable buffer of the chunk size.
+        :type buffer: bytearray
+        :return: View of the read bytes, shorter than the chunk at the end of the file.
+        :rtype: memoryview
+        """
+        view = memoryview(buffer)
+        size = 0
+        while offset + size < end:
+            read = os.preadv(fd, [view[size:end - offset]], offset + size)
+            if read == 0:
+                break
+            size += read
+        return view[:size]
+
+    @staticmethod
+    def _record_chunk(checkpoint: TextIO, offset: int, digest: Optional[str]):
+        """
+        Append a completed chunk to the checkpoint.
+        :param checkpoint: Checkpoint opened for appending.
+        :type checkpoint: TextIO
+        :param offset: Start of the chunk.
+        :type offset: int
+        :param digest: Hex digest of the chunk or None.
+        :type digest: Optional[str]
+        :return: None
+        :rtype: None
+        """
+        checkpoint.write(f"{offset} {digest}\n" if digest is not None else f"{offset}\n")
+        checkpoint.flush()
@@ -0,0 +1,449 @@
+import codecs
+import re
+from collections import deque
+from contextlib import closing
+from io import BufferedReader
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from src.exception.command_exception import InvalidArgumentsException
+from src.utils.archive_utils import ArchiveUtils
+from src.utils.matchers import AbstractMatcher, LiteralMatcher, MultiLiteralMatcher, RegexMatcher
+
+
+class SearchUtils:
+    ENCODING_MODE: str = "utf-8"
+    ERRORS_MODE: str = "ignore"
+    LINE_SEPARATOR = "\n"
+    CARRIAGE_RETURN = "\r"
+    CHUNK_SIZE = 1024 * 1024
+    BINARY_CHECK_SIZE = 8192
+    BINARY_MARKER = b"\x00"
+    REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+    @staticmethod
+    def compile_pattern(pattern: str, ignore_case: bool) -> re.Pattern:
+        """
+        Compile the search pattern once for a whole grep invocation.
+        :param pattern: Regular expression supplied by the user.
+        :type pattern: str
+        :param ignore_case: Flag indicating whether the case is ignored.
+        :type ignore_case: bool
+        :return: Compiled pattern matching line by line.
+        :rtype: re.Pattern
+        """
+        flags = re.MULTILINE
+        if ignore_case:
+            flags |= re.IGNORECASE
+        try:
+            return re.compile(pattern, flags)
+        except re.error:
+            raise InvalidArgumentsException([pattern])
+
+    @staticmethod
+    def compile_matcher(patterns: list[str], ignore_case: bool) -> AbstractMatcher:
+        """
+        Select the fastest matcher able to search for all the patterns.
+        Plain strings are searched with str.find, anything else, as well as a
+        case-insensitive search, goes through a single combined regular expression.
+        :param patterns: Patterns supplied by the user.
+        :type patterns: list[str]
+        :param ignore_case: Flag indicating whether the case is ignored.
+        :type ignore_case: bool
+        :return: Matcher of the patterns.
+        :rtype: AbstractMatcher
+        """
+        if not ignore_case and all(SearchUtils.is_literal(pattern) for pattern in patterns):
+            if len(patterns) == 1:
+                return LiteralMatcher(patterns[0])
+            return MultiLiteralMatcher(list(dict.fromkeys(patterns)))
+
+        for pattern in patterns:
+            SearchUtils.compile_pattern(pattern, ignore_case)
+        combined = "|".join(f"(?:{pattern})" for pattern in patterns)
+        return RegexMatcher(SearchUtils.compile_pattern(combined, ignore_case))
+
+    @staticmethod
+    def is_literal(pattern: str) -> bool:
+        """
+        Determine whether the pattern contains no regular expression syntax.
+        :param pattern: Pattern supplied by the user.
+        :type pattern: str
+        :return: Flag indicating if the pattern is a plain string.
+        :rtype: bool
+        """
+        return not any(char in SearchUtils.REGEX_SPECIAL_CHARS for char in pattern)
+
+    @staticmethod
+    def find_lines(matcher: AbstractMatcher, text: str, first_line_number: int = 1) -> Iterator[tuple[int, str]]:
+        """
+        Search the whole buffer at once and yield every matching line.
+        Line numbers are computed lazily by counting separators only between
+        consecutive matches, so buffers with rare matches cost one scan of the matcher.
+        A match running past the end of its line, for example a pattern matching
+        the separator itself, is checked again against that line alone, so that
+        lines match exactly as they would one by one.
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param text: Buffer consisting of whole lines.
+        :type text: str
+        :param first_line_number: Number of the first line of the buffer.
+        :type first_line_number: int
+        :return: Iterator over line numbers and matching lines.
+        :rtype: Iterator[tuple[int, str]]
+        """
+        position = 0
+        counted_position = 0
+        line_number = first_line_number
+        length = len(text)
+
+        while position < length:
+            match_start, match_end = matcher.find_span(text, position)
+            if match_start == -1:
+                return
+
+            line_start = text.rfind(SearchUtils.LINE_SEPARATOR, 0, match_start) + 1
+            if line_start >= length:
+                return
+            line_end = text.find(SearchUtils.LINE_SEPARATOR, max(match_start, line_start))
+            if line_end == -1:
+                line_end = length
+
+            line = text[line_start:line_end].rstrip(SearchUtils.CARRIAGE_RETURN)
+            position = line_end + 1
+            if match_end > line_start + len(line) and matcher.find(line, 0) == -1:
+                continue
+
+            line_number += text.count(SearchUtils.LINE_SEPARATOR, counted_position, line_start)
+            counted_position = line_start
+            yield line_number, line
+
+    @staticmethod
+    def iterate_text_blocks(stream: BinaryIO) -> Iterator[str]:
+        """
+        Read a binary stream in fixed-size chunks and yield decoded blocks of whole lines.
+        A partial line at the end of a chunk is carried over to the next block.
+        :param stream: Stream opened in binary mode.
+        :type stream: BinaryIO
+        :return: Iterator over decoded blocks ending on a line boundary.
+        :rtype: Iterator[str]
+        """
+        decoder = codecs.getincrementaldecoder(SearchUtils.ENCODING_MODE)(SearchUtils.ERRORS_MODE)
+        carry = []
+        while chunk := stream.read(SearchUtils.CHUNK_SIZE):
+            text = decoder.decode(chunk)
+            cut = text.rfind(SearchUtils.LINE_SEPARATOR) + 1
+            if cut == 0:
+                carry.append(text)
+                continue
+            carry.append(text[:cut])
+            yield "".join(carry)
+            carry = [text[cut:]]
+        carry.append(decoder.decode(b"", final=True))
+        tail = "".join(carry)
+        if tail != "":
+            yield tail
+
+    @staticmethod
+    def iterate_matches(blocks: Iterable[str], matcher: AbstractMatcher) -> Iterator[tuple[int, str]]:
+        """
+        Yield matching lines of consecutive blocks keeping a running line number.
+        :param blocks: Decoded blocks each consisting of whole lines.
+        :type blocks: Iterable[str]
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Iterator over line numbers and matching lines.
+        :rtype: Iterator[tuple[int, str]]
+        """
+        line_number = 1
+        for block in blocks:
+            yield from SearchUtils.find_lines(matcher, block, line_number)
+            line_number += block.count(SearchUtils.LINE_SEPARATOR)
+
+    @staticmethod
+    def iterate_file_matches(file: Path, matcher: AbstractMatcher) -> Iterator[tuple[int, str]]:
+        """
+        Stream a text file in constant memory and yield its matching lines.
+        :param file: File path to inspect.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Iterator over line numbers and matching lines.
+        :rtype: Iterator[tuple[int, str]]
+        """
+        with file.open("rb") as stream:
+            yield from SearchUtils.iterate_matches(SearchUtils.iterate_text_blocks(stream), matcher)
+
+    @staticmethod
+    def iterate_context_lines(blocks: Iterable[str],
+                              matcher: AbstractMatcher,
+                              before: int,
+                              after: int,
+                              max_count: Optional[int] = None
+    ) -> Iterator[tuple[int, str, bool]]:
+        """
+        Yield matching lines together with the lines surrounding them.
+        Lines preceding a match are kept in a ring buffer of the before size, so
+        memory does not depend on the file size; overlapping windows are merged
+        since every line is yielded at most once. Blocks without matches are
+        skipped apart from refilling the ring buffer with their last lines.
+        :param blocks: Decoded blocks each consisting of whole lines.
+        :type blocks: Iterable[str]
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param before: Number of lines printed before a match.
+        :type before: int
+        :param after: Number of lines printed after a match.
+        :type after: int
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :return: Iterator over line numbers, lines and flags indicating a matching line.
+        :rtype: Iterator[tuple[int, str, bool]]
+        """
+        history: deque[tuple[int, str, bool]] = deque(maxlen=before)
+        remaining_after = 0
+        matches_left = max_count
+        line_number = 1
+        for block in blocks:
+            if matches_left == 0 and remaining_after == 0:
+                return
+            matches = SearchUtils.find_lines(matcher, block, line_number)
+            next_match = next(matches, None)
+            lines = block.split(SearchUtils.LINE_SEPARATOR)
+            if block.endswith(SearchUtils.LINE_SEPARATOR):
+                lines.pop()
+
+            if next_match is None and remaining_after == 0:
+                history.extend((line_number + index, lines[index].rstrip(SearchUtils.CARRIAGE_RETURN), False)
+                               for index in range(max(0, len(lines) - before), len(lines)))
+                line_number += len(lines)
+                continue
+
+            for line in lines:
+                if next_match is not None and next_match[0] == line_number:
+                    if matches_left == 0:
+                        return
+                    yield from history
+                    history.clear()
+                    yield line_number, next_match[1], True
+                    remaining_after = after
+                    if matches_left is not None:
+                        matches_left -= 1
+                    next_match = next(matches, None)
+                elif remaining_after > 0:
+                    yield line_number, line.rstrip(SearchUtils.CARRIAGE_RETURN), False
+                    remaining_after -= 1
+                elif matches_left == 0:
+                    return
+                else:
+                    history.append((line_number, line.rstrip(SearchUtils.CARRIAGE_RETURN), False))
+                line_number += 1
+
+    @staticmethod
+    def iterate_file_context_lines(file: Path,
+                                   matcher: AbstractMatcher,
+                                   before: int,
+                                   after: int,
+                                   max_count: Optional[int] = None
+    ) -> Iterator[tuple[int, str, bool]]:
+        """
+        Stream a text file in constant memory and yield its matching lines with their context.
+        :param file: File path to inspect.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param before: Number of lines printed before a match.
+        :type before: int
+        :param after: Number of lines printed after a match.
+        :type after: int
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :return: Iterator over line numbers, lines and flags indicating a matching line.
+        :rtype: Iterator[tuple[int, str, bool]]
+        """
+        with file.open("rb") as stream:
+            yield from SearchUtils.iterate_context_lines(SearchUtils.iterate_text_blocks(stream),
+                                                         matcher, before, after, max_count)
+
+    @staticmethod
+    def is_binary_file(file: Path) -> bool:
+        """
+        Detect a binary file by a NUL byte in its first block.
+        :param file: File path to inspect.
+        :type file: Path
+        :return: Flag indicating if the file looks binary.
+        :rtype: bool
+        """
+        with file.open("rb") as stream:
+            return SearchUtils.is_binary_stream(stream)
+
+    @staticmethod
+    def is_binary_stream(stream: BufferedReader) -> bool:
+        """
+        Detect binary data by a NUL byte in the first block without consuming it.
+        :param stream: Buffered stream positioned at its start.
+        :type stream: BufferedReader
+        :return: Flag indicating if the stream looks binary.
+        :rtype: bool
+        """
+        return SearchUtils.BINARY_MARKER in stream.peek(SearchUtils.BINARY_CHECK_SIZE)[:SearchUtils.BINARY_CHECK_SIZE]
+
+    @staticmethod
+    def is_binary_stream_matches(stream: BinaryIO, matcher: AbstractMatcher) -> bool:
+        """
+        Determine whether binary data contains the pattern, stopping at the first match.
+        Chunks are searched independently since binary data has no meaningful lines.
+        :param stream: Stream opened in binary mode.
+        :type stream: BinaryIO
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :return: Flag indicating if the pattern occurs in the stream.
+        :rtype: bool
+        """
+        decoder = codecs.getincrementaldecoder(SearchUtils.ENCODING_MODE)(SearchUtils.ERRORS_MODE)
+        while chunk := stream.read(SearchUtils.CHUNK_SIZE):
+            if matcher.find(decoder.decode(chunk), 0) != -1:
+                return True
+        return False
+
+    @staticmethod
+    def search_file(file: Path,
+                    matcher: AbstractMatcher,
+                    max_count: Optional[int] = None,
+                    is_collect_lines: bool = True
+    ) -> tuple[bool, int, list[tuple[int, str]]]:
+        """
+        Collect the search result of a file; safe to run in a worker process.
+        :param file: File path to inspect.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :param is_collect_lines: Flag indicating whether matching lines are returned or only counted.
+        :type is_collect_lines: bool
+        :return: Flag indicating a matching binary file, number of matching lines and the lines themselves.
+        :rtype: tuple[bool, int, list[tuple[int, str]]]
+        """
+        with file.open("rb") as stream:
+            return SearchUtils.search_stream(stream, matcher, max_count, is_collect_lines)
+
+    @staticmethod
+    def search_stream(stream: BufferedReader,
+                      matcher: AbstractMatcher,
+                      max_count: Optional[int] = None,
+                      is_collect_lines: bool = True
+    ) -> tuple[bool, int, list[tuple[int, str]]]:
+        """
+        Collect the search result of a stream.
+        Reading stops as soon as max_count matching lines have been found.
+        :param stream: Buffered stream positioned at its start.
+        :type stream: BufferedReader
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :param is_collect_lines: Flag indicating whether matching lines are returned or only counted.
+        :type is_collect_lines: bool
+        :return: Flag indicating matching binary data, number of matching lines and the lines themselves.
+        :rtype: tuple[bool, int, list[tuple[int, str]]]
+        """
+        if SearchUtils.is_binary_stream(stream):
+            is_binary_match = max_count != 0 and SearchUtils.is_binary_stream_matches(stream, matcher)
+            return is_binary_match, int(is_binary_match), []
+
+        with closing(SearchUtils.iterate_matches(SearchUtils.iterate_text_blocks(stream), matcher)) as matches:
+            limited_matches = islice(matches, max_count)
+            if is_collect_lines:
+                found = list(limited_matches)
+                return False, len(found), found
+            return False, sum(1 for _ in limited_matches), []
+
+    @staticmethod
+    def search_file_with_context(file: Path,
+                                 matcher: AbstractMatcher,
+                                 before: int,
+                                 after: int,
+                                 max_count: Optional[int] = None
+    ) -> tuple[bool, int, list[tuple[int, str, bool]]]:
+        """
+        Collect matching lines of a file with their context; safe to run in a worker process.
+        :param file: File path to inspect.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param before: Number of lines printed before a match.
+        :type before: int
+        :param after: Number of lines printed after a match.
+        :type after: int
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :return: Flag indicating a matching binary file, number of matching lines and the printed lines.
+        :rtype: tuple[bool, int, list[tuple[int, str, bool]]]
+        """
+        with file.open("rb") as stream:
+            return SearchUtils.search_stream_with_context(stream, matcher, before, after, max_count)
+
+    @staticmethod
+    def search_stream_with_context(stream: BufferedReader,
+                                   matcher: AbstractMatcher,
+                                   before: int,
+                                   after: int,
+                                   max_count: Optional[int] = None
+    ) -> tuple[bool, int, list[tuple[int, str, bool]]]:
+        """
+        Collect matching lines of a stream with their context.
+        :param stream: Buffered stream positioned at its start.
+        :type stream: BufferedReader
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param before: Number of lines printed before a match.
+        :type before: int
+        :param after: Number of lines printed after a match.
+        :type after: int
+        :param max_count: Maximum number of matching lines to look for, None for all of them.
+        :type max_count: Optional[int]
+        :return: Flag indicating matching binary data, number of matching lines and the printed lines.
+        :rtype: tuple[bool, int, list[tuple[int, str, bool]]]
+        """
+        if SearchUtils.is_binary_stream(stream):
+            return SearchUtils.search_stream(stream, matcher, max_count, False)
+
+        blocks = SearchUtils.iterate_text_blocks(stream)
+        with closing(SearchUtils.iterate_context_lines(blocks, matcher, before, after, max_count)) as lines:
+            found = list(lines)
+        return False, sum(1 for _, _, is_match in found if is_match), found
+
+    @staticmethod
+    def search_archive(file: Path,
+                       matcher: AbstractMatcher,
+                       max_count: Optional[int],
+                       is_collect_lines: bool,
+                       before: int = 0,
+                       after: int = 0
+    ) -> list[tuple[str, tuple[bool, int, list[tuple]]]]:
+        """
+        Search every member of a compressed file or archive in place; safe to run in a worker process.
+        :param file: Archive path.
+        :type file: Path
+        :param matcher: Matcher of the search patterns.
+        :type matcher: AbstractMatcher
+        :param max_count: Maximum number of matching lines per member, None for all of them.
+        :type max_count: Optional[int]
+        :param is_collect_lines: Flag indicating whether matching lines are returned or only counted.
+        :type is_collect_lines: bool
+        :param before: Number of lines printed before a match.
+        :type before: int
+        :param after: Number of lines printed after a match.
+        :type after: int
+        :return: Member names with their search results.
+        :rtype: list[tuple[str, tuple[bool, int, list[tuple]]]]
+        """
+        results = []
+        for name, stream in ArchiveUtils.iterate_members(file):
+            if is_collect_lines and (before > 0 or after > 0):
+                results.append((name, SearchUtils.search_stream_with_context(stream, matcher, before, after, max_count)))
+            else:
+                results.append((name, SearchUtils.search_stream(stream, matcher, max_count, is_collect_lines)))
+        return results
@@ -0,0 +1,172 @@
+import errno
+import io
+import os
+import tarfile
+from pathlib import Path
+from typing import Iterator
+
+
+class SparseMemberReader(io.RawIOBase):
+    fd: int
+    header: bytes
+    regions: list[tuple[int, int]]
+    position: int
+    region_index: int
+    region_position: int
+
+    def __init__(self, fd: int, header: bytes, regions: list[tuple[int, int]]):
+        """
+        Initialize the reader of the stored content of a sparse tar member.
+        :param fd: Descriptor of the sparse file.
+        :type fd: int
+        :param header: Encoded sparse map preceding the data.
+        :type header: bytes
+        :param regions: Offsets and lengths of the data regions of the file.
+        :type regions: list[tuple[int, int]]
+        :return: None
+        :rtype: None
+        """
+        super().__init__()
+        self.fd = fd
+        self.header = header
+        self.regions = regions
+        self.position = 0
+        self.region_index = 0
+        self.region_position = 0
+
+    def readable(self) -> bool:
+        """
+        Report that the reader supports reading.
+        :return: Always True.
+        :rtype: bool
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Fill the buffer with the sparse map first and then with the data regions one after another.
+        :param buffer: Writable buffer.
+        :type buffer: Buffer
+        :return: Number of bytes read, 0 at the end of the data.
+        :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        if self.position < len(self.header):
+            size = min(len(view), len(self.header) - self.position)
+            view[:size] = self.header[self.position:self.position + size]
+            self.position += size
+            return size
+        while self.region_index < len(self.regions):
+            offset, length = self.regions[self.region_index]
+            if self.region_position < length:
+                size = min(len(view), length - self.region_position)
+                size = os.preadv(self.fd, [view[:size]], offset + self.region_position)
+                if size == 0:
+                    raise OSError(errno.EIO, "Sparse file shrank while it was archived")
+                self.region_position += size
+                return size
+            self.region_index += 1
+            self.region_position = 0
+        return 0
+
+
+class SparseUtils:
+    BLOCK_SIZE = 512
+    MAX_MEMBER_SIZE = 0o77777777777
+
+    @staticmethod
+    def is_sparse(stat_result: os.stat_result) -> bool:
+        """
+        Determine whether a regular file has fewer blocks allocated than its size needs.
+        :param stat_result: Status of the file.
+        :type stat_result: os.stat_result
+        :return: Flag indicating if the file contains holes worth skipping.
+        :rtype: bool
+        """
+        if not hasattr(os, "SEEK_DATA") or not hasattr(stat_result, "st_blocks"):
+            return False
+        return stat_result.st_blocks * SparseUtils.BLOCK_SIZE < stat_result.st_size
+
+    @staticmethod
+    def iterate_data_regions(fd: int, size: int) -> Iterator[tuple[int, int]]:
+        """
+        Find the data regions of a file with SEEK_DATA and SEEK_HOLE, so the holes are never read.
+        A filesystem that cannot report holes yields the whole file as one region.
+        :param fd: Descriptor of the file.
+        :type fd: int
+        :param size: Size of the file.
+        :type size: int
+        :return: Iterator over offsets and lengths of the data regions.
+        :rtype: Iterator[tuple[int, int]]
+        """
+        offset = 0
+        while offset < size:
+            try:
+                start = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as error:
+                if error.errno == errno.ENXIO:
+                    return
+                if error.errno in (errno.EINVAL, errno.EOPNOTSUPP):
+                    yield offset, size - offset
+                    return
+                raise
+            if start >= size:
+                return
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+            yield start, end - start
+            offset = end
+
+    @staticmethod
+    def add_tar_member(tar: tarfile.TarFile, tarinfo: tarfile.TarInfo, path: Path) -> bool:
+        """
+        Store a sparse regular file in the GNU sparse format 1.0, reading only its data regions.
+        The member data starts with the sparse map, so readers unaware of the
+        format extract it under the GNUSparseFile.0 directory instead of
+        producing a broken file under the real name.
+        :param tar: Archive opened for writing in the pax format.
+        :type tar: tarfile.TarFile
+        :param tarinfo: Header of the member as returned by gettarinfo.
+        :type tarinfo: tarfile.TarInfo
+        :param path: Sparse file.
+        :type path: Path
+        :return: Flag indicating if the member was added, False when it is too large for the format.
+        :rtype: bool
+        """
+        with open(path, "rb") as stream:
+            fd = stream.fileno()
+            regions = list(SparseUtils.iterate_data_regions(fd, tarinfo.size))
+            if not regions or regions[-1][0] + regions[-1][1] < tarinfo.size:
+                regions.append((tarinfo.size, 0))
+            header = SparseUtils._encode_map(regions)
+            stored_size = len(header) + sum(length for _, length in regions)
+            if stored_size > SparseUtils.MAX_MEMBER_SIZE:
+                return False
+
+            name = tarinfo.name
+            directory, base_name = os.path.split(name)
+            tarinfo.name = os.path.join(directory, "GNUSparseFile.0", base_name)
+            tarinfo.pax_headers = {
+                "path": tarinfo.name,
+                "GNU.sparse.major": "1",
+                "GNU.sparse.minor": "0",
+                "GNU.sparse.name": name,
+                "GNU.sparse.realsize": str(tarinfo.size),
+            }
+            tarinfo.size = stored_size
+            tar.addfile(tarinfo, io.BufferedReader(SparseMemberReader(fd, header, regions)))
+        return True
+
+    @staticmethod
+    def _encode_map(regions: list[tuple[int, int]]) -> bytes:
+        """
+        Encode the sparse map of the GNU format 1.0, padded to whole tar blocks.
+        :param regions: Offsets and lengths of the data regions.
+        :type regions: list[tuple[int, int]]
+        :return: Encoded map.
+        :rtype: bytes
+        """
+        lines = [str(len(regions))]
+        for offset, length in regions:
+            lines.extend((str(offset), str(length)))
+        header = ("\n".join(lines) + "\n").encode("ascii")
+        return header + bytes(-len(header) % SparseUtils.BLOCK_SIZE)
@@ -0,0 +1,261 @@
+import os
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.utils.copy_utils import CopyUtils
+
+
+class CopyStatistics:
+    copied_files: int
+    copied_bytes: int
+    skipped_files: int
+    skipped_bytes: int
+    linked_files: int
+    failed: int
+
+    def __init__(self):
+        """
+        Initialize empty copy statistics.
+        :return: None
+        :rtype: None
+        """
+        self.copied_files = 0
+        self.copied_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.linked_files = 0
+        self.failed = 0
+
+    def add_file(self, is_copied: bool, size: int):
+        """
+        Account for a file that was either copied or left as is.
+        :param is_copied: Flag indicating if the file was copied rather than skipped.
+        :type is_copied: bool
+        :param size: Size of the file in bytes.
+        :type size: int
+        :return: None
+        :rtype: None
+        """
+        if is_copied:
+            self.copied_files += 1
+            self.copied_bytes += size
+        else:
+            self.skipped_files += 1
+            self.skipped_bytes += size
+
+    def merge(self, other: "CopyStatistics"):
+        """
+        Add the statistics of another copy to these ones.
+        :param other: Statistics to add.
+        :type other: CopyStatistics
+        :return: None
+        :rtype: None
+        """
+        self.copied_files += other.copied_files
+        self.copied_bytes += other.copied_bytes
+        self.skipped_files += other.skipped_files
+        self.skipped_bytes += other.skipped_bytes
+        self.linked_files += other.linked_files
+        self.failed += other.failed
+
+
+class TreeCopier:
+    max_workers: Optional[int]
+    on_error: Optional[Callable[[Path, OSError], None]]
+    copy_function: Callable[[Path, Path], Any]
+    skip_function: Optional[Callable[[Path, Path], bool]]
+    is_preserve_links: bool
+
+    MAX_PENDING_PER_WORKER = 4
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 on_error: Optional[Callable[[Path, OSError], None]] = None,
+                 copy_function: Callable[[Path, Path], Any] = shutil.copy2,
+                 skip_function: Optional[Callable[[Path, Path], bool]] = None,
+                 is_preserve_links: bool = False):
+        """
+        Initialize the parallel tree copier.
+        :param max_workers: Number of copying threads, None for the executor default.
+        :type max_workers: Optional[int]
+        :param on_error: Callback for entries that could not be copied, None to raise the first error.
+        :type on_error: Optional[Callable[[Path, OSError], None]]
+        :param copy_function: Function copying a single file to its destination path.
+        :type copy_function: Callable[[Path, Path], Any]
+        :param skip_function: Predicate telling that a destination file is already up to date, None to copy all.
+        :type skip_function: Optional[Callable[[Path, Path], bool]]
+        :param is_preserve_links: Flag indicating whether files hardlinked in the source are linked in the copy too.
+        :type is_preserve_links: bool
+        :return: None
+        :rtype: None
+        """
+        self.max_workers = max_workers
+        self.on_error = on_error
+        self.copy_function = copy_function
+        self.skip_function = skip_function
+        self.is_preserve_links = is_preserve_links
+
+    def copy(self, src: Path, dest: Path) -> CopyStatistics:
+        """
+        Copy the content of the source directory into the destination directory.
+        The source is walked with scandir and every directory is created before
+        its files are handed to the thread pool, so workers never wait for each
+        other. Existing directories are reused like with dirs_exist_ok, symbolic
+        links are followed, and directory metadata is copied once their content
+        is complete. A failed entry is reported and the rest is still copied.
+        Files accepted by the skip function are checked in the workers as well
+        and are not rewritten. When links are preserved, only the first name of
+        a file with several hardlinks is copied, and the other names are linked
+        to that copy after all the copies are finished.
+        :param src: Source directory.
+        :type src: Path
+        :param dest: Destination directory.
+        :type dest: Path
+        :return: Numbers of copied and skipped files and bytes and of failed entries.
+        :rtype: CopyStatistics
+        """
+        statistics = CopyStatistics()
+        directories = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        max_pending = (self.max_workers or os.cpu_count() or 1) * TreeCopier.MAX_PENDING_PER_WORKER
+        pending: deque[tuple[Path, int, Future]] = deque()
+        first_copies: dict[tuple[int, int], Path] = {}
+        links: list[tuple[Path, Path, Path, int]] = []
+        try:
+            stack = [(src, dest)]
+            while stack:
+                source_directory, destination_directory = stack.pop()
+                try:
+                    with os.scandir(source_directory) as entries:
+                        entries = list(entries)
+                    os.makedirs(destination_directory, exist_ok=True)
+                except OSError as error:
+                    self._report(source_directory, error)
+                    statistics.failed += 1
+                    continue
+                directories.append((source_directory, destination_directory))
+
+                for entry in entries:
+                    source = Path(entry.path)
+                    destination = destination_directory / entry.name
+                    if entry.is_dir():
+                        stack.append((source, destination))
+                        continue
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError as error:
+                        self._report(source, error)
+                        statistics.failed += 1
+                        continue
+                    if self.is_preserve_links and entry_stat.st_nlink > 1 and not entry.is_symlink():
+                        inode = (entry_stat.st_dev, entry_stat.st_ino)
+                        if inode in first_copies:
+                            links.append((source, first_copies[inode], destination, entry_stat.st_size))
+                            continue
+                        first_copies[inode] = destination
+                    future = executor.submit(self._copy_file, source, destination)
+                    pending.append((source, entry_stat.st_size, future))
+                    while len(pending) >= max_pending or (pending and pending[0][2].done()):
+                        self._collect(*pending.popleft(), statistics)
+            while pending:
+                self._collect(*pending.popleft(), statistics)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        for source, target, destination, size in links:
+            self._link_copy(source, target, destination, size, statistics)
+
+        for source_directory, destination_directory in reversed(directories):
+            try:
+                shutil.copystat(source_directory, destination_directory)
+            except OSError as error:
+                self._report(source_directory, error)
+                statistics.failed += 1
+        return statistics
+
+    def _copy_file(self, source: Path, destination: Path) -> bool:
+        """
+        Copy a single file unless the skip function finds its destination up to date.
+        :param source: File to copy.
+        :type source: Path
+        :param destination: Destination file path.
+        :type destination: Path
+        :return: Flag indicating if the file was copied.
+        :rtype: bool
+        """
+        if self.skip_function is not None and self.skip_function(source, destination):
+            return False
+        self.copy_function(source, destination)
+        return True
+
+    def _link_copy(self, source: Path, target: Path, destination: Path, size: int, statistics: CopyStatistics):
+        """
+        Give a file another name in the copy, as the source file has several hardlinks.
+        When the link cannot be created, for example because the first copy
+        failed or the names are on different filesystems, the file is copied.
+        :param source: Source name of the file.
+        :type source: Path
+        :param target: Copy made for the first name of the file.
+        :type target: Path
+        :param destination: Destination path for this name.
+        :type destination: Path
+        :param size: Size of the file in bytes.
+        :type size: int
+        :param statistics: Statistics of the running copy.
+        :type statistics: CopyStatistics
+        :return: None
+        :rtype: None
+        """
+        try:
+            if os.path.exists(destination) and os.path.samefile(target, destination):
+                statistics.add_file(False, size)
+                return
+            try:
+                CopyUtils.link_file(target, destination)
+            except OSError:
+                statistics.add_file(self._copy_file(source, destination), size)
+                return
+        except OSError as error:
+            self._report(source, error)
+            statistics.failed += 1
+            return
+        statistics.linked_files += 1
+
+    def _collect(self, source: Path, size: int, future: Future, statistics: CopyStatistics):
+        """
+        Wait for a copied file and account for it or report its failure.
+        :param source: File that was copied.
+        :type source: Path
+        :param size: Size of the file in bytes.
+        :type size: int
+        :param future: Pending copy.
+        :type future: Future
+        :param statistics: Statistics of the running copy.
+        :type statistics: CopyStatistics
+        :return: None
+        :rtype: None
+        """
+        try:
+            is_copied = future.result()
+        except OSError as error:
+            self._report(source, error)
+            statistics.failed += 1
+            return
+        statistics.add_file(is_copied, size)
+
+    def _report(self, path: Path, error: OSError):
+        """
+        Pass an error to the callback or raise it when there is none.
+        :param path: Entry that could not be copied.
+        :type path: Path
+        :param error: Raised error.
+        :type error: OSError
+        :return: None
+        :rtype: None
+        """
+        if self.on_error is None:
+            raise error
+        self.on_error(path, error)
@@ -0,0 +1,231 @@
+import json
+import os
+import re
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.utils.search_utils import SearchUtils
+
+
+class TrigramIndex:
+    root: Path
+    entries: dict[str, tuple[int, int, frozenset[str]]]
+
+    FILE_NAME = ".grep_index"
+    VERSION = 1
+    TRIGRAM_LENGTH = 3
+    MAX_FILE_SIZE = 64 * 1024 * 1024
+    RACY_WINDOW_NS = 2 * 1000 ** 3
+    CASE_UNSAFE_CHARS = frozenset("iI")
+
+    def __init__(self, root: Path, entries: Optional[dict[str, tuple[int, int, frozenset[str]]]] = None):
+        """
+        Initialize the trigram index of a directory tree.
+        :param root: Directory the index belongs to.
+        :type root: Path
+        :param entries: Size, modification time and trigrams of every indexed file by its relative path.
+        :type entries: Optional[dict[str, tuple[int, int, frozenset[str]]]]
+        :return: None
+        :rtype: None
+        """
+        self.root = root
+        self.entries = entries if entries is not None else {}
+
+    @staticmethod
+    def load(root: Path) -> Optional["TrigramIndex"]:
+        """
+        Read the index stored in the directory.
+        A missing, unreadable or incompatible index is treated as absent.
+        :param root: Directory the index belongs to.
+        :type root: Path
+        :return: Loaded index or None.
+        :rtype: Optional[TrigramIndex]
+        """
+        try:
+            with (root / TrigramIndex.FILE_NAME).open(encoding=SearchUtils.ENCODING_MODE) as stream:
+                content = json.load(stream)
+            if content["version"] != TrigramIndex.VERSION:
+                return None
+            entries = {}
+            for relative_path, (size, mtime, trigrams) in content["files"].items():
+                entries[relative_path] = (size, mtime, TrigramIndex._split_trigrams(trigrams))
+            return TrigramIndex(root, entries)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self):
+        """
+        Write the index next to the tree, replacing the previous one atomically.
+        :return: None
+        :rtype: None
+        """
+        files = {relative_path: [size, mtime, "".join(sorted(trigrams))]
+                 for relative_path, (size, mtime, trigrams) in self.entries.items()}
+        path = self.root / TrigramIndex.FILE_NAME
+        temporary_path = path.with_name(path.name + ".tmp")
+        with temporary_path.open("w", encoding=SearchUtils.ENCODING_MODE) as stream:
+            json.dump({"version": TrigramIndex.VERSION, "files": files}, stream, ensure_ascii=False)
+        os.replace(temporary_path, path)
+
+    def update(self, files: Iterable[Path]) -> tuple[int, int]:
+        """
+        Bring the index in line with the tree, reading only new and changed files.
+        Files modified within the last moments are left out, since a later change
+        with the same size could keep the same modification time; they are searched
+        directly until the next update.
+        :param files: Files currently present in the tree.
+        :type files: Iterable[Path]
+        :return: Number of files read and number of entries removed.
+        :rtype: tuple[int, int]
+        """
+        racy_time = time.time_ns() - TrigramIndex.RACY_WINDOW_NS
+        entries = {}
+        updated = 0
+        for file in files:
+            try:
+                stat = file.stat()
+                if stat.st_size > TrigramIndex.MAX_FILE_SIZE or stat.st_mtime_ns >= racy_time:
+                    continue
+                relative_path = self._get_relative_path(file)
+                entry = self.entries.get(relative_path)
+                if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+                    entry = (stat.st_size, stat.st_mtime_ns, TrigramIndex.get_file_trigrams(file))
+                    updated += 1
+                entries[relative_path] = entry
+            except OSError:
+                continue
+        removed = len(self.entries.keys() - entries.keys())
+        self.entries = entries
+        return updated, removed
+
+    def is_candidate(self, file: Path, queries: list[frozenset[str]]) -> bool:
+        """
+        Determine whether a file may match; stale and unknown files always may.
+        :param file: File below the root of the index.
+        :type file: Path
+        :param queries: Trigrams required by each of the patterns.
+        :type queries: list[frozenset[str]]
+        :return: Flag indicating if the file has to be searched.
+        :rtype: bool
+        """
+        entry = self.entries.get(self._get_relative_path(file))
+        if entry is None:
+            return True
+        try:
+            stat = file.stat()
+        except OSError:
+            return True
+        size, mtime, trigrams = entry
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+            return True
+        return any(query <= trigrams for query in queries)
+
+    @staticmethod
+    def get_file_trigrams(file: Path) -> frozenset[str]:
+        """
+        Collect the case-folded trigrams of a file reading it in chunks.
+        :param file: File to index.
+        :type file: Path
+        :return: Trigrams occurring in the file.
+        :rtype: frozenset[str]
+        """
+        trigrams = set()
+        carry = ""
+        with file.open("rb") as stream, closing(SearchUtils.iterate_text_blocks(stream)) as blocks:
+            for block in blocks:
+                text = carry + block.casefold()
+                trigrams.update(TrigramIndex._get_text_trigrams(text))
+                carry = text[-(TrigramIndex.TRIGRAM_LENGTH - 1):]
+        return frozenset(trigrams)
+
+    @staticmethod
+    def compile_queries(patterns: list[str], ignore_case: bool) -> Optional[list[frozenset[str]]]:
+        """
+        Collect the trigrams every match of each pattern has to contain.
+        :param patterns: Patterns supplied by the user.
+        :type patterns: list[str]
+        :param ignore_case: Flag indicating whether the case is ignored.
+        :type ignore_case: bool
+        :return: Required trigrams per pattern or None when some pattern cannot narrow the search.
+        :rtype: Optional[list[frozenset[str]]]
+        """
+        queries = []
+        for pattern in patterns:
+            trigrams = set()
+            for literal in TrigramIndex._get_required_literals(pattern, ignore_case):
+                trigrams.update(TrigramIndex._get_text_trigrams(literal.casefold()))
+            if len(trigrams) == 0:
+                return None
+            queries.append(frozenset(trigrams))
+        return queries
+
+    @staticmethod
+    def _get_required_literals(pattern: str, ignore_case: bool) -> list[str]:
+        """
+        Extract runs of plain characters found at the top level of the pattern.
+        Every match contains them, anything optional, repeated or alternative ends
+        a run. Without the case, whether requested by the flag or inline, the runs
+        are limited to characters folded by the regular expression engine the
+        same way as by str.casefold. The pattern is parsed by the private parser
+        of the re module, so any failure only disables the narrowing.
+        :param pattern: Pattern supplied by the user.
+        :type pattern: str
+        :param ignore_case: Flag indicating whether the case is ignored.
+        :type ignore_case: bool
+        :return: Plain strings contained in every match.
+        :rtype: list[str]
+        """
+        if SearchUtils.is_literal(pattern) and not ignore_case:
+            return [pattern]
+        try:
+            parsed = re._parser.parse(pattern, re.IGNORECASE if ignore_case else 0)
+            ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+            literals = []
+            run = []
+            for operation, argument in parsed:
+                char = chr(argument) if operation is re._constants.LITERAL else None
+                if char is None or (ignore_case and (not char.isascii() or char in TrigramIndex.CASE_UNSAFE_CHARS)):
+                    literals.append("".join(run))
+                    run = []
+                else:
+                    run.append(char)
+            literals.append("".join(run))
+        except Exception:
+            return []
+        return [literal for literal in literals if len(literal) >= TrigramIndex.TRIGRAM_LENGTH]
+
+    @staticmethod
+    def _get_text_trigrams(text: str) -> set[str]:
+        """
+        Collect the trigrams of a string.
+        :param text: String to split.
+        :type text: str
+        :return: Every substring of three characters.
+        :rtype: set[str]
+        """
+        return {text[index:index + TrigramIndex.TRIGRAM_LENGTH]
+                for index in range(len(text) - TrigramIndex.TRIGRAM_LENGTH + 1)}
+
+    @staticmethod
+    def _split_trigrams(trigrams: str) -> frozenset[str]:
+        """
+        Restore the trigrams stored as one concatenated string.
+        :param trigrams: Concatenated trigrams.
+        :type trigrams: str
+        :return: Set of trigrams.
+        :rtype: frozenset[str]
+        """
+        return frozenset(trigrams[index:index + TrigramIndex.TRIGRAM_LENGTH]
+                         for index in range(0, len(trigrams), TrigramIndex.TRIGRAM_LENGTH))
+
+    def _get_relative_path(self, file: Path) -> str:
+        """
+        Compute the key of a file in the index.
+        :param file: File below the root of the index.
+        :type file: Path
+        :return: Path relative to the root.
+        :rtype: str
+        """
+        return file.relative_to(self.root).as_posix()
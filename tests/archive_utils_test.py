@@ -0,0 +1,56 @@
+import bz2
+import gzip
+import lzma
+import tarfile
+import zipfile
+
+import pytest
+
+from src.utils.archive_utils import ArchiveUtils
+from src.utils.search_utils import SearchUtils
+
+
+@pytest.fixture
+def members(tmp_path):
+    (tmp_path / "first.log").write_text("ok\nerror one\n")
+    (tmp_path / "second.log").write_text("nothing\n")
+    (tmp_path / "blob.bin").write_bytes(b"\x00error")
+    return ["first.log", "second.log", "blob.bin"]
+
+
+@pytest.mark.parametrize("opener, suffix", [[gzip.open, ".gz"], [bz2.open, ".bz2"], [lzma.open, ".xz"]])
+def test_compressed_file_is_its_only_member(tmp_path, opener, suffix):
+    archive = tmp_path / f"app.log{suffix}"
+    with opener(archive, "wb") as stream:
+        stream.write(b"line\n" * 10)
+
+    read = [(name, stream.read()) for name, stream in ArchiveUtils.iterate_members(archive)]
+
+    assert ArchiveUtils.is_archive(archive) and not ArchiveUtils.is_bundle(archive)
+    assert read == [(str(archive), b"line\n" * 10)]
+
+
+@pytest.mark.parametrize("archive_name", ["bundle.tar", "bundle.tar.gz", "bundle.tar.xz", "bundle.zip"])
+def test_archive_members_are_searched_in_place(tmp_path, members, archive_name):
+    archive = tmp_path / archive_name
+    if archive_name.endswith(".zip"):
+        with zipfile.ZipFile(archive, "w") as bundle:
+            for member in members:
+                bundle.write(tmp_path / member, arcname=member)
+    else:
+        with tarfile.open(archive, "w:" + archive_name.rpartition(".tar")[2].lstrip(".")) as bundle:
+            for member in members:
+                bundle.add(tmp_path / member, arcname=member)
+
+    results = SearchUtils.search_archive(archive, SearchUtils.compile_matcher(["error"], False), None, True)
+
+    assert ArchiveUtils.is_bundle(archive)
+    assert results == [
+        (f"{archive}!first.log", (False, 1, [(2, "error one")])),
+        (f"{archive}!second.log", (False, 0, [])),
+        (f"{archive}!blob.bin", (True, 1, [])),
+    ]
+
+
+def test_plain_files_are_not_archives(tmp_path):
+    assert not ArchiveUtils.is_archive(tmp_path / "notes.txt")
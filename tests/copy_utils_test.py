@@ -0,0 +1,150 @@
+import gzip
+import io
+import os
+import shutil
+
+import pytest
+
+from src.utils.copy_utils import CopyUtils
+
+CONTENT = bytes(range(256)) * 4099
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 4096, None])
+def test_send_stream_between_files(tmp_path, chunk_size):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    destination = tmp_path / "destination.bin"
+
+    with source.open("rb") as input_stream, destination.open("wb") as output_stream:
+        copied = CopyUtils.send_stream(input_stream, output_stream, chunk_size)
+
+    assert copied == len(CONTENT)
+    assert destination.read_bytes() == CONTENT
+
+
+def test_send_stream_continues_from_current_position(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    destination = tmp_path / "destination.bin"
+
+    with source.open("rb") as input_stream, destination.open("wb") as output_stream:
+        input_stream.read(10)
+        output_stream.write(b"head")
+        CopyUtils.send_stream(input_stream, output_stream)
+
+    assert destination.read_bytes() == b"head" + CONTENT[10:]
+
+
+def test_send_stream_falls_back_to_buffers_without_descriptors(tmp_path):
+    source = tmp_path / "source.gz"
+    with gzip.open(source, "wb") as stream:
+        stream.write(CONTENT)
+    output_stream = io.BytesIO()
+
+    with gzip.open(source, "rb") as input_stream:
+        copied = CopyUtils.send_stream(input_stream, output_stream, 1024)
+
+    assert copied == len(CONTENT)
+    assert output_stream.getvalue() == CONTENT
+
+
+def refuse(*arguments):
+    raise OSError(22, os.strerror(22))
+
+
+def test_send_stream_falls_back_to_sendfile_when_copy_file_range_is_refused(tmp_path, monkeypatch):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    destination = tmp_path / "destination.bin"
+    calls = []
+
+    def counting_sendfile(*arguments):
+        calls.append(arguments)
+        return sendfile(*arguments)
+
+    sendfile = os.sendfile
+    monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+    monkeypatch.setattr(os, "sendfile", counting_sendfile)
+    with source.open("rb") as input_stream, destination.open("wb") as output_stream:
+        copied = CopyUtils.send_stream(input_stream, output_stream, 1 << 20)
+
+    assert copied == len(CONTENT)
+    assert calls
+    assert destination.read_bytes() == CONTENT
+
+
+def test_send_stream_falls_back_when_kernel_copy_is_refused(tmp_path, monkeypatch):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    destination = tmp_path / "destination.bin"
+
+    monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+    monkeypatch.setattr(os, "sendfile", refuse)
+    with source.open("rb") as input_stream, destination.open("wb") as output_stream:
+        CopyUtils.send_stream(input_stream, output_stream)
+
+    assert destination.read_bytes() == CONTENT
+
+
+def test_copy_file_keeps_permissions(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    source.chmod(0o640)
+    destination = tmp_path / "destination.bin"
+
+    copied = CopyUtils.copy_file(source, destination, 4096)
+
+    assert copied == len(CONTENT)
+    assert destination.read_bytes() == CONTENT
+    assert destination.stat().st_mode & 0o777 == 0o640
+
+
+def test_copy_file_copies_times_with_stat(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"data")
+    os.utime(source, (1_000_000, 1_000_000))
+    destination = tmp_path / "destination.bin"
+
+    CopyUtils.copy_file(source, destination, is_copy_stat=True)
+
+    assert destination.stat().st_mtime == 1_000_000
+
+
+def test_copy_file_rejects_same_file(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"data")
+
+    with pytest.raises(shutil.SameFileError):
+        CopyUtils.copy_file(source, source)
+    assert source.read_bytes() == b"data"
+
+
+def test_is_up_to_date_compares_size_and_mtime(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"data")
+    destination = tmp_path / "destination.bin"
+    assert not CopyUtils.is_up_to_date(source, destination)
+
+    CopyUtils.copy_file(source, destination, is_copy_stat=True)
+    assert CopyUtils.is_up_to_date(source, destination)
+
+    os.utime(destination, (1_000_000, 1_000_000))
+    assert not CopyUtils.is_up_to_date(source, destination)
+    assert CopyUtils.is_up_to_date(source, destination, is_checksum=True)
+
+    destination.write_bytes(b"DATA")
+    assert not CopyUtils.is_up_to_date(source, destination, is_checksum=True)
+
+
+def test_link_file_replaces_existing_destination(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"new")
+    destination = tmp_path / "destination.bin"
+    destination.write_bytes(b"old")
+
+    CopyUtils.link_file(source, destination)
+    CopyUtils.link_file(source, destination)
+
+    assert os.path.samefile(source, destination)
+    assert source.stat().st_nlink == 2
@@ -0,0 +1,24 @@
+import io
+
+import pytest
+
+from src.utils.count_utils import CountUtils
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"one",
+        b"one two\n",
+        b"  leading and trailing  \n\n",
+        b"tabs\tand\x0bvertical\x0cfeeds\r\nend",
+        b"long_word_crossing_chunks another_long_word\n" * 3,
+        "юникод слова\n".encode(),
+    ]
+)
+def test_counts_match_reference(monkeypatch, chunk_size, data):
+    monkeypatch.setattr(CountUtils, "CHUNK_SIZE", chunk_size)
+
+    assert CountUtils.count_stream(io.BytesIO(data)) == (data.count(b"\n"), len(data.split()), len(data))
@@ -0,0 +1,60 @@
+import pytest
+
+from src.utils.directory_walker import DirectoryWalker
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for directory in ["b/inner", "a/inner/deeper", ".hidden/inner"]:
+        (tmp_path / directory).mkdir(parents=True)
+    (tmp_path / "a" / "file").write_text("text")
+    (tmp_path / "b" / "inner" / "file").write_text("text")
+    return tmp_path
+
+
+def _relative(root, walked):
+    return [str(directory.relative_to(root)) for directory, _ in walked]
+
+
+def test_walk_is_ordered_pre_order(tree):
+    walked = list(DirectoryWalker(False, max_workers=4).walk(tree))
+
+    assert _relative(tree, walked) == [".", "a", "a/inner", "a/inner/deeper", "b", "b/inner"]
+    assert [record.name for record in walked[1][1]] == ["file", "inner"]
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        [0, ["."]],
+        [1, [".", ".hidden", "a", "b"]],
+        [2, [".", ".hidden", ".hidden/inner", "a", "a/inner", "b", "b/inner"]],
+    ]
+)
+def test_walk_respects_depth_and_hidden(tree, max_depth, expected):
+    walked = list(DirectoryWalker(True, max_depth).walk(tree))
+
+    assert _relative(tree, walked) == expected
+
+
+def test_walk_reports_unreadable_directory(tmp_path):
+    errors = []
+
+    walked = list(DirectoryWalker(False, on_error=lambda path, _: errors.append(path)).walk(tmp_path / "missing"))
+
+    assert walked == []
+    assert errors == [tmp_path / "missing"]
+
+
+def test_walk_scans_ahead_within_window(tmp_path):
+    for index in range(50):
+        (tmp_path / f"directory{index:02}").mkdir()
+    walker = DirectoryWalker(False, max_workers=1)
+    scanned = []
+    scan = walker._scan
+    walker._scan = lambda directory: scanned.append(directory) or scan(directory)
+
+    for yielded, _ in enumerate(walker.walk(tmp_path), start=1):
+        assert len(scanned) - yielded <= DirectoryWalker.MAX_PENDING_PER_WORKER
+
+    assert len(scanned) == 51
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils.file_follower import FileFollower, InotifyWatcher, PollingWatcher
+
+TIMEOUT = 5.0
+
+
+class Collector:
+    def __init__(self):
+        self.data = b""
+        self.lock = threading.Lock()
+
+    def __call__(self, chunk: bytes):
+        with self.lock:
+            self.data += chunk
+
+    def wait_for(self, expected: bytes):
+        deadline = time.monotonic() + TIMEOUT
+        while time.monotonic() < deadline:
+            with self.lock:
+                if self.data == expected:
+                    return
+            time.sleep(0.01)
+        assert self.data == expected
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def follower_factory(request):
+    followers = []
+
+    def factory(path, offset) -> tuple[FileFollower, Collector]:
+        watcher = InotifyWatcher.create(path) if request.param == "inotify" else PollingWatcher()
+        if watcher is None:
+            pytest.skip("inotify is not available")
+        follower = FileFollower(path, offset, watcher)
+        collector = Collector()
+        thread = threading.Thread(target=follower.follow, args=(collector,))
+        thread.start()
+        followers.append((follower, thread))
+        return follower, collector
+
+    yield factory
+    for follower, thread in followers:
+        follower.stop()
+        thread.join(TIMEOUT)
+
+
+def test_follower_outputs_only_appended_bytes(tmp_path, follower_factory):
+    file = tmp_path / "app.log"
+    file.write_bytes(b"old line\n")
+    _, collector = follower_factory(file, file.stat().st_size)
+
+    with file.open("ab") as stream:
+        stream.write(b"new line\n")
+    collector.wait_for(b"new line\n")
+
+    with file.open("ab") as stream:
+        stream.write(b"another\n")
+    collector.wait_for(b"new line\nanother\n")
+
+
+def test_follower_reopens_rotated_file(tmp_path, follower_factory):
+    file = tmp_path / "app.log"
+    file.write_bytes(b"")
+    _, collector = follower_factory(file, 0)
+
+    with file.open("ab") as stream:
+        stream.write(b"before rotation\n")
+    collector.wait_for(b"before rotation\n")
+
+    os.rename(file, tmp_path / "app.log.1")
+    file.write_bytes(b"after rotation\n")
+    collector.wait_for(b"before rotation\nafter rotation\n")
+
+
+def test_follower_restarts_truncated_file(tmp_path, follower_factory):
+    file = tmp_path / "app.log"
+    file.write_bytes(b"a long first line\n")
+    _, collector = follower_factory(file, file.stat().st_size)
+
+    with file.open("r+b") as stream:
+        stream.truncate(0)
+    time.sleep(0.2)
+    with file.open("ab") as stream:
+        stream.write(b"x\n")
+    collector.wait_for(b"x\n")
+
+
+def test_polling_interval_adapts():
+    watcher = PollingWatcher()
+    watcher.interval = PollingWatcher.MAX_INTERVAL / 4
+    watcher.wait(True)
+
+    assert watcher.interval == PollingWatcher.MIN_INTERVAL
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from src.utils.file_walker import FileWalker
+from src.utils.gitignore_rules import GitignoreRules
+
+
+def _create_tree(root: Path, files: list[str]):
+    for file in files:
+        path = root / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+
+
+def _walk(root: Path, walker: FileWalker) -> list[str]:
+    return sorted(path.relative_to(root).as_posix() for path in walker.walk(root))
+
+
+@pytest.mark.parametrize(
+    "include, exclude, exclude_dirs, expected",
+    [
+        [[], [], [], ["a.py", "b.txt", "build/c.py", "src/d.py", "src/e.log"]],
+        [["*.py"], [], [], ["a.py", "build/c.py", "src/d.py"]],
+        [[], ["*.log", "b.*"], [], ["a.py", "build/c.py", "src/d.py"]],
+        [[], [], ["build"], ["a.py", "b.txt", "src/d.py", "src/e.log"]],
+        [["*.py", "*.log"], [], ["bu*"], ["a.py", "src/d.py", "src/e.log"]],
+    ]
+)
+def test_walk_applies_globs(tmp_path, include, exclude, exclude_dirs, expected):
+    _create_tree(tmp_path, ["a.py", "b.txt", "build/c.py", "src/d.py", "src/e.log"])
+
+    assert _walk(tmp_path, FileWalker(include, exclude, exclude_dirs, False)) == expected
+
+
+def test_excluded_directory_is_never_entered(tmp_path, monkeypatch):
+    _create_tree(tmp_path, ["keep/a.txt", "skip/b.txt"])
+    entered = []
+    original_scandir = __import__("os").scandir
+
+    def recording_scandir(path):
+        entered.append(Path(path).name)
+        return original_scandir(path)
+
+    monkeypatch.setattr("src.utils.file_walker.os.scandir", recording_scandir)
+
+    assert _walk(tmp_path, FileWalker([], [], ["skip"], False)) == ["keep/a.txt"]
+    assert "skip" not in entered
+
+
+def test_walk_honours_nested_gitignore(tmp_path):
+    _create_tree(tmp_path, ["main.py", "debug.log", "keep.log", "out/bin.o",
+                            "pkg/mod.py", "pkg/gen.py", "pkg/out/x.py", ".git/HEAD"])
+    (tmp_path / ".gitignore").write_text("# comment\n*.log\n!keep.log\n/out/\n")
+    (tmp_path / "pkg" / ".gitignore").write_text("gen.py\n")
+
+    assert _walk(tmp_path, FileWalker([], [], [], True)) == [
+        ".gitignore", "keep.log", "main.py", "pkg/.gitignore", "pkg/mod.py", "pkg/out/x.py"
+    ]
+
+
+@pytest.mark.parametrize(
+    "line, path, is_directory, expected",
+    [
+        ["*.log", "a/b/c.log", False, True],
+        ["/build", "build", True, True],
+        ["/build", "a/build", True, None],
+        ["docs/", "docs", False, None],
+        ["docs/", "docs", True, True],
+        ["a/**/z", "a/b/c/z", False, True],
+        ["a/**/z", "a/z", False, True],
+        ["file[0-9].txt", "file7.txt", False, True],
+    ]
+)
+def test_gitignore_rule_matching(line, path, is_directory, expected):
+    rules = GitignoreRules("/root", [line])
+
+    assert rules.match(f"/root/{path}", path.rsplit("/", 1)[-1], is_directory) == expected
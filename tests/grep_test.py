@@ -0,0 +1,79 @@
+import gzip
+import os
+
+import pytest
+
+from src.commands.command_grep import CommandGrep
+from src.common.context import Context
+from src.common.lexer import Lexer
+from src.common.logger import Logger
+from src.common.parser import Parser
+from src.utils.file_walker import FileWalker
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Context()
+
+
+def _grep(arguments: str, context: Context) -> None:
+    CommandGrep(Parser(), Logger()).execute(Lexer().lexing(f"grep {arguments}"), context)
+
+
+def test_index_does_not_hide_compressed_files_when_decompressing(tmp_path, capsys, context):
+    with gzip.open(tmp_path / "log.gz", "wt") as stream:
+        stream.write("hello needle\n")
+    (tmp_path / "plain.txt").write_text("nothing here\n")
+    for file in tmp_path.iterdir():
+        os.utime(file, (1000, 1000))
+
+    _grep(f"-I build {tmp_path}", context)
+    capsys.readouterr()
+    _grep(f"-r -z -j 1 -p needle {tmp_path}", context)
+
+    assert capsys.readouterr().out.splitlines() == [f"file: {tmp_path / 'log.gz'}", "1: hello needle"]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for directory in ["a/inner", "b"]:
+        (tmp_path / directory).mkdir(parents=True)
+    for number, name in enumerate(["a/one.txt", "a/inner/two.txt", "b/three.txt", "four.txt", "five.txt"]):
+        (tmp_path / name).write_text(f"line\nhit {number}\nline\nhit again\n")
+    (tmp_path / "b" / "miss.txt").write_text("nothing\n")
+    (tmp_path / "broken.gz").write_bytes(b"not gzip data")
+    return tmp_path
+
+
+@pytest.mark.parametrize("options", ["", "-c", "-l", "-C 1", "-m 1", "-z"])
+def test_pool_output_matches_sequential_output(tree, capsys, context, options):
+    _grep(f"-r -j 1 {options} -p hit {tree}", context)
+    sequential = capsys.readouterr().out
+    _grep(f"-r -j 4 {options} -p hit {tree}", context)
+    pooled = capsys.readouterr().out
+
+    assert sequential != ""
+    assert pooled == sequential
+
+
+def test_pool_output_is_ordered_like_the_walk(tree, capsys, context):
+    walked = [str(file) for file in FileWalker([], [], [], False).walk(tree) if "hit" in file.read_text(errors="ignore")]
+
+    _grep(f"-r -j 4 -l -p hit {tree}", context)
+
+    assert capsys.readouterr().out.splitlines() == walked
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_quiet_search_prints_nothing(tree, capsys, context, jobs):
+    _grep(f"-r -j {jobs} -q -p hit {tree}", context)
+
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_unreadable_archive_is_reported(tree, capsys, context, jobs):
+    _grep(f"-r -j {jobs} -z -l -p hit {tree}", context)
+
+    assert f"{tree / 'broken.gz'}" in capsys.readouterr().out
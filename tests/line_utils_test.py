@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+from src.utils.line_utils import LineUtils
+
+TEXTS = [
+    b"",
+    b"\n",
+    b"one",
+    b"one\n",
+    b"one\ntwo\nthree\n",
+    b"one\ntwo\nthree",
+    b"\n\n\n",
+    b"".join(b"line %d\n" % num for num in range(100)),
+]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64 * 1024])
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("count", [0, 1, 2, 10, 1000])
+def test_head_and_tail_match_splitlines(monkeypatch, block_size, text, count):
+    monkeypatch.setattr(LineUtils, "BLOCK_SIZE", block_size)
+    lines = text.splitlines(keepends=True)
+
+    head = b"".join(LineUtils.iterate_head_chunks(io.BytesIO(text), count))
+    stream = io.BytesIO(text)
+    stream.seek(LineUtils.find_tail_offset(stream, count))
+
+    assert head == b"".join(lines[:count])
+    assert stream.read() == b"".join(lines[len(lines) - min(count, len(lines)):])
+
+
+def test_tail_reads_only_the_end(tmp_path, monkeypatch):
+    monkeypatch.setattr(LineUtils, "BLOCK_SIZE", 16)
+    file = tmp_path / "big.log"
+    file.write_bytes(b"x" * 10 ** 6 + b"\nlast line\n")
+    read_sizes = []
+
+    with file.open("rb") as stream:
+        original_read = stream.read
+        stream.read = lambda size=-1: read_sizes.append(size) or original_read(size)
+        offset = LineUtils.find_tail_offset(stream, 1)
+
+    assert offset == 10 ** 6 + 1
+    assert sum(read_sizes) <= 32
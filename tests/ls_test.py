@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from src.commands.command_ls import CommandLS
+from src.common.context import Context
+from src.common.lexer import Lexer
+from src.common.logger import Logger
+from src.common.ownership_cache import OwnershipCache
+from src.common.parser import Parser
+from src.utils.path_utils import PathUtils
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Context()
+
+
+def test_scan_directory_skips_hidden_entries(tmp_path):
+    (tmp_path / "file.txt").write_text("text")
+    (tmp_path / ".hidden").write_text("text")
+    (tmp_path / "directory").mkdir()
+
+    visible = {record.name for record in PathUtils.scan_directory(tmp_path, False)}
+    everything = {record.name for record in PathUtils.scan_directory(tmp_path, True)}
+
+    assert visible == {"file.txt", "directory"}
+    assert everything == {"file.txt", "directory", ".hidden"}
+
+
+def test_scan_directory_records_match_lstat(tmp_path):
+    (tmp_path / "file.txt").write_bytes(b"x" * 123)
+    (tmp_path / "directory").mkdir()
+
+    records = {record.name: record for record in PathUtils.scan_directory(tmp_path, True)}
+
+    assert records["file.txt"].size == 123
+    assert records["file.txt"].is_file and not records["file.txt"].is_dir
+    assert records["directory"].is_dir
+    assert records["file.txt"].get_filemode() == PathUtils.get_filemode(tmp_path / "file.txt")
+
+
+def test_long_listing_aligns_columns(tmp_path):
+    (tmp_path / "small").write_bytes(b"x")
+    (tmp_path / "large").write_bytes(b"x" * 12345)
+
+    output = CommandLS._get_ls_output_with_l_option(PathUtils.scan_directory(tmp_path, True), OwnershipCache())
+    lines = output.splitlines()
+
+    assert len(lines) == 2
+    assert len({len(line) for line in lines}) == 1
+
+
+def test_long_listing_of_empty_directory(tmp_path):
+    assert CommandLS._get_ls_output_with_l_option(PathUtils.scan_directory(tmp_path, True), OwnershipCache()) == ""
+
+
+def test_stream_listing_writes_every_chunk(tmp_path, capsys, monkeypatch, context):
+    for number in range(5):
+        (tmp_path / f"file_{number}").write_text("text")
+    monkeypatch.setattr(CommandLS, "STREAM_CHUNK_SIZE", 2)
+
+    CommandLS(Parser(), Logger()).execute(Lexer().lexing(f"ls -s {tmp_path}"), context)
+
+    output = capsys.readouterr().out
+    assert sorted(output.split()) == sorted(["📄file_0", "📄file_1", "📄file_2", "📄file_3", "📄file_4"])
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ["-S", ["📄large", "📄medium", "📄small"]],
+        ["-t", ["📄small", "📄medium", "📄large"]],
+        ["-T 2", ["📄large", "📄medium"]],
+        ["-t --top 1", ["📄small"]],
+    ]
+)
+def test_sorted_and_top_listing(tmp_path, capsys, context, options, expected):
+    for age, (name, size) in enumerate([("small", 1), ("medium", 10), ("large", 100)]):
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        os.utime(path, (1000 - age, 1000 - age))
+
+    CommandLS(Parser(), Logger()).execute(Lexer().lexing(f"ls {options} {tmp_path}"), context)
+
+    assert capsys.readouterr().out.split() == expected
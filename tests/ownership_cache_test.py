@@ -0,0 +1,40 @@
+from src.common.ownership_cache import OwnershipCache
+from src.utils.path_utils import PathUtils
+
+
+def _count_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(PathUtils, "get_owner_name", lambda uid: calls.append(uid) or f"user{uid}")
+    return calls
+
+
+def test_owner_is_resolved_once(monkeypatch):
+    calls = _count_calls(monkeypatch)
+    cache = OwnershipCache()
+
+    assert [cache.get_owner(1) for _ in range(3)] == ["user1"] * 3
+    assert calls == [1]
+
+
+def test_least_recently_used_owner_is_evicted(monkeypatch):
+    calls = _count_calls(monkeypatch)
+    cache = OwnershipCache(max_size=2)
+
+    cache.get_owner(1)
+    cache.get_owner(2)
+    cache.get_owner(1)
+    cache.get_owner(3)
+    cache.get_owner(1)
+    cache.get_owner(2)
+
+    assert calls == [1, 2, 3, 2]
+
+
+def test_expired_owner_is_resolved_again(monkeypatch):
+    calls = _count_calls(monkeypatch)
+    cache = OwnershipCache(ttl=0)
+
+    cache.get_owner(1)
+    cache.get_owner(1)
+
+    assert calls == [1, 1]
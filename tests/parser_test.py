@@ -169,3 +169,12 @@ def test_parser_invalid_arguments_raise(input_line, exc):
     with pytest.raises(exc):
         argument_line = lexer.lexing(input_line)
         parser.parse(OPTIONS, argument_line)
+
+
+def test_parser_keeps_every_repeated_argument():
+    lexer = Lexer()
+    parser = Parser()
+    parsed_arguments = parser.parse(OPTIONS, lexer.lexing("test -e .txt -n 10 --extension .md -e .pdf"))
+    assert parsed_arguments.get_options_arguments_sequence() == [
+        ("-e", ".txt"), ("-n", "10"), ("--extension", ".md"), ("-e", ".pdf")
+    ]
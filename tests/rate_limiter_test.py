@@ -0,0 +1,67 @@
+import io
+import threading
+import time
+
+from src.utils.copy_utils import CopyUtils
+from src.utils.rate_limiter import RateLimiter, ThrottledStream
+
+RATE = 400 * 1024
+SIZE = 200 * 1024
+
+
+def _measure(action) -> float:
+    start = time.monotonic()
+    action()
+    return time.monotonic() - start
+
+
+def test_limiter_caps_chunk_size():
+    limiter = RateLimiter(RATE)
+
+    assert limiter.get_chunk_size(8 * 1024 * 1024) == int(RATE * RateLimiter.BURST_SECONDS)
+    assert limiter.get_chunk_size(100) == 100
+    assert RateLimiter(10).get_chunk_size(1 << 20) == RateLimiter.MIN_CAPACITY
+
+
+def test_limiter_holds_rate_across_threads():
+    limiter = RateLimiter(RATE)
+
+    def transfer():
+        for _ in range(10):
+            limiter.consume(SIZE // 20)
+
+    def run():
+        threads = [threading.Thread(target=transfer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    elapsed = _measure(run)
+
+    assert elapsed >= (SIZE - limiter.capacity) / RATE * 0.9
+
+
+def test_copy_file_is_throttled(tmp_path):
+    source, destination = tmp_path / "source.bin", tmp_path / "destination.bin"
+    source.write_bytes(bytes(range(256)) * (SIZE // 256))
+    limiter = RateLimiter(RATE)
+
+    elapsed = _measure(lambda: CopyUtils.copy_file(source, destination, limiter=limiter))
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert elapsed >= (SIZE - limiter.capacity) / RATE * 0.9
+
+
+def test_throttled_stream_writes_and_reads_everything():
+    output = io.BytesIO()
+    limiter = RateLimiter(RATE)
+    stream = ThrottledStream(output, limiter)
+
+    assert stream.write(b"x" * SIZE) == SIZE
+    assert stream.tell() == SIZE
+    stream.seek(0)
+
+    reader = io.BufferedReader(stream)
+    assert reader.read() == b"x" * SIZE
+    assert output.getvalue() == b"x" * SIZE
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from src.utils.resumable_copier import ResumableCopier
+
+CHUNK_SIZE = 4096
+CONTENT = bytes(range(256)) * 100
+
+
+class InterruptedCopier(ResumableCopier):
+    def __init__(self, chunks_before_failure: int, is_checksum: bool = False):
+        super().__init__(CHUNK_SIZE, is_checksum)
+        self.chunks_before_failure = chunks_before_failure
+        self.copied_offsets = []
+
+    def _copy_chunk(self, source_fd, destination_fd, offset, end, buffer):
+        if len(self.copied_offsets) == self.chunks_before_failure:
+            raise KeyboardInterrupt
+        self.copied_offsets.append(offset)
+        return super()._copy_chunk(source_fd, destination_fd, offset, end, buffer)
+
+
+def _interrupt(source, destination, chunks, is_checksum=False):
+    with pytest.raises(KeyboardInterrupt):
+        InterruptedCopier(chunks, is_checksum).copy(source, destination)
+
+
+@pytest.mark.parametrize("is_checksum", [False, True])
+def test_copy_resumes_after_interruption(tmp_path, is_checksum):
+    source, destination = tmp_path / "source.bin", tmp_path / "destination.bin"
+    source.write_bytes(CONTENT)
+    _interrupt(source, destination, 3, is_checksum)
+    assert ResumableCopier.get_checkpoint_path(destination).exists()
+
+    copier = InterruptedCopier(-1, is_checksum)
+    copied = copier.copy(source, destination)
+
+    assert copier.copied_offsets[0] == 3 * CHUNK_SIZE
+    assert copied == len(CONTENT) - 3 * CHUNK_SIZE
+    assert destination.read_bytes() == CONTENT
+    assert not ResumableCopier.get_checkpoint_path(destination).exists()
+
+
+def test_copy_recopies_corrupted_chunks_with_checksums(tmp_path):
+    source, destination = tmp_path / "source.bin", tmp_path / "destination.bin"
+    source.write_bytes(CONTENT)
+    _interrupt(source, destination, 3, is_checksum=True)
+    with destination.open("r+b") as stream:
+        stream.seek(CHUNK_SIZE + 10)
+        stream.write(b"corrupted")
+
+    copier = InterruptedCopier(-1, is_checksum=True)
+    copier.copy(source, destination)
+
+    assert copier.copied_offsets[0] == CHUNK_SIZE
+    assert 0 not in copier.copied_offsets
+    assert destination.read_bytes() == CONTENT
+
+
+def test_copy_starts_over_when_source_changed(tmp_path):
+    source, destination = tmp_path / "source.bin", tmp_path / "destination.bin"
+    source.write_bytes(CONTENT)
+    _interrupt(source, destination, 3)
+    source.write_bytes(CONTENT[::-1])
+    os.utime(source, ns=(1, 1))
+
+    copier = InterruptedCopier(-1)
+    copier.copy(source, destination)
+
+    assert copier.copied_offsets[0] == 0
+    assert destination.read_bytes() == CONTENT[::-1]
+
+
+def test_copy_ignores_incomplete_checkpoint_line(tmp_path):
+    source, destination = tmp_path / "source.bin", tmp_path / "destination.bin"
+    source.write_bytes(CONTENT)
+    _interrupt(source, destination, 2)
+    with ResumableCopier.get_checkpoint_path(destination).open("a") as checkpoint:
+        checkpoint.write(str(2 * CHUNK_SIZE))
+
+    copier = InterruptedCopier(-1)
+    copier.copy(source, destination)
+
+    assert copier.copied_offsets[0] == 2 * CHUNK_SIZE
+    assert destination.read_bytes() == CONTENT
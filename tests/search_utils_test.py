@@ -0,0 +1,176 @@
+import io
+import re
+
+import pytest
+
+from src.exception.command_exception import InvalidArgumentsException
+from src.utils.matchers import LiteralMatcher, MultiLiteralMatcher, RegexMatcher
+from src.utils.search_utils import SearchUtils
+
+
+def _splitlines_search(pattern: str, text: str, flags: int = 0) -> list[tuple[int, str]]:
+    return [(num + 1, line) for num, line in enumerate(text.splitlines()) if re.search(pattern, line, flags)]
+
+
+@pytest.mark.parametrize(
+    "pattern, text",
+    [
+        ["error", "ok\nerror one\nok\nerror two\n"],
+        ["error", "error at start\nok\nerror without newline"],
+        ["^$", "first\n\nthird\n\n"],
+        ["^", "a\nb\n"],
+        ["x+", "xx x\nyyy\nx"],
+        ["e", ""],
+        ["[0-9]{3}", "a123\r\nb12\r\nc456\r\n"],
+        ["ошибка", "всё хорошо\nошибка\nещё одна ошибка\n"],
+        ["\\s", "aaa\nbbb\nfoo bar\n"],
+        ["[^x]", "x\nxx\nxax\nx"],
+        ["a\\nb", "a\nb\nab\n"],
+        ["\\W$", "a;\r\nb\r\n"],
+    ]
+)
+def test_find_lines_matches_line_by_line_search(pattern, text):
+    found = list(SearchUtils.find_lines(SearchUtils.compile_matcher([pattern], False), text))
+
+    assert found == _splitlines_search(pattern, text)
+
+
+def test_find_lines_ignores_case():
+    text = "Ошибка\nошибка\nОК\n"
+
+    found = list(SearchUtils.find_lines(SearchUtils.compile_matcher(["ОШИБКА"], True), text))
+
+    assert found == _splitlines_search("ОШИБКА", text, re.IGNORECASE)
+
+
+def test_find_lines_starts_from_given_line_number():
+    found = list(SearchUtils.find_lines(SearchUtils.compile_matcher(["b"], False), "a\nb\n", 10))
+
+    assert found == [(11, "b")]
+
+
+@pytest.mark.parametrize(
+    "patterns, ignore_case, matcher_type",
+    [
+        [["error"], False, LiteralMatcher],
+        [["error", "warning"], False, MultiLiteralMatcher],
+        [["error"], True, RegexMatcher],
+        [["err.r"], False, RegexMatcher],
+        [["error", "warn(ing)?"], False, RegexMatcher],
+    ]
+)
+def test_matcher_selection(patterns, ignore_case, matcher_type):
+    assert type(SearchUtils.compile_matcher(patterns, ignore_case)) is matcher_type
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["error", "warning"],
+        ["error", "warn(ing)?"],
+        ["a", "ab", "abc", "b"],
+    ]
+)
+def test_several_patterns_match_any_of_them(patterns):
+    text = "error here\nnothing\nwarning there\nab\nwarn\nb\n"
+    regex = "|".join(f"(?:{pattern})" for pattern in patterns)
+
+    found = list(SearchUtils.find_lines(SearchUtils.compile_matcher(patterns, False), text))
+
+    assert found == _splitlines_search(regex, text)
+
+
+def test_invalid_pattern_raises():
+    with pytest.raises(InvalidArgumentsException):
+        SearchUtils.compile_matcher(["valid", "("], False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_streamed_matches_do_not_depend_on_chunk_size(tmp_path, monkeypatch, chunk_size):
+    text = "ошибка один\nok\n\nошибка два без перевода строки"
+    file = tmp_path / "log.txt"
+    file.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(SearchUtils, "CHUNK_SIZE", chunk_size)
+
+    found = list(SearchUtils.iterate_file_matches(file, SearchUtils.compile_matcher(["ошибка"], False)))
+
+    assert found == _splitlines_search("ошибка", text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_text_blocks_carry_lines_and_characters_across_chunks(monkeypatch, chunk_size):
+    text = "ы\n" + "длинная строка " * 5 + "\nыы\nхвост без перевода строки ы"
+    monkeypatch.setattr(SearchUtils, "CHUNK_SIZE", chunk_size)
+
+    blocks = list(SearchUtils.iterate_text_blocks(io.BytesIO(text.encode("utf-8"))))
+
+    assert "".join(blocks) == text
+    assert all(block.endswith("\n") for block in blocks[:-1])
+    assert blocks[-1] == "хвост без перевода строки ы"
+
+
+def test_binary_file_is_reported_without_lines(tmp_path):
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"\x00\x01needle\x02")
+
+    assert SearchUtils.search_file(file, SearchUtils.compile_matcher(["needle"], False)) == (True, 1, [])
+    assert SearchUtils.search_file(file, SearchUtils.compile_matcher(["absent"], False)) == (False, 0, [])
+
+
+def test_several_literals_can_search_the_same_buffer_again():
+    matcher = SearchUtils.compile_matcher(["error", "warning"], False)
+    text = "error\nok\nwarning\n"
+
+    assert list(SearchUtils.find_lines(matcher, text)) == list(SearchUtils.find_lines(matcher, text))
+
+
+@pytest.mark.parametrize(
+    "max_count, is_collect_lines, expected",
+    [
+        [None, True, (False, 3, [(1, "hit"), (3, "hit"), (4, "hit")])],
+        [None, False, (False, 3, [])],
+        [2, True, (False, 2, [(1, "hit"), (3, "hit")])],
+        [1, False, (False, 1, [])],
+        [0, True, (False, 0, [])],
+    ]
+)
+def test_search_file_stops_after_max_count(tmp_path, max_count, is_collect_lines, expected):
+    file = tmp_path / "log.txt"
+    file.write_text("hit\nmiss\nhit\nhit\n")
+
+    matcher = SearchUtils.compile_matcher(["hit"], False)
+
+    assert SearchUtils.search_file(file, matcher, max_count, is_collect_lines) == expected
+
+
+def _reference_context(pattern: str, text: str, before: int, after: int) -> list[tuple[int, str, bool]]:
+    lines = text.splitlines()
+    matching = {num for num, line in enumerate(lines) if re.search(pattern, line)}
+    printed = {near for num in matching for near in range(num - before, num + after + 1) if 0 <= near < len(lines)}
+    return [(num + 1, lines[num], num in matching) for num in sorted(printed)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+@pytest.mark.parametrize(
+    "before, after",
+    [[0, 0], [1, 0], [0, 2], [2, 2], [10, 10]]
+)
+def test_context_lines_match_reference(tmp_path, monkeypatch, chunk_size, before, after):
+    text = "".join(f"{'hit' if num in (3, 5, 12, 20) else 'line'} {num}\n" for num in range(1, 22))
+    file = tmp_path / "log.txt"
+    file.write_text(text)
+    monkeypatch.setattr(SearchUtils, "CHUNK_SIZE", chunk_size)
+
+    found = list(SearchUtils.iterate_file_context_lines(file, SearchUtils.compile_matcher(["hit"], False),
+                                                        before, after))
+
+    assert found == _reference_context("hit", text, before, after)
+
+
+def test_context_stops_after_max_count_with_trailing_context(tmp_path):
+    file = tmp_path / "log.txt"
+    file.write_text("a\nhit\nb\nc\nhit\nd\n")
+
+    found = SearchUtils.search_file_with_context(file, SearchUtils.compile_matcher(["hit"], False), 1, 1, 1)
+
+    assert found == (False, 1, [(1, "a", False), (2, "hit", True), (3, "b", False)])
@@ -0,0 +1,81 @@
+import os
+import tarfile
+
+import pytest
+
+from src.utils.copy_utils import CopyUtils
+from src.utils.path_utils import PathUtils
+from src.utils.sparse_utils import SparseUtils
+
+SIZE = 16 * 1024 * 1024
+DATA = {4 * 1024 * 1024: b"A" * 70000, 12 * 1024 * 1024: b"B" * 5000}
+
+
+@pytest.fixture
+def sparse_file(tmp_path):
+    path = tmp_path / "image.bin"
+    with path.open("wb") as stream:
+        stream.truncate(SIZE)
+        for offset, data in DATA.items():
+            stream.seek(offset)
+            stream.write(data)
+    if not SparseUtils.is_sparse(os.stat(path)):
+        pytest.skip("filesystem does not support holes")
+    return path
+
+
+def test_iterate_data_regions_skips_holes(sparse_file):
+    with sparse_file.open("rb") as stream:
+        regions = list(SparseUtils.iterate_data_regions(stream.fileno(), SIZE))
+
+    assert sum(length for _, length in regions) < SIZE // 4
+    for offset, data in DATA.items():
+        assert any(start <= offset and offset + len(data) <= start + length for start, length in regions)
+
+
+def test_copy_file_keeps_holes(sparse_file, tmp_path):
+    destination = tmp_path / "copy.bin"
+
+    copied = CopyUtils.copy_file(sparse_file, destination, 1024 * 1024)
+
+    assert copied < SIZE // 4
+    assert destination.read_bytes() == sparse_file.read_bytes()
+    assert os.stat(destination).st_blocks <= os.stat(sparse_file).st_blocks
+
+
+def test_copy_file_keeps_holes_without_copy_file_range(sparse_file, tmp_path, monkeypatch):
+    destination = tmp_path / "copy.bin"
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+    CopyUtils.copy_file(sparse_file, destination, 4096)
+
+    assert destination.read_bytes() == sparse_file.read_bytes()
+    assert os.stat(destination).st_blocks <= os.stat(sparse_file).st_blocks
+
+
+def test_tar_archive_stores_sparse_members(sparse_file, tmp_path):
+    archive = tmp_path / "archive.tar.gz"
+
+    PathUtils.create_tar_archive(str(archive), [sparse_file])
+
+    with tarfile.open(archive) as tar:
+        member = tar.getmember(sparse_file.name)
+        assert member.issparse()
+        assert member.size == SIZE
+        assert tar.extractfile(member).read() == sparse_file.read_bytes()
+        tar.extractall(tmp_path / "extracted", filter="data")
+    extracted = tmp_path / "extracted" / sparse_file.name
+    assert extracted.read_bytes() == sparse_file.read_bytes()
+    assert SparseUtils.is_sparse(os.stat(extracted))
+
+
+def test_tar_archive_adds_directories_recursively(tmp_path):
+    (tmp_path / "tree" / "sub").mkdir(parents=True)
+    (tmp_path / "tree" / "sub" / "file.txt").write_bytes(b"content")
+    archive = tmp_path / "archive.tar.gz"
+
+    PathUtils.create_tar_archive(str(archive), [tmp_path / "tree"])
+
+    with tarfile.open(archive) as tar:
+        assert tar.getnames() == ["tree", "tree/sub", "tree/sub/file.txt"]
+        assert tar.extractfile("tree/sub/file.txt").read() == b"content"
@@ -0,0 +1,101 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.utils.tree_copier import TreeCopier
+
+
+def _create_tree(root: Path, files: dict[str, bytes]):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+def _read_tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+FILES = {f"d{num % 3}/sub{num % 2}/file{num}.txt": f"content {num}".encode() for num in range(40)}
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_reproduces_tree(tmp_path, max_workers):
+    _create_tree(tmp_path / "src", FILES | {"top.txt": b"top"})
+    (tmp_path / "src" / "empty").mkdir()
+
+    result = TreeCopier(max_workers).copy(tmp_path / "src", tmp_path / "dest")
+
+    assert (result.copied_files, result.failed) == (41, 0)
+    assert result.copied_bytes == sum(len(content) for content in FILES.values()) + 3
+    assert _read_tree(tmp_path / "dest") == _read_tree(tmp_path / "src")
+    assert (tmp_path / "dest" / "empty").is_dir()
+
+
+def test_copy_into_existing_directory_keeps_other_files(tmp_path):
+    _create_tree(tmp_path / "src", {"a/b.txt": b"new"})
+    _create_tree(tmp_path / "dest", {"a/b.txt": b"old", "a/other.txt": b"kept"})
+
+    TreeCopier(2).copy(tmp_path / "src", tmp_path / "dest")
+
+    assert _read_tree(tmp_path / "dest") == {"a/b.txt": b"new", "a/other.txt": b"kept"}
+
+
+def test_copy_reports_failed_files_and_continues(tmp_path):
+    _create_tree(tmp_path / "src", {"ok1.txt": b"1", "ok2.txt": b"2"})
+    os.symlink(tmp_path / "missing", tmp_path / "src" / "dangling")
+    errors = []
+
+    result = TreeCopier(2, lambda path, error: errors.append(path.name)).copy(tmp_path / "src", tmp_path / "dest")
+
+    assert (result.copied_files, result.failed) == (2, 1)
+    assert errors == ["dangling"]
+    assert _read_tree(tmp_path / "dest") == {"ok1.txt": b"1", "ok2.txt": b"2"}
+
+
+def test_copy_raises_without_error_callback(tmp_path):
+    _create_tree(tmp_path / "src", {"ok.txt": b"1"})
+    os.symlink(tmp_path / "missing", tmp_path / "src" / "dangling")
+
+    with pytest.raises(OSError):
+        TreeCopier(1).copy(tmp_path / "src", tmp_path / "dest")
+
+
+def test_copy_skips_files_accepted_by_skip_function(tmp_path):
+    _create_tree(tmp_path / "src", {"same.txt": b"same", "a/changed.txt": b"changed"})
+    _create_tree(tmp_path / "dest", {"same.txt": b"SAME", "a/changed.txt": b"old"})
+
+    def is_same(source: Path, destination: Path) -> bool:
+        return source.name == "same.txt"
+
+    result = TreeCopier(2, skip_function=is_same).copy(tmp_path / "src", tmp_path / "dest")
+
+    assert (result.copied_files, result.copied_bytes) == (1, 7)
+    assert (result.skipped_files, result.skipped_bytes) == (1, 4)
+    assert _read_tree(tmp_path / "dest") == {"same.txt": b"SAME", "a/changed.txt": b"changed"}
+
+
+def test_copy_preserves_hardlinks(tmp_path):
+    _create_tree(tmp_path / "src", {"a/original.txt": b"shared", "single.txt": b"single"})
+    os.link(tmp_path / "src" / "a" / "original.txt", tmp_path / "src" / "link.txt")
+    copier = TreeCopier(2, copy_function=shutil.copy2, is_preserve_links=True)
+
+    result = copier.copy(tmp_path / "src", tmp_path / "dest")
+
+    assert (result.copied_files, result.linked_files, result.failed) == (2, 1, 0)
+    original, link = tmp_path / "dest" / "a" / "original.txt", tmp_path / "dest" / "link.txt"
+    assert original.read_bytes() == b"shared"
+    assert os.path.samefile(original, link)
+    assert not os.path.samefile(original, tmp_path / "src" / "link.txt")
+
+
+def test_copy_duplicates_hardlinks_by_default(tmp_path):
+    _create_tree(tmp_path / "src", {"original.txt": b"shared"})
+    os.link(tmp_path / "src" / "original.txt", tmp_path / "src" / "link.txt")
+
+    result = TreeCopier(2).copy(tmp_path / "src", tmp_path / "dest")
+
+    assert (result.copied_files, result.linked_files) == (2, 0)
+    assert not os.path.samefile(tmp_path / "dest" / "original.txt", tmp_path / "dest" / "link.txt")
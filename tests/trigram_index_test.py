@@ -0,0 +1,118 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from src.utils.trigram_index import TrigramIndex
+
+
+def _age(file: Path, seconds: int = 60):
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1000 ** 3))
+
+
+def _create_tree(root: Path, files: dict[str, str]) -> list[Path]:
+    paths = []
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        _age(path)
+        paths.append(path)
+    return paths
+
+
+def _candidates(index: TrigramIndex, files: list[Path], patterns: list[str], ignore_case: bool = False) -> list[str]:
+    queries = TrigramIndex.compile_queries(patterns, ignore_case)
+    return sorted(file.name for file in files if index.is_candidate(file, queries))
+
+
+@pytest.fixture
+def tree(tmp_path) -> list[Path]:
+    return _create_tree(tmp_path, {
+        "a.log": "connection timeout\nretry\n",
+        "b.log": "Segfault in worker\n",
+        "sub/c.log": "ошибка соединения\n",
+    })
+
+
+@pytest.mark.parametrize(
+    "patterns, ignore_case, expected",
+    [
+        [["timeout"], False, ["a.log"]],
+        [["segfault"], True, ["b.log"]],
+        [["timeout", "worker"], False, ["a.log", "b.log"]],
+        [["conn.*out"], False, ["a.log"]],
+        [["ошибка"], False, ["c.log"]],
+        [["absent"], False, []],
+    ]
+)
+def test_index_narrows_candidates(tmp_path, tree, patterns, ignore_case, expected):
+    index = TrigramIndex(tmp_path)
+    index.update(tree)
+
+    assert _candidates(index, tree, patterns, ignore_case) == expected
+
+
+@pytest.mark.parametrize(
+    "patterns, ignore_case",
+    [
+        [["ab"], False],
+        [["time|retry"], False],
+        [["(timeout)?"], False],
+        [["timeout", "x"], False],
+        [["iii"], True],
+        [["(?i)iii"], False],
+        [["(?i)ääää"], False],
+    ]
+)
+def test_patterns_without_required_trigrams_do_not_narrow(patterns, ignore_case):
+    assert TrigramIndex.compile_queries(patterns, ignore_case) is None
+
+
+def test_changed_and_new_files_are_always_candidates(tmp_path, tree):
+    index = TrigramIndex(tmp_path)
+    index.update(tree)
+    tree[1].write_text("now with a timeout too\n")
+    new_file = _create_tree(tmp_path, {"d.log": "timeout\n"})[0]
+
+    assert _candidates(index, tree + [new_file], ["timeout"]) == ["a.log", "b.log", "d.log"]
+
+
+def test_update_reads_only_changed_files_and_survives_reload(tmp_path, tree):
+    index = TrigramIndex(tmp_path)
+    assert index.update(tree) == (3, 0)
+    index.save()
+
+    tree[0].write_text("rewritten\n")
+    _age(tree[0], 30)
+    tree[2].unlink()
+    loaded = TrigramIndex.load(tmp_path)
+
+    assert loaded.update(tree[:2]) == (1, 1)
+    assert _candidates(loaded, tree[:2], ["rewritten"]) == ["a.log"]
+
+
+def test_recently_modified_files_are_not_indexed(tmp_path):
+    file = tmp_path / "fresh.log"
+    file.write_text("timeout\n")
+    index = TrigramIndex(tmp_path)
+    index.update([file])
+
+    assert index.entries == {}
+
+
+def test_corrupted_index_is_ignored(tmp_path):
+    (tmp_path / TrigramIndex.FILE_NAME).write_text("{not json")
+
+    assert TrigramIndex.load(tmp_path) is None
+
+
+def test_parser_failure_disables_narrowing(monkeypatch):
+    def parse(pattern, flags):
+        raise AttributeError("parse")
+
+    monkeypatch.setattr(re._parser, "parse", parse)
+
+    assert TrigramIndex.compile_queries(["time.*out"], False) is None